@@ -0,0 +1,160 @@
+import sys, os
+
+path = os.path.join(os.path.dirname(__file__), "..", "source")
+
+sys.path.insert(
+    0, path
+)  # add 'classicist' library path for importing into the benchmarks
+
+import classicist
+
+# Ensure that the library was imported from the expected path
+assert classicist.__file__ == os.path.join(path, classicist.__name__, "__init__.py")
+
+import json
+import platform
+import timeit
+
+import pytest
+
+# The file holding the baseline overhead ratios, keyed by Python major.minor version
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# The default fraction by which a ratio may exceed its baseline before the benchmark fails
+THRESHOLD = 0.5
+
+# The Python major.minor version, as the overhead ratios vary between Python versions
+VERSION = ".".join(platform.python_version_tuple()[:2])
+
+# The overhead ratios measured during the current session
+results: dict[str, float] = {}
+
+
+def pytest_addoption(parser: pytest.Parser):
+    """Adds the command line options used to update baselines and set the threshold."""
+
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Record the measured overhead ratios as the new baselines.",
+    )
+
+    parser.addoption(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help="The fraction by which a ratio may exceed its baseline (default: 0.5).",
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
+    """Writes the measured overhead ratios to the baselines file if requested."""
+
+    if not (session.config.getoption("--update-baselines") and results):
+        return
+
+    baselines: dict[str, dict[str, float]] = load()
+
+    baselines.setdefault(VERSION, {}).update(results)
+
+    with open(BASELINES, "w") as file:
+        json.dump(
+            {
+                version: dict(sorted(ratios.items()))
+                for version, ratios in baselines.items()
+            },
+            file,
+            indent=2,
+            sort_keys=True,
+        )
+        file.write("\n")
+
+
+def load() -> dict[str, dict[str, float]]:
+    """Loads the baseline overhead ratios from the baselines file, if it exists."""
+
+    if not os.path.exists(BASELINES):
+        return {}
+
+    with open(BASELINES, "r") as file:
+        return json.load(file)
+
+
+def elapsed(statement: str, namespace: dict, number: int) -> float:
+    """Measures the time taken to run the statement, in nanoseconds per run."""
+
+    return timeit.timeit(statement, globals=namespace, number=number) / number * 1e9
+
+
+@pytest.fixture
+def measure() -> callable:
+    """Provides the measure function, which measures the time taken to run a statement,
+    in nanoseconds per run, for benchmarks that need to interleave their measurements
+    with other work, such as toggling a library-wide switch."""
+
+    return elapsed
+
+
+@pytest.fixture
+def compare(request: pytest.FixtureRequest) -> callable:
+    """Provides the compare function, which compares a measured ratio against its
+    recorded baseline ratio, failing if the ratio exceeds it beyond the threshold, or
+    records the ratio as the new baseline if the baselines are being updated."""
+
+    update: bool = request.config.getoption("--update-baselines")
+
+    threshold: float = request.config.getoption("--threshold")
+
+    baselines: dict[str, float] = load().get(VERSION, {})
+
+    def compare(name: str, ratio: float) -> float:
+        ratio = results[name] = round(ratio, 3)
+
+        if update is True:
+            return ratio
+
+        if (recorded := baselines.get(name)) is None:
+            pytest.skip(
+                f"No baseline has been recorded for '{name}' on Python {VERSION}!"
+            )
+
+        assert ratio <= recorded * (1 + threshold), (
+            f"The '{name}' benchmark regressed, with a ratio of {ratio:.3f} exceeding"
+            f" its baseline ratio of {recorded:.3f} by more than {threshold:.0%}!"
+        )
+
+        return ratio
+
+    return compare
+
+
+@pytest.fixture
+def benchmark(compare: callable) -> callable:
+    """Provides the benchmark function, which measures the cost of a statement relative
+    to its undecorated baseline statement, and compares the ratio of the two against
+    the recorded baseline ratio via the compare function; ratios rather than absolute
+    timings are compared, so that the recorded baselines remain meaningful on machines
+    faster or slower than the one that recorded them."""
+
+    def benchmark(
+        name: str,
+        statement: str,
+        baseline: str,
+        namespace: dict,
+        number: int = 10_000,
+        repeat: int = 7,
+    ) -> float:
+        # Interleave the measurements, so that any change in the machine's load while
+        # the benchmark runs affects the statement and its baseline equally, and take
+        # the fastest of the runs of each as the least noisy measurement of their cost
+        statements: list[float] = []
+        baselined: list[float] = []
+
+        for attempt in range(repeat):
+            statements.append(elapsed(statement, namespace, number))
+            baselined.append(elapsed(baseline, namespace, number))
+
+        return compare(name, min(statements) / min(baselined))
+
+    return benchmark
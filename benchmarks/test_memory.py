@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from classicist import Model, Null
+
+import dataclasses
+import gc
+import tracemalloc
+
+
+class Person(Model):
+    """Sample compact model class, with its fields stored in __slots__."""
+
+    name: str
+    age: int
+    email: str
+    related: Person
+
+
+@dataclasses.dataclass
+class PersonData(object):
+    """Sample dataclass equivalent to the model class above."""
+
+    name: str = None
+    age: int = None
+    email: str = None
+    related: PersonData = None
+
+
+def allocated(factory: callable, count: int = 10_000) -> int:
+    """Measures the memory allocated to hold the given number of instances, in bytes."""
+
+    gc.collect()
+
+    tracemalloc.start()
+
+    try:
+        instances = [factory(index) for index in range(count)]
+
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(instances) == count
+
+    return size
+
+
+def test_model_memory(compare: callable):
+    """Benchmark the memory used by model instances, relative to the memory used by the
+    instances of an equivalent dataclass."""
+
+    models = allocated(lambda index: Person(name="A", age=index))
+    plain = allocated(lambda index: PersonData(name="A", age=index))
+
+    # Model instances are compact, and their unset fields are null-safe
+    assert Person(name="A").related.name is Null
+
+    assert models < plain
+
+    compare("model.memory", models / plain)
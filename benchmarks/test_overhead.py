@@ -0,0 +1,356 @@
+from classicist import (
+    alias,
+    aliased,
+    annotation,
+    cachedclassproperty,
+    classproperty,
+    composable,
+    deprecated,
+    hybridmethod,
+    memoize,
+    Null,
+    nullpath,
+    nullsafe,
+    runtimer,
+    shadowproof,
+    tracing,
+)
+from classicist.types import dumps
+
+import json
+
+
+def function(value: int) -> int:
+    """Sample undecorated function, used as the baseline for the decorated functions."""
+
+    return value
+
+
+@runtimer
+def timed(value: int) -> int:
+    return value
+
+
+@alias("aliasing", scope=globals())
+def aliased_function(value: int) -> int:
+    return value
+
+
+# The alias is injected into the module's globals by @alias, so is bound explicitly here
+aliasing: callable = globals()["aliasing"]
+
+
+@deprecated(reason="benchmarking")
+def deprecated_function(value: int) -> int:
+    return value
+
+
+@annotation(purpose="benchmarking")
+def annotated_function(value: int) -> int:
+    return value
+
+
+@memoize
+def memoized(value: int) -> int:
+    return value
+
+
+class closuremethod(object):
+    """Sample descriptor which binds its method via a closure created on each access, as
+    the @hybridmethod decorator previously did, used as a baseline for hybrid methods.
+    """
+
+    def __init__(self, function: callable):
+        self.function = function
+
+    def __get__(self, instance: object, owner: type) -> callable:
+        if instance is None:
+            return lambda *args, **kwargs: self.function(owner, *args, **kwargs)
+        else:
+            return lambda *args, **kwargs: self.function(instance, *args, **kwargs)
+
+
+class Thing(object):
+    greeting: str = "hello"
+
+    @closuremethod
+    def closure(self) -> object:
+        return self
+
+    @hybridmethod
+    def hybrid(self) -> object:
+        return self
+
+    @classmethod
+    def klass(cls) -> object:
+        return cls
+
+    def method(self) -> object:
+        return self
+
+    @classproperty
+    def property(cls) -> str:
+        return "hello"
+
+    @cachedclassproperty
+    def cached(cls) -> str:
+        return "hello"
+
+
+class Node(object):
+    def __init__(self, child: object = None):
+        self.child = child
+
+
+namespace: dict = {
+    "function": function,
+    "timed": timed,
+    "aliasing": aliasing,
+    "deprecated_function": deprecated_function,
+    "annotated_function": annotated_function,
+    "memoized": memoized,
+    "Thing": Thing,
+    "thing": Thing(),
+    "Null": Null,
+    "node": Node(Node(Node(Node()))),
+}
+
+namespace["proxy"] = nullsafe(namespace["node"])
+
+
+def test_runtimer_call_overhead(benchmark: callable):
+    """Benchmark the cost of calling a @runtimer decorated function."""
+
+    benchmark("runtimer.call", "timed(1)", "function(1)", namespace)
+
+
+def test_alias_call_overhead(benchmark: callable):
+    """Benchmark the cost of calling a function via an alias created by @alias."""
+
+    benchmark("alias.call", "aliasing(1)", "function(1)", namespace)
+
+
+def test_deprecated_call_overhead(benchmark: callable):
+    """Benchmark the cost of calling a @deprecated decorated function."""
+
+    benchmark("deprecated.call", "deprecated_function(1)", "function(1)", namespace)
+
+
+def test_annotation_call_overhead(benchmark: callable):
+    """Benchmark the cost of calling an @annotation decorated function."""
+
+    benchmark("annotation.call", "annotated_function(1)", "function(1)", namespace)
+
+
+def test_memoize_hit_overhead(benchmark: callable):
+    """Benchmark the cost of calling a @memoize decorated function with a cached result,
+    relative to calling the undecorated function."""
+
+    memoized(1)
+
+    benchmark("memoize.hit", "memoized(1)", "function(1)", namespace)
+
+
+def test_hybridmethod_class_access_overhead(benchmark: callable):
+    """Benchmark the cost of calling a @hybridmethod via its class, relative to calling
+    a regular class method."""
+
+    benchmark("hybridmethod.class", "Thing.hybrid()", "Thing.klass()", namespace)
+
+
+def test_hybridmethod_instance_access_overhead(benchmark: callable):
+    """Benchmark the cost of calling a @hybridmethod via an instance, relative to calling
+    a regular instance method."""
+
+    benchmark("hybridmethod.instance", "thing.hybrid()", "thing.method()", namespace)
+
+
+def test_hybridmethod_closure_overhead(benchmark: callable):
+    """Benchmark the cost of calling a @hybridmethod via an instance, relative to calling
+    a method bound via a closure created on each access, which the hybrid method avoids
+    by returning regular bound methods."""
+
+    benchmark("hybridmethod.closure", "thing.hybrid()", "thing.closure()", namespace)
+
+
+def test_tracing_disabled_overhead(compare: callable, measure: callable):
+    """Benchmark the cost of accessing a @hybridmethod with tracing disabled, relative to
+    accessing it with tracing enabled while debug logging is disabled, where each access
+    pays for a call to `logger.debug()`, which the regenerated descriptor method avoids;
+    as tracing is toggled globally, the measurements are interleaved here directly."""
+
+    untraced: list[float] = []
+    traced: list[float] = []
+
+    try:
+        for attempt in range(7):
+            untraced.append(measure("Thing.hybrid", namespace, 10_000))
+
+            tracing.enable()
+
+            traced.append(measure("Thing.hybrid", namespace, 10_000))
+
+            tracing.disable()
+    finally:
+        tracing.disable()
+
+    ratio = compare("tracing.disabled", min(untraced) / min(traced))
+
+    assert ratio < 1
+
+
+def test_classproperty_access_overhead(benchmark: callable):
+    """Benchmark the cost of accessing a @classproperty, relative to accessing a plain
+    class attribute."""
+
+    benchmark("classproperty.access", "Thing.property", "Thing.greeting", namespace)
+
+
+def test_cachedclassproperty_access_overhead(benchmark: callable):
+    """Benchmark the cost of accessing a @cachedclassproperty after its value has been
+    cached, relative to accessing a plain class attribute."""
+
+    Thing.cached
+
+    benchmark("cachedclassproperty.access", "Thing.cached", "Thing.greeting", namespace)
+
+
+def test_null_chain_overhead(benchmark: callable):
+    """Benchmark the cost of navigating a chain of attributes on the Null singleton,
+    relative to navigating a chain of the same length on regular objects."""
+
+    benchmark("null.chain", "Null.a.b.c.d", "node.child.child.child.child", namespace)
+
+
+def test_nullsafe_chain_overhead(benchmark: callable):
+    """Benchmark the cost of navigating a chain of attributes through a nullsafe proxy,
+    relative to navigating the same chain on the underlying objects."""
+
+    benchmark(
+        "nullsafe.chain",
+        "proxy.child.child.child.child",
+        "node.child.child.child.child",
+        namespace,
+    )
+
+
+def test_nullpath_extract_overhead(benchmark: callable):
+    """Benchmark the cost of extracting a nested value from many records via a compiled
+    null-safe path, relative to extracting it via a plain list comprehension."""
+
+    namespace = {
+        "path": nullpath("child.child.value[0]"),
+        "records": [Node(Node(Node())) for count in range(100)],
+    }
+
+    for record in namespace["records"]:
+        record.child.child.value = [1]
+
+    benchmark(
+        "nullpath.extract",
+        "path.extract(records)",
+        "[record.child.child.value[0] for record in records]",
+        namespace,
+        number=1_000,
+    )
+
+
+def test_nulljson_dumps_overhead(benchmark: callable):
+    """Benchmark the cost of encoding records holding Null values via the incremental
+    NullEncoder, relative to encoding them via the standard library's JSON encoder with
+    a default hook for the Null values, as was needed before the encoder existed."""
+
+    namespace = {
+        "dumps": dumps,
+        "json": json,
+        "hook": lambda value: None if value is Null else str(value),
+        "records": [{"id": count, "name": "N", "parent": Null} for count in range(100)],
+    }
+
+    benchmark(
+        "nulljson.dumps",
+        "dumps(records)",
+        "json.dumps(records, default=hook)",
+        namespace,
+        number=100,
+    )
+
+
+def create_hierarchy(metaclass: type) -> type:
+    """Creates a class hierarchy, five levels deep with fifty attributes at each level,
+    using the given metaclass, and returns the most derived class in the hierarchy."""
+
+    base: type = metaclass("Level", (object,), {f"base{i}": i for i in range(50)})
+
+    for level in range(5):
+        base = metaclass(
+            f"Level{level}", (base,), {f"level{level}_{i}": i for i in range(50)}
+        )
+
+    return base
+
+
+# The attributes of the classes created during the class creation benchmarks
+attributes: dict[str, int] = {f"attribute{i}": i for i in range(50)}
+
+
+def test_aliased_class_creation_overhead(benchmark: callable):
+    """Benchmark the cost of creating a class with the aliased metaclass, relative to
+    creating a class with the default metaclass."""
+
+    namespace = {
+        "aliased": aliased,
+        "base": create_hierarchy(aliased),
+        "plain": create_hierarchy(type),
+        "attributes": attributes,
+    }
+
+    benchmark(
+        "aliased.create",
+        "aliased('Thing', (base,), dict(attributes))",
+        "type('Thing', (plain,), dict(attributes))",
+        namespace,
+        number=1_000,
+    )
+
+
+def test_shadowproof_class_creation_overhead(benchmark: callable):
+    """Benchmark the cost of creating a class with the shadowproof metaclass, relative
+    to creating a class with the default metaclass."""
+
+    namespace = {
+        "shadowproof": shadowproof,
+        "base": create_hierarchy(shadowproof),
+        "plain": create_hierarchy(type),
+        "attributes": attributes,
+    }
+
+    benchmark(
+        "shadowproof.create",
+        "shadowproof('Thing', (base,), dict(attributes))",
+        "type('Thing', (plain,), dict(attributes))",
+        namespace,
+        number=1_000,
+    )
+
+
+def test_composed_class_creation_overhead(benchmark: callable):
+    """Benchmark the cost of creating a class with the combined aliased and shadowproof
+    metaclass, relative to creating a class with the default metaclass."""
+
+    metaclass = composable(aliased, shadowproof)
+
+    namespace = {
+        "metaclass": metaclass,
+        "base": create_hierarchy(metaclass),
+        "plain": create_hierarchy(type),
+        "attributes": attributes,
+    }
+
+    benchmark(
+        "composed.create",
+        "metaclass('Thing', (base,), dict(attributes))",
+        "type('Thing', (plain,), dict(attributes))",
+        namespace,
+        number=1_000,
+    )
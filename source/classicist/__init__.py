@@ -1,57 +1,76 @@
-# Decorators
-from classicist.decorators import (
-    # @alias decorator
-    alias,
-    # @annotation decorator
-    annotation,
-    # @classproperty decorator
-    classproperty,
-    # @deprecated decorator
-    deprecated,
-    # @hybridmethod decorator
-    hybridmethod,
-    # @nocache decorator
-    nocache,
-    # @runtimer decorator
-    runtimer,
-)
-
-# Decorator Helper Methods
-from classicist.decorators import (
-    # @alias decorator helper methods
-    is_aliased,
-    aliases,
-    # @annotation decorator helper methods
-    annotate,
-    annotations,
-    # @deprecated decorator helper methods
-    is_deprecated,
-    # @runtimer decorator helper methods
-    runtime,
-    has_runtimer,
-)
-
-# Decorator Related Classes
-from classicist.decorators import (
-    Runtimer,
-)
-
-# Meta Classes
-from classicist.metaclasses import (
-    aliased,
-    shadowproof,
-)
-
-# Exception Classes
-from classicist.exceptions import (
-    AliasError,
-    AnnotationError,
-    AttributeShadowingError,
-)
+from classicist.lazy import exports
 
-from classicist.types import (
-    NullType,
-    Null,
+# The library's classes, functions and decorators are imported lazily, when they are
+# first accessed, so that importing the package, such as to use `Null` or a particular
+# decorator, does not import every module in the library and their dependencies too
+__getattr__, __dir__ = exports(
+    __name__,
+    {
+        # Decorators
+        # @alias decorator
+        "alias": "classicist.decorators",
+        # @annotation decorator
+        "annotation": "classicist.decorators",
+        # @classproperty decorator
+        "classproperty": "classicist.decorators",
+        # @cachedclassproperty decorator
+        "cachedclassproperty": "classicist.decorators",
+        # @deprecated decorator
+        "deprecated": "classicist.decorators",
+        # @hybridmethod decorator
+        "hybridmethod": "classicist.decorators",
+        # @nocache decorator
+        "nocache": "classicist.decorators",
+        # @memoize decorator
+        "memoize": "classicist.decorators",
+        # @runtimer decorator
+        "runtimer": "classicist.decorators",
+        # Decorator Helper Methods
+        # @alias decorator helper methods
+        "is_aliased": "classicist.decorators",
+        "aliases": "classicist.decorators",
+        # @annotation decorator helper methods
+        "annotate": "classicist.decorators",
+        "annotations": "classicist.decorators",
+        # @deprecated decorator helper methods
+        "is_deprecated": "classicist.decorators",
+        # @nocache decorator helper methods
+        "is_nocache": "classicist.decorators",
+        # @memoize decorator helper methods
+        "memoizer": "classicist.decorators",
+        "is_memoized": "classicist.decorators",
+        # @runtimer decorator helper methods
+        "runtime": "classicist.decorators",
+        "has_runtimer": "classicist.decorators",
+        # Decorator Related Classes
+        "Runtimer": "classicist.decorators",
+        "Memoizer": "classicist.decorators",
+        "Cache": "classicist.decorators",
+        "Clock": "classicist.decorators",
+        "ManualClock": "classicist.decorators",
+        "Histogram": "classicist.decorators",
+        # Meta Classes
+        "aliased": "classicist.metaclasses",
+        "shadowproof": "classicist.metaclasses",
+        "composable": "classicist.metaclasses",
+        "model": "classicist.metaclasses",
+        "Model": "classicist.metaclasses",
+        # Exception Classes
+        "AliasError": "classicist.exceptions",
+        "AnnotationError": "classicist.exceptions",
+        "AttributeShadowingError": "classicist.exceptions",
+        "CacheError": "classicist.exceptions",
+        # Types
+        "NullType": "classicist.types",
+        "Null": "classicist.types",
+        "NullPath": "classicist.types",
+        "nullpath": "classicist.types",
+        "NullSafe": "classicist.types",
+        "nullsafe": "classicist.types",
+        "NullEncoder": "classicist.types",
+        # Instrumentation
+        "tracing": "classicist.logging",
+    },
 )
 
 __all__ = [
@@ -61,26 +80,47 @@ __all__ = [
     "annotation",
     "annotations",
     "classproperty",
+    "cachedclassproperty",
     "deprecated",
     "hybridmethod",
     "nocache",
+    "memoize",
     "runtimer",
     # Decorator Helper Methods
     "is_aliased",
     "aliases",
     "is_deprecated",
+    "is_nocache",
+    "memoizer",
+    "is_memoized",
     "runtime",
     "has_runtimer",
     # Decorator Related Classes
     "Runtimer",
+    "Memoizer",
+    "Cache",
+    "Clock",
+    "ManualClock",
+    "Histogram",
     # Meta Classes
     "aliased",
     "shadowproof",
+    "composable",
+    "model",
+    "Model",
     # Exception Classes
     "AliasError",
     "AnnotationError",
     "AttributeShadowingError",
+    "CacheError",
     # Types
     "NullType",
     "Null",
+    "NullPath",
+    "nullpath",
+    "NullSafe",
+    "nullsafe",
+    "NullEncoder",
+    # Instrumentation
+    "tracing",
 ]
@@ -1,10 +1,37 @@
-from classicist.decorators.aliased import alias, aliases, is_aliased
-from classicist.decorators.annotation import annotate, annotation, annotations
-from classicist.decorators.classproperty import classproperty
-from classicist.decorators.deprecated import deprecated, is_deprecated
-from classicist.decorators.hybridmethod import hybridmethod
-from classicist.decorators.nocache import nocache
-from classicist.decorators.runtimer import Runtimer, runtimer, runtime, has_runtimer
+from classicist.lazy import exports
+
+# The decorators are imported lazily, when first accessed, so that importing the package
+# does not import every decorator module and the standard library modules they depend on
+__getattr__, __dir__ = exports(
+    __name__,
+    {
+        "alias": "classicist.decorators.aliased",
+        "aliases": "classicist.decorators.aliased",
+        "is_aliased": "classicist.decorators.aliased",
+        "annotate": "classicist.decorators.annotation",
+        "annotation": "classicist.decorators.annotation",
+        "annotations": "classicist.decorators.annotation",
+        "classproperty": "classicist.decorators.classproperty",
+        "cachedclassproperty": "classicist.decorators.classproperty",
+        "deprecated": "classicist.decorators.deprecated",
+        "is_deprecated": "classicist.decorators.deprecated",
+        "hybridmethod": "classicist.decorators.hybridmethod",
+        "nocache": "classicist.decorators.nocache",
+        "is_nocache": "classicist.decorators.nocache",
+        "Memoizer": "classicist.decorators.memoize",
+        "Cache": "classicist.decorators.memoize",
+        "memoize": "classicist.decorators.memoize",
+        "memoizer": "classicist.decorators.memoize",
+        "is_memoized": "classicist.decorators.memoize",
+        "Runtimer": "classicist.decorators.runtimer",
+        "runtimer": "classicist.decorators.runtimer",
+        "runtime": "classicist.decorators.runtimer",
+        "has_runtimer": "classicist.decorators.runtimer",
+        "Clock": "classicist.decorators.runtimer",
+        "ManualClock": "classicist.decorators.runtimer",
+        "Histogram": "classicist.decorators.runtimer",
+    },
+)
 
 __all__ = [
     "alias",
@@ -13,13 +40,23 @@ __all__ = [
     "annotation",
     "annotations",
     "classproperty",
+    "cachedclassproperty",
     "deprecated",
     "is_aliased",
     "is_deprecated",
     "hybridmethod",
     "nocache",
+    "is_nocache",
+    "memoize",
+    "memoizer",
+    "is_memoized",
+    "Memoizer",
+    "Cache",
     "Runtimer",
     "runtimer",
     "runtime",
     "has_runtimer",
+    "Clock",
+    "ManualClock",
+    "Histogram",
 ]
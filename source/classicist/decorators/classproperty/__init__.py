@@ -1,5 +1,11 @@
+from __future__ import annotations
+
+from classicist.inspector import locate, reference
 from classicist.logging import logger
 
+import threading
+import weakref
+
 logger = logger.getChild(__name__)
 
 
@@ -28,6 +34,13 @@ class classproperty(property):
         # the class is created with a metaclass that implements this behaviour.
         raise NotImplementedError
 
+    def __reduce__(self) -> tuple[callable, tuple[str, str]]:
+        """Supports pickling the class property by reference, so that unpickling returns
+        the class property defined on the class, located by its module and qualified name,
+        along with any values it has cached in the unpickling process."""
+
+        return (locate, reference(self.fget))
+
     def __getattr__(self, name: str):
         if hasattr(self.fget, name):
             return getattr(self.fget, name)
@@ -39,3 +52,85 @@ class classproperty(property):
                     name,
                 )
             )
+
+
+class cachedclassproperty(classproperty):
+    """The cachedclassproperty decorator transforms a method into a class-level property
+    as per the classproperty decorator, but computes the property's value only once for
+    each class on which it is accessed, caching the value for subsequent accesses, which
+    suits class-level data that is expensive to derive but read frequently. The value is
+    cached per concrete class, so subclasses derive and cache their own values.
+
+    Cached values are read without locking; the first access for a class computes the
+    value under a lock, so that concurrent first accesses compute the value only once.
+    Cached values can be discarded via the `invalidate()` method, obtained from the class
+    via `vars(<class>)[<name>]`, and are discarded automatically if the class is garbage
+    collected; note that a cached value which references its class keeps it alive."""
+
+    _cache: dict[int, tuple[weakref.ref, object]] = None
+    _lock: threading.RLock = None
+
+    def __init__(self, fget: callable, fset: callable = None, fdel: callable = None):
+        super().__init__(fget, fset, fdel)
+
+        # The cache is keyed by the identity of each class, which is removed from the
+        # cache via a weak reference callback when the class is garbage collected; the
+        # reentrant lock allows a value to be derived from a superclass' cached value
+        self._cache = {}
+        self._lock = threading.RLock()
+
+    def __get__(self, instance: object, klass: type = None):
+        if klass is None:
+            return self
+
+        try:
+            return self._cache[id(klass)][1]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if (cached := self._cache.get(id(klass))) is None:
+                logger.debug(
+                    "%s.__get__(klass: %s) computing value",
+                    self.__class__.__name__,
+                    klass,
+                )
+
+                cached = self._cache[id(klass)] = (
+                    weakref.ref(klass, self._discard(id(klass))),
+                    self.fget(klass),
+                )
+
+        return cached[1]
+
+    def _discard(self, key: int) -> callable:
+        """Returns the callback that discards the cached value of a collected class."""
+
+        cache = self._cache
+
+        def discard(reference: weakref.ref):
+            cache.pop(key, None)
+
+        return discard
+
+    def invalidate(self, klass: type = None) -> cachedclassproperty:
+        """Supports discarding the cached value for the specified class, so the value is
+        derived afresh on its next access, or the cached values for all classes if no
+        class is specified; invalidating a class does not invalidate its subclasses."""
+
+        if not (klass is None or isinstance(klass, type)):
+            raise TypeError("The 'klass' argument must reference a class!")
+
+        with self._lock:
+            if klass is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(id(klass), None)
+
+        return self
+
+
+__all__ = [
+    "classproperty",
+    "cachedclassproperty",
+]
@@ -0,0 +1,1094 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import wraps, partial
+
+import asyncio
+import inspect
+import sys
+import threading
+import time
+import weakref
+
+from classicist.inspector import layers, locate, reference
+from classicist.logging import logger, tracing
+from classicist.decorators.nocache import is_nocache
+from classicist.decorators.memoize.store import Store, SQLiteStore, fingerprint
+from classicist.exceptions.decorators.memoize import CacheError
+
+logger = logger.getChild(__name__)
+
+# The sentinel value returned by cache lookups for keys that are not present
+MISSING: object = object()
+
+# The marker that separates the positional and keyword arguments within cache keys
+KWMARK: object = object()
+
+# The types whose values may be used as cache keys directly, when passed alone
+FASTTYPES: set[type] = {int, str}
+
+
+def cachekey(args: tuple, kwargs: dict, typed: bool = False) -> object:
+    """Supports creating a hashable cache key from the specified positional and keyword
+    arguments, optionally including the types of the argument values, so that values
+    that compare as equal but are of different types, such as 1 and 1.0, are cached
+    separately; a single argument of a fast type is used as its own key."""
+
+    key: tuple = args
+
+    if kwargs:
+        key += (KWMARK,)
+
+        for item in kwargs.items():
+            key += item
+
+    if typed:
+        key += tuple(type(value) for value in args)
+
+        if kwargs:
+            key += tuple(type(value) for value in kwargs.values())
+    elif len(key) == 1 and type(key[0]) in FASTTYPES:
+        return key[0]
+
+    return key
+
+
+class CacheStatistics(object):
+    """The CacheStatistics class holds the counters for the cache lookups made, which
+    can be shared between caches, such as the per-instance caches of a method."""
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "coalesced",
+    )
+
+    def __init__(self):
+        """Supports instantiating an instance of the CacheStatistics class."""
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.coalesced: int = 0
+
+    def reset(self) -> CacheStatistics:
+        """Supports resetting the counters."""
+
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self.coalesced = 0
+
+        return self
+
+    def snapshot(self) -> dict[str, int]:
+        """Supports obtaining a snapshot of the counters as a dictionary."""
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "coalesced": self.coalesced,
+        }
+
+
+def sizeof(value: object) -> int:
+    """Supports approximating the number of bytes used by the specified value, for use
+    by caches with a byte budget; the size is found via `sys.getsizeof()`, to which the
+    sizes of the items of lists, tuples, sets and dictionaries are added, though not of
+    any further nested items, while for objects that expose their data via the buffer
+    protocol, such as arrays, the length of the buffer is used if it is larger."""
+
+    size: int = sys.getsizeof(value)
+
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        pass
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    else:
+        try:
+            with memoryview(value) as view:
+                size = max(size, view.nbytes)
+        except TypeError:
+            pass
+
+    return size
+
+
+class Cache(object):
+    """The Cache class provides a thread-safe key-value cache with optional least
+    recently used (LRU) and time to live (TTL) eviction policies. When a maximum size is
+    specified the least recently used entries are evicted to make room for new entries,
+    and when a time to live is specified entries expire once they have been cached for
+    the specified number of seconds, as measured by the cache's clock; expired entries
+    are discarded when they are looked up, and from the least recently used end of the
+    cache as new entries are added. Without either policy, entries are cached until they
+    are cleared.
+
+    A byte budget can also be specified, in which case the size of each cached value is
+    approximated via the cache's sizer, which defaults to the `sizeof()` function, and
+    the least recently used entries are evicted to keep the total size of the cached
+    values within the budget, while values larger than the budget are not cached. The
+    number of bytes held by each cache is available via its `bytes` property, and the
+    total held by all caches with a byte budget or sizer via the resident() function."""
+
+    _entries: OrderedDict[object, tuple[object, float | None, int]] = None
+    _maxsize: int | None = None
+    _maxbytes: int | None = None
+    _sizer: callable = None
+    _bytes: int = 0
+    _ttl: float | None = None
+    _clock: callable = None
+    _lock: threading.RLock = None
+    _statistics: CacheStatistics = None
+
+    def __init__(
+        self,
+        maxsize: int = None,
+        ttl: float = None,
+        clock: callable = time.monotonic,
+        statistics: CacheStatistics = None,
+        maxbytes: int = None,
+        sizer: callable = None,
+    ):
+        """Supports instantiating an instance of the Cache class."""
+
+        if maxsize is None:
+            pass
+        elif not (isinstance(maxsize, int) and not isinstance(maxsize, bool)):
+            raise TypeError("The 'maxsize' argument must have an integer value!")
+        elif maxsize < 0:
+            raise ValueError("The 'maxsize' argument must have a non-negative value!")
+
+        if maxbytes is None:
+            pass
+        elif not (isinstance(maxbytes, int) and not isinstance(maxbytes, bool)):
+            raise TypeError("The 'maxbytes' argument must have an integer value!")
+        elif maxbytes < 0:
+            raise ValueError("The 'maxbytes' argument must have a non-negative value!")
+
+        if sizer is None:
+            sizer = sizeof if maxbytes is not None else None
+        elif not callable(sizer):
+            raise TypeError("The 'sizer' argument must reference a callable!")
+
+        if ttl is None:
+            pass
+        elif not (isinstance(ttl, (int, float)) and not isinstance(ttl, bool)):
+            raise TypeError("The 'ttl' argument must have a numeric value!")
+        elif not ttl > 0:
+            raise ValueError("The 'ttl' argument must have a positive value!")
+
+        if not callable(clock):
+            raise TypeError("The 'clock' argument must reference a callable!")
+
+        if statistics is None:
+            statistics = CacheStatistics()
+        elif not isinstance(statistics, CacheStatistics):
+            raise TypeError(
+                "The 'statistics' argument must reference a CacheStatistics instance!"
+            )
+
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._sizer = sizer
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._statistics = statistics
+
+        if sizer is not None:
+            caches.add(self)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Cache instance."""
+
+        return (
+            f"<{self.__class__.__name__}(size: {len(self)}, "
+            f"maxsize: {self._maxsize}, ttl: {self._ttl})>"
+        )
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Cache instance."""
+
+        return (
+            f"<{self.__class__.__name__}(size: {len(self)}, "
+            f"maxsize: {self._maxsize}, ttl: {self._ttl}) @ {hex(id(self))}>"
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of entries currently held in the cache."""
+
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Returns whether the cache holds an unexpired entry for the specified key,
+        without affecting the cache's statistics or recency ordering."""
+
+        with self._lock:
+            if (entry := self._entries.get(key, MISSING)) is MISSING:
+                return False
+
+            return entry[1] is None or entry[1] > self._clock()
+
+    @property
+    def maxsize(self) -> int | None:
+        """Supports returning the maximum number of entries held in the cache."""
+
+        return self._maxsize
+
+    @property
+    def maxbytes(self) -> int | None:
+        """Supports returning the byte budget for the values held in the cache."""
+
+        return self._maxbytes
+
+    @property
+    def bytes(self) -> int:
+        """Supports returning the approximate number of bytes held by the cache, which
+        is only tracked when the cache has a byte budget or sizer, otherwise it is 0."""
+
+        return self._bytes
+
+    @property
+    def ttl(self) -> float | None:
+        """Supports returning the number of seconds that entries are cached for."""
+
+        return self._ttl
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        """Supports returning the cache statistics counters."""
+
+        return self._statistics
+
+    def get(self, key: object, default: object = None) -> object:
+        """Supports returning the cached value for the specified key, or the specified
+        default value if the key has no cached value or its cached value has expired."""
+
+        with self._lock:
+            if (entry := self._entries.get(key, MISSING)) is MISSING:
+                self._statistics.misses += 1
+                return default
+
+            if not (entry[1] is None or entry[1] > self._clock()):
+                self._discard(key)
+                self._statistics.expirations += 1
+                self._statistics.misses += 1
+                return default
+
+            if not (self._maxsize is None and self._maxbytes is None):
+                self._entries.move_to_end(key)
+
+            self._statistics.hits += 1
+
+            return entry[0]
+
+    def peek(self, key: object, default: object = None) -> object:
+        """Supports returning the cached value for the specified key, or the specified
+        default value, as per `get()`, without affecting the statistics or ordering."""
+
+        with self._lock:
+            if (entry := self._entries.get(key, MISSING)) is MISSING:
+                return default
+
+            if not (entry[1] is None or entry[1] > self._clock()):
+                return default
+
+            return entry[0]
+
+    def _discard(self, key: object = MISSING) -> tuple:
+        """Discards the entry for the specified key, or the least recently used entry if
+        no key is specified, accounting for its size; callers must hold the lock."""
+
+        if key is MISSING:
+            key, entry = self._entries.popitem(last=False)
+        else:
+            entry = self._entries.pop(key)
+
+        self._bytes -= entry[2]
+
+        return entry
+
+    def set(self, key: object, value: object) -> Cache:
+        """Supports caching the specified value for the specified key, evicting entries
+        as needed to remain within the cache's maximum size and byte budget."""
+
+        if self._maxsize == 0:
+            return self
+
+        size: int = self._sizer(value) if self._sizer else 0
+
+        if not (self._maxbytes is None or size <= self._maxbytes):
+            return self  # Values larger than the byte budget are not cached
+
+        with self._lock:
+            entries = self._entries
+
+            if key in entries:
+                self._discard(key)
+
+            if self._ttl is None:
+                entries[key] = (value, None, size)
+            else:
+                now = self._clock()
+
+                entries[key] = (value, now + self._ttl, size)
+
+                # Discard any expired entries from the least recently used end
+                while entries:
+                    if next(iter(entries.values()))[1] > now:
+                        break
+
+                    self._discard()
+
+                    self._statistics.expirations += 1
+
+            self._bytes += size
+
+            if self._maxsize is not None:
+                while len(entries) > self._maxsize:
+                    self._discard()
+
+                    self._statistics.evictions += 1
+
+            if self._maxbytes is not None:
+                while self._bytes > self._maxbytes:
+                    self._discard()
+
+                    self._statistics.evictions += 1
+
+        return self
+
+    def delete(self, key: object) -> bool:
+        """Supports discarding the cached value for the specified key, returning whether
+        the key had a cached value."""
+
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+                return True
+
+            return False
+
+    def clear(self) -> Cache:
+        """Supports discarding all of the cached values."""
+
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+        return self
+
+
+# The caches that track the number of bytes they hold, held weakly for resident()
+caches: weakref.WeakSet[Cache] = weakref.WeakSet()
+
+
+def resident() -> int:
+    """Supports returning the approximate number of bytes held across all of the caches
+    that track the number of bytes they hold, being those with a byte budget/sizer."""
+
+    return sum(cache.bytes for cache in list(caches))
+
+
+class Flight(object):
+    """The Flight class represents an in-flight call to a memoized function, which the
+    concurrent callers that coalesce onto the call wait on, to share its outcome."""
+
+    __slots__ = (
+        "done",
+        "result",
+        "exception",
+    )
+
+    def __init__(self, done: threading.Event | asyncio.Future):
+        """Supports instantiating an instance of the Flight class."""
+
+        self.done: threading.Event | asyncio.Future = done
+        self.result: object = None
+        self.exception: BaseException = None
+
+
+class Memoizer(object):
+    """The Memoizer class caches the results of calls made to a function, keyed by the
+    arguments passed to each call, so that repeated calls with the same arguments return
+    the cached result rather than calling the function again. Results are cached within
+    Cache instances, which support LRU and TTL eviction policies.
+
+    By default, a single cache is used for all calls to the function, which for methods
+    includes the instance or class in each key; alternatively the scope can be set to
+    'instance', so that each instance has its own cache, which is discarded when the
+    instance is garbage collected, or to 'class', so that each class has its own cache,
+    shared by the class and its instances; in both cases the instance or class is then
+    not included in the key. The statistics are gathered across all of the caches.
+
+    For expensive pure functions, a persistent Store, such as an SQLiteStore, can also
+    be used, so that results survive restarts and can be shared by processes on the same
+    host; on a cache miss, the store is consulted before calling the function, and new
+    results are persisted to the store as well as being cached. Stored results are keyed
+    by the function's fully qualified name, the fingerprint of its code, and the call's
+    arguments, so that results stored for prior versions of the function's code are not
+    used, and are discarded when the function is memoized. Results that, or calls whose
+    arguments, cannot be pickled are cached but not persisted.
+
+    To prevent a cache stampede, where a cache miss on an expensive function leads many
+    concurrent callers to each compute the same result, single-flight mode can be used;
+    the first caller to miss then computes the result, while concurrent callers for the
+    same key, whether in other threads or other asyncio tasks on the same event loop,
+    wait on the in-flight call and share its result or exception; the number of calls
+    coalesced onto in-flight calls is recorded in the statistics."""
+
+    _function: callable = None
+    _maxsize: int | None = None
+    _maxbytes: int | None = None
+    _sizer: callable = None
+    _ttl: float | None = None
+    _typed: bool = False
+    _scope: str = None
+    _clock: callable = None
+    _statistics: CacheStatistics = None
+    _cache: Cache = None
+    _caches: dict[int, tuple[weakref.ref, Cache]] = None
+    _singleflight: bool = False
+    _flights: dict[tuple, Flight] = None
+    _store: Store = None
+    _name: str = None
+    _fingerprint: str = None
+    _lock: threading.RLock = None
+
+    scopes: tuple[str, ...] = ("function", "instance", "class")
+
+    def __init__(
+        self,
+        function: callable,
+        maxsize: int = None,
+        ttl: float = None,
+        typed: bool = False,
+        scope: str = "function",
+        clock: callable = time.monotonic,
+        singleflight: bool = False,
+        maxbytes: int = None,
+        sizer: callable = None,
+        store: Store = None,
+    ):
+        """Supports instantiating an instance of the Memoizer class."""
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        if is_nocache(function):
+            raise CacheError(
+                "The function %s has been marked as @nocache so cannot be memoized!"
+                % (getattr(function, "__qualname__", function))
+            )
+
+        if inspect.isgeneratorfunction(function) or inspect.isasyncgenfunction(
+            function
+        ):
+            raise CacheError(
+                "The function %s is a generator so its results cannot be memoized!"
+                % (getattr(function, "__qualname__", function))
+            )
+
+        if not isinstance(typed, bool):
+            raise TypeError("The 'typed' argument must have a boolean value!")
+
+        if not isinstance(singleflight, bool):
+            raise TypeError("The 'singleflight' argument must have a boolean value!")
+
+        if not scope in self.scopes:
+            raise ValueError(
+                "The 'scope' argument must have a value of %s!"
+                % (", ".join(self.scopes))
+            )
+
+        if store is None:
+            pass
+        elif not isinstance(store, Store):
+            raise TypeError("The 'store' argument must reference a Store instance!")
+        elif not scope == "function":
+            raise ValueError(
+                "The 'store' argument can only be used with the 'function' scope!"
+            )
+
+        self._function = function
+        self._maxsize = maxsize
+        self._maxbytes = maxbytes
+        self._sizer = sizer
+        self._ttl = ttl
+        self._typed = typed
+        self._scope = scope
+        self._clock = clock
+        self._statistics = CacheStatistics()
+        self._caches = {}
+        self._singleflight = singleflight
+        self._flights = {}
+        self._lock = threading.RLock()
+
+        # Validates the cache configuration, and provides the cache for function scope
+        self._cache = self._create()
+
+        if store is not None:
+            self._store = store
+            self._name = f"{function.__module__}.{function.__qualname__}"
+            self._fingerprint = fingerprint(function)
+
+            # Discard results stored for prior versions of the function's code
+            store.prune(self._name, self._fingerprint)
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Memoizer instance."""
+
+        return (
+            f"<{self.__class__.__name__}(function: {self._function.__qualname__}, "
+            f"scope: {self._scope})>"
+        )
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Memoizer instance."""
+
+        return (
+            f"<{self.__class__.__name__}(function: {self._function.__qualname__}, "
+            f"scope: {self._scope}) @ {hex(id(self))}>"
+        )
+
+    def __reduce__(self) -> tuple[callable, tuple[str, str]]:
+        """Supports pickling the Memoizer by reference, so that unpickling returns the
+        Memoizer of the memoized function of the same module and qualified name within
+        the unpickling process; the results cached by each process remain its own."""
+
+        return (_located, reference(self._function))
+
+    @property
+    def function(self) -> callable:
+        """Supports returning the memoized function."""
+
+        return self._function
+
+    @property
+    def maxsize(self) -> int | None:
+        """Supports returning the maximum number of entries held in each cache."""
+
+        return self._maxsize
+
+    @property
+    def maxbytes(self) -> int | None:
+        """Supports returning the byte budget for the results held in each cache."""
+
+        return self._maxbytes
+
+    @property
+    def ttl(self) -> float | None:
+        """Supports returning the number of seconds that results are cached for."""
+
+        return self._ttl
+
+    @property
+    def typed(self) -> bool:
+        """Supports returning whether argument types are included in the cache keys."""
+
+        return self._typed
+
+    @property
+    def scope(self) -> str:
+        """Supports returning the scope of the caches: function, instance or class."""
+
+        return self._scope
+
+    @property
+    def singleflight(self) -> bool:
+        """Supports returning whether concurrent calls are coalesced on cache misses."""
+
+        return self._singleflight
+
+    @property
+    def store(self) -> Store | None:
+        """Supports returning the persistent store used by the Memoizer, if any."""
+
+        return self._store
+
+    @property
+    def caches(self) -> list[Cache]:
+        """Supports returning the caches currently held by the Memoizer."""
+
+        if self._scope == "function":
+            return [self._cache]
+
+        with self._lock:
+            return [cache for (_, cache) in self._caches.values()]
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Supports returning the statistics for the cache lookups made, gathered across
+        all of the caches, as well as the number of caches, and the number of results
+        and approximate number of bytes that they currently hold."""
+
+        caches: list[Cache] = self.caches
+
+        return {
+            **self._statistics.snapshot(),
+            "caches": len(caches),
+            "size": sum(len(cache) for cache in caches),
+            "bytes": sum(cache.bytes for cache in caches),
+        }
+
+    def _create(self) -> Cache:
+        """Creates a new cache configured as per the Memoizer's configuration."""
+
+        return Cache(
+            maxsize=self._maxsize,
+            ttl=self._ttl,
+            clock=self._clock,
+            statistics=self._statistics,
+            maxbytes=self._maxbytes,
+            sizer=self._sizer,
+        )
+
+    def _discard(self, key: int) -> callable:
+        """Returns a callback to discard the cache of a collected instance or class."""
+
+        def discard(reference: weakref.ref):
+            with self._lock:
+                self._caches.pop(key, None)
+
+        return discard
+
+    def cache(self, args: tuple, create: bool = True) -> tuple[Cache | None, tuple]:
+        """Supports returning the cache for a call made with the specified positional
+        arguments, along with the arguments that form the call's cache key; for the
+        instance and class scopes, the cache is selected via the first argument, which
+        is then excluded from the cache key."""
+
+        if self._scope == "function":
+            return (self._cache, args)
+
+        if not args:
+            raise CacheError(
+                "The function %s has %s scope caching, so must be called as a method!"
+                % (self._function.__qualname__, self._scope)
+            )
+
+        owner: object = args[0]
+
+        if self._scope == "class" and not isinstance(owner, type):
+            owner = type(owner)
+
+        try:
+            return (self._caches[id(owner)][1], args[1:])
+        except KeyError:
+            if create is False:
+                return (None, args[1:])
+
+        with self._lock:
+            if (cached := self._caches.get(id(owner))) is None:
+                try:
+                    reference = weakref.ref(owner, self._discard(id(owner)))
+                except TypeError:
+                    raise CacheError(
+                        "The function %s has %s scope caching, which requires %s to "
+                        "support weak references!"
+                        % (self._function.__qualname__, self._scope, type(owner))
+                    )
+
+                cached = self._caches[id(owner)] = (reference, self._create())
+
+        return (cached[1], args[1:])
+
+    def _expires(self) -> float | None:
+        """Returns the wall clock time at which a result persisted now would expire."""
+
+        return None if self._ttl is None else time.time() + self._ttl
+
+    def call(
+        self,
+        cache: Cache,
+        key: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports calling the function on a cache miss, caching its result, and where
+        a persistent store is in use, first loading the result from the store, if it is
+        present, and otherwise persisting the result to the store."""
+
+        if (store := self._store) is None:
+            cache.set(key, result := function(*args, **kwargs))
+
+            return result
+
+        if (digest := store.digest(self._name, self._fingerprint, key)) is not None:
+            if (result := store.get(digest, MISSING)) is not MISSING:
+                cache.set(key, result)
+
+                return result
+
+        cache.set(key, result := function(*args, **kwargs))
+
+        if digest is not None:
+            store.set(digest, result, self._name, self._fingerprint, self._expires())
+
+        return result
+
+    async def acall(
+        self,
+        cache: Cache,
+        key: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports awaiting the coroutine function on a cache miss, as per `call()`."""
+
+        if (store := self._store) is None:
+            cache.set(key, result := await function(*args, **kwargs))
+
+            return result
+
+        if (digest := store.digest(self._name, self._fingerprint, key)) is not None:
+            if (result := store.get(digest, MISSING)) is not MISSING:
+                cache.set(key, result)
+
+                return result
+
+        cache.set(key, result := await function(*args, **kwargs))
+
+        if digest is not None:
+            store.set(digest, result, self._name, self._fingerprint, self._expires())
+
+        return result
+
+    def _board(self, identity: tuple, done: callable) -> tuple[Flight, bool]:
+        """Returns the in-flight call for the specified identity, creating it if needed,
+        and whether the caller is the leader that must complete the call."""
+
+        with self._lock:
+            if (flight := self._flights.get(identity)) is None:
+                flight = self._flights[identity] = Flight(done())
+
+                return (flight, True)
+
+            self._statistics.coalesced += 1
+
+            return (flight, False)
+
+    def _land(self, identity: tuple):
+        """Removes the in-flight call for the specified identity, once it has landed."""
+
+        with self._lock:
+            del self._flights[identity]
+
+    def flight(
+        self,
+        cache: Cache,
+        key: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports calling the function on a cache miss in single-flight mode, so that
+        concurrent callers for the same key wait on, and share, one call's outcome."""
+
+        identity: tuple = (id(cache), key)
+
+        flight, leader = self._board(identity, threading.Event)
+
+        if leader is False:
+            flight.done.wait()
+
+            if flight.exception is not None:
+                raise flight.exception
+
+            return flight.result
+
+        try:
+            # The result may have been cached by a call that landed since the cache miss
+            if (result := cache.peek(key, MISSING)) is MISSING:
+                result = self.call(cache, key, function, args, kwargs)
+
+            flight.result = result
+        except BaseException as exception:
+            flight.exception = exception
+            raise
+        finally:
+            self._land(identity)
+
+            flight.done.set()
+
+        return result
+
+    async def aflight(
+        self,
+        cache: Cache,
+        key: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports awaiting the coroutine function on a cache miss in single-flight
+        mode, so concurrent tasks for the same key wait on and share one call's outcome;
+        in-flight calls are tracked per event loop, as tasks are bound to a loop.
+
+        The call runs in a task owned by the in-flight call, rather than in the task of
+        the caller that started it, and every caller, including the one that started it,
+        awaits the task via a shield, so that the cancellation of any caller, such as by
+        a timeout, does not cancel the call for the other callers; the call completes,
+        and its result is cached, even if all of its callers are cancelled."""
+
+        loop = asyncio.get_running_loop()
+
+        identity: tuple = (id(cache), key, loop)
+
+        def launch() -> asyncio.Task:
+            task = loop.create_task(
+                self._aflown(identity, cache, key, function, args, kwargs)
+            )
+
+            # Mark any exception as retrieved, as every caller may have been cancelled
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+            return task
+
+        flight: Flight = self._board(identity, launch)[0]
+
+        return await asyncio.shield(flight.done)
+
+    async def _aflown(
+        self,
+        identity: tuple,
+        cache: Cache,
+        key: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports completing an in-flight call within the task owned by the call, and
+        removing the in-flight call once it has landed."""
+
+        try:
+            # The result may have been cached by a call that landed since the cache miss
+            if (result := cache.peek(key, MISSING)) is MISSING:
+                result = await self.acall(cache, key, function, args, kwargs)
+        finally:
+            self._land(identity)
+
+        return result
+
+    def invalidate(self, *args, **kwargs) -> bool:
+        """Supports discarding the cached result for a call made with the specified
+        arguments, returning whether there was a cached result to discard."""
+
+        cache, args = self.cache(args, create=False)
+
+        key: object = cachekey(args, kwargs, self._typed)
+
+        deleted: bool = False
+
+        if (store := self._store) is not None:
+            if (digest := store.digest(self._name, self._fingerprint, key)) is not None:
+                deleted = store.delete(digest)
+
+        if cache is None:
+            return deleted
+
+        return cache.delete(key) or deleted
+
+    def clear(self) -> Memoizer:
+        """Supports discarding all cached and stored results, and the statistics."""
+
+        with self._lock:
+            self._cache.clear()
+            self._caches.clear()
+            self._statistics.reset()
+
+            if self._store is not None:
+                self._store.clear(self._name)
+
+        return self
+
+
+def memoize(
+    function: callable = None,
+    /,
+    maxsize: int = None,
+    ttl: float = None,
+    typed: bool = False,
+    scope: str = "function",
+    clock: callable = time.monotonic,
+    singleflight: bool = False,
+    maxbytes: int = None,
+    sizer: callable = None,
+    store: Store = None,
+) -> callable:
+    """The memoize decorator caches the results of calls made to the decorated function
+    or method, keyed by the arguments passed to each call, so that repeated calls with
+    the same arguments return the cached result. The decorator can be used without any
+    arguments, to cache all results until they are cleared, or with the optional keyword
+    arguments: `maxsize` to limit the number of cached results, evicting those least
+    recently used, `ttl` to expire results after the specified number of seconds, as
+    measured by the `clock`, `typed` to cache arguments of differing types separately,
+    `scope` to cache results per 'instance' or per 'class' rather than per function, and
+    `singleflight` to coalesce concurrent calls that miss the cache for the same key
+    onto a single in-flight call, whose result or exception the waiting callers share.
+
+    To cap the memory used by the cached results, the `maxbytes` keyword argument can be
+    used to specify a byte budget for each cache, with the least recently used results
+    being evicted to keep the approximate size of the cached results within the budget;
+    the size of each result is approximated by the `sizer`, which defaults to sizeof().
+
+    To persist results across restarts, the `store` keyword argument can be used to
+    specify a persistent Store, such as an SQLiteStore, which is consulted on each cache
+    miss, and to which new results are persisted; see the Memoizer class for details.
+
+    Coroutine functions are supported, with their awaited results being cached, while
+    generators are not supported. The decorator refuses to memoize functions that have
+    been marked as not cacheable via the @nocache decorator, raising a CacheError, and
+    calls that raise exceptions are not cached. The Memoizer for a memoized function can
+    be obtained via the memoizer() helper method, to access its statistics, or to clear
+    or invalidate its cached results."""
+
+    if function is None:
+        return partial(
+            memoize,
+            maxsize=maxsize,
+            ttl=ttl,
+            typed=typed,
+            scope=scope,
+            clock=clock,
+            singleflight=singleflight,
+            maxbytes=maxbytes,
+            sizer=sizer,
+            store=store,
+        )
+
+    logger.debug("memoize(function: %s)", function)
+
+    _memoizer = Memoizer(
+        function,
+        maxsize=maxsize,
+        ttl=ttl,
+        typed=typed,
+        scope=scope,
+        clock=clock,
+        singleflight=singleflight,
+        maxbytes=maxbytes,
+        sizer=sizer,
+        store=store,
+    )
+
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def wrapper(*args, **kwargs):
+            if tracing._enabled:
+                logger.debug(
+                    "memoize(function: %s).wrapper(args: %s, kwargs: %s)",
+                    function,
+                    args,
+                    kwargs,
+                )
+
+            cache, keyargs = _memoizer.cache(args)
+
+            key = cachekey(keyargs, kwargs, typed)
+
+            if (result := cache.get(key, MISSING)) is not MISSING:
+                pass
+            elif singleflight:
+                result = await _memoizer.aflight(cache, key, function, args, kwargs)
+            elif store is not None:
+                result = await _memoizer.acall(cache, key, function, args, kwargs)
+            else:
+                cache.set(key, result := await function(*args, **kwargs))
+
+            return result
+
+    else:
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if tracing._enabled:
+                logger.debug(
+                    "memoize(function: %s).wrapper(args: %s, kwargs: %s)",
+                    function,
+                    args,
+                    kwargs,
+                )
+
+            cache, keyargs = _memoizer.cache(args)
+
+            key = cachekey(keyargs, kwargs, typed)
+
+            if (result := cache.get(key, MISSING)) is not MISSING:
+                pass
+            elif singleflight:
+                result = _memoizer.flight(cache, key, function, args, kwargs)
+            elif store is not None:
+                result = _memoizer.call(cache, key, function, args, kwargs)
+            else:
+                cache.set(key, result := function(*args, **kwargs))
+
+            return result
+
+    wrapper._classicist_memoizer = _memoizer
+
+    return wrapper
+
+
+def memoizer(function: callable) -> Memoizer | None:
+    """The memoizer helper method can be used to obtain the Memoizer instance for the
+    specified memoized function, if one is present."""
+
+    if not callable(function):
+        raise TypeError("The 'function' argument must reference a callable!")
+
+    if isinstance(
+        _memoizer := getattr(function, "_classicist_memoizer", None), Memoizer
+    ):
+        return _memoizer
+
+
+def _located(module: str, qualname: str) -> Memoizer:
+    """Supports obtaining the Memoizer of the memoized function located by its module and
+    qualified name, such as when a Memoizer that was pickled by reference is unpickled.
+    """
+
+    function: callable = locate(module, qualname)
+
+    # Class and static methods are unwrapped via __func__, which all versions support
+    for layer in layers(getattr(function, "__func__", function)):
+        if isinstance(
+            _memoizer := getattr(layer, "_classicist_memoizer", None), Memoizer
+        ):
+            return _memoizer
+
+    raise AttributeError(f"Cannot locate the Memoizer of '{module}.{qualname}'!")
+
+
+def is_memoized(function: callable) -> bool:
+    """The is_memoized helper method can be used to determine if the specified function
+    has been memoized via the @memoize decorator."""
+
+    return isinstance(getattr(function, "_classicist_memoizer", None), Memoizer)
+
+
+__all__ = [
+    "Cache",
+    "CacheStatistics",
+    "Flight",
+    "Memoizer",
+    "memoize",
+    "memoizer",
+    "is_memoized",
+    "cachekey",
+    "sizeof",
+    "resident",
+    "Store",
+    "SQLiteStore",
+    "fingerprint",
+]
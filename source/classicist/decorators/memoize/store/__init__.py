@@ -0,0 +1,392 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+
+from abc import ABC, abstractmethod
+
+import hashlib
+import os
+import pickle
+import re
+import threading
+import time
+import types
+
+try:
+    import sqlite3
+except ImportError:  # The sqlite3 module is optional in some Python distributions
+    sqlite3 = None
+
+logger = logger.getChild(__name__)
+
+# The pickle protocol used for keys and values, fixed so that digests remain stable
+PROTOCOL: int = 4
+
+
+# The pattern that matches the memory addresses included in the representations of
+# objects, such as functions, which differ between processes and so are omitted
+ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+# The types whose representations are the same in every process
+PRIMITIVES: tuple[type] = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _canonical(value: object) -> str:
+    """Supports creating a canonical representation of a value, such as a constant or a
+    default argument value, which is the same in every process; the members of sets are
+    sorted, as their iteration order depends on the process' string hash seed, and the
+    memory addresses included in the representations of objects are omitted."""
+
+    if isinstance(value, PRIMITIVES) or value is Ellipsis:
+        return repr(value)
+    elif isinstance(value, (set, frozenset)):
+        members: list[str] = sorted(_canonical(member) for member in value)
+        return f"{type(value).__name__}({{{', '.join(members)}}})"
+    elif isinstance(value, (tuple, list)):
+        members: list[str] = [_canonical(member) for member in value]
+        return f"{type(value).__name__}([{', '.join(members)}])"
+    elif isinstance(value, dict):
+        items: list[str] = sorted(
+            f"{_canonical(key)}: {_canonical(item)}" for key, item in value.items()
+        )
+        return f"{type(value).__name__}({{{', '.join(items)}}})"
+    elif type(value).__repr__ is object.__repr__:
+        return f"<{type(value).__module__}.{type(value).__qualname__}>"
+    else:
+        return ADDRESS.sub("", repr(value))
+
+
+def fingerprint(function: callable) -> str:
+    """Supports creating a stable fingerprint of the specified function's code, derived
+    from its bytecode, constants, names and default argument values, including those of
+    any nested functions, but not its line numbers, so that the fingerprint changes when
+    the function's code changes but not when the code is merely moved within its file;
+    the constants and default argument values are represented canonically, so that the
+    fingerprint is the same in every process, regardless of the string hash seed; note
+    that functions called by the function are not included in its fingerprint."""
+
+    digest = hashlib.sha256()
+
+    def update(code: types.CodeType):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        digest.update(repr(code.co_varnames).encode())
+
+        for constant in code.co_consts:
+            if isinstance(constant, types.CodeType):
+                update(constant)
+            else:
+                digest.update(_canonical(constant).encode())
+
+    function = getattr(function, "__func__", function)
+
+    if isinstance(code := getattr(function, "__code__", None), types.CodeType):
+        update(code)
+
+    digest.update(_canonical(getattr(function, "__defaults__", None)).encode())
+    digest.update(_canonical(getattr(function, "__kwdefaults__", None)).encode())
+
+    return digest.hexdigest()
+
+
+class _Members(tuple):
+    """The _Members class holds the sorted members of a set or frozenset within a cache
+    key, so that keys holding equal sets are pickled identically in every process."""
+
+    pass
+
+
+def _ordered(value: object) -> object:
+    """Supports replacing any sets and frozensets held within a cache key with their
+    members, sorted by their pickled form, as the iteration order of sets depends on the
+    process' string hash seed, and so would otherwise affect the pickled key."""
+
+    if isinstance(value, (set, frozenset)):
+        return _Members(
+            sorted(
+                (_ordered(member) for member in value),
+                key=lambda member: pickle.dumps(member, protocol=PROTOCOL),
+            )
+        )
+    elif type(value) is tuple:
+        return tuple(_ordered(member) for member in value)
+
+    return value
+
+
+class Store(ABC):
+    """The Store class defines the interface for persistent stores that can be used by
+    the @memoize decorator to persist cached results, so that they survive restarts; the
+    results are keyed by digests derived from the function's fully qualified name, the
+    fingerprint of its code, and the cache key, and are stored as pickled values; each
+    subclass must implement all of the abstract methods before it can be instantiated.
+    """
+
+    def digest(self, name: str, fingerprint: str, key: object) -> str | None:
+        """Supports creating the digest under which the result for the specified cache
+        key is stored, returning None if the key cannot be pickled and so persisted."""
+
+        try:
+            pickled: bytes = pickle.dumps(_ordered(key), protocol=PROTOCOL)
+        except Exception:
+            return None
+
+        digest = hashlib.sha256()
+
+        digest.update(name.encode())
+        digest.update(fingerprint.encode())
+        digest.update(pickled)
+
+        return digest.hexdigest()
+
+    @abstractmethod
+    def get(self, digest: str, default: object = None) -> object:
+        """Supports returning the stored value for the specified digest, or the default
+        value if no unexpired value has been stored for the digest."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self,
+        digest: str,
+        value: object,
+        name: str,
+        fingerprint: str,
+        expires: float = None,
+    ) -> bool:
+        """Supports storing the specified value for the specified digest, along with the
+        name and fingerprint of the function and optional expiry time, returning whether
+        the value was stored, as values that cannot be pickled are not stored."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, digest: str) -> bool:
+        """Supports discarding the stored value for the specified digest."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, name: str = None) -> int:
+        """Supports discarding the stored values for the specified function name, or all
+        stored values if no name is specified, returning the number discarded."""
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def prune(self, name: str, fingerprint: str) -> int:
+        """Supports discarding the stored values for the specified function name which
+        were stored for other fingerprints, such as before the function's code changed,
+        as well as any expired values, returning the number of values discarded."""
+
+        raise NotImplementedError
+
+
+class SQLiteStore(Store):
+    """The SQLiteStore class persists cached results in a local SQLite database file,
+    which can be shared safely by concurrent threads and processes on the same host, as
+    the database is used in write-ahead logging mode, with each thread of each process
+    using its own connection, and with writers waiting for up to the timeout in seconds
+    for locks held by other writers to be released.
+
+    Stored values are pickled, so as with any use of pickle, the database file should
+    only be writeable by trusted users, as unpickling untrusted data is unsafe."""
+
+    _path: str = None
+    _timeout: float = None
+    _local: threading.local = None
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """Supports instantiating an instance of the SQLiteStore class."""
+
+        if sqlite3 is None:
+            raise RuntimeError(
+                "The SQLiteStore requires the sqlite3 module, which is unavailable!"
+            )
+
+        if not isinstance(path, (str, os.PathLike)):
+            raise TypeError("The 'path' argument must have a string or path value!")
+
+        if not (isinstance(timeout, (int, float)) and timeout > 0):
+            raise TypeError(
+                "The 'timeout' argument must have a positive numeric value!"
+            )
+
+        self._path = os.fspath(path)
+        self._timeout = float(timeout)
+        self._local = threading.local()
+
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "digest TEXT PRIMARY KEY, "
+                "name TEXT NOT NULL, "
+                "fingerprint TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "expires REAL"
+                ")"
+            )
+
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_name ON results (name)"
+            )
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current SQLiteStore instance."""
+
+        return f"<{self.__class__.__name__}(path: {self._path})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current SQLiteStore instance."""
+
+        return f"<{self.__class__.__name__}(path: {self._path}) @ {hex(id(self))}>"
+
+    def __getstate__(self) -> dict:
+        """Supports pickling the store without its process and thread bound connections,
+        such as for use by worker processes, which then open their own connections."""
+
+        return {"path": self._path, "timeout": self._timeout}
+
+    def __setstate__(self, state: dict):
+        """Supports unpickling the store, for use in another process or thread."""
+
+        self._path = state["path"]
+        self._timeout = state["timeout"]
+        self._local = threading.local()
+
+    @property
+    def path(self) -> str:
+        """Supports returning the path of the database file."""
+
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the connection for the calling thread, opening it if needed, and also
+        after a fork, as connections cannot be shared between processes."""
+
+        local = self._local
+
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=self._timeout)
+
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+
+            local.connection = connection
+            local.pid = os.getpid()
+
+        return local.connection
+
+    def get(self, digest: str, default: object = None) -> object:
+        """Supports returning the stored value for the specified digest, or the default
+        value if no unexpired value has been stored for the digest."""
+
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires FROM results WHERE digest = ?",
+                (digest,),
+            )
+            .fetchone()
+        )
+
+        if row is None:
+            return default
+
+        value, expires = row
+
+        if not (expires is None or expires > time.time()):
+            return default
+
+        try:
+            return pickle.loads(value)
+        except Exception as exception:
+            logger.warning(
+                "%s.get() failed to unpickle the value for %s: %s",
+                self.__class__.__name__,
+                digest,
+                exception,
+            )
+
+            return default
+
+    def set(
+        self,
+        digest: str,
+        value: object,
+        name: str,
+        fingerprint: str,
+        expires: float = None,
+    ) -> bool:
+        """Supports storing the specified value for the specified digest, along with the
+        name and fingerprint of the function and optional expiry time, returning whether
+        the value was stored, as values that cannot be pickled are not stored."""
+
+        try:
+            pickled: bytes = pickle.dumps(value, protocol=PROTOCOL)
+        except Exception as exception:
+            logger.debug(
+                "%s.set() cannot persist the value for %s: %s",
+                self.__class__.__name__,
+                name,
+                exception,
+            )
+
+            return False
+
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO results "
+                "(digest, name, fingerprint, value, expires) VALUES (?, ?, ?, ?, ?)",
+                (digest, name, fingerprint, pickled, expires),
+            )
+
+        return True
+
+    def delete(self, digest: str) -> bool:
+        """Supports discarding the stored value for the specified digest."""
+
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "DELETE FROM results WHERE digest = ?",
+                (digest,),
+            )
+
+        return cursor.rowcount > 0
+
+    def clear(self, name: str = None) -> int:
+        """Supports discarding the stored values for the specified function name, or all
+        stored values if no name is specified, returning the number discarded."""
+
+        with self._connection() as connection:
+            if name is None:
+                cursor = connection.execute("DELETE FROM results")
+            else:
+                cursor = connection.execute(
+                    "DELETE FROM results WHERE name = ?",
+                    (name,),
+                )
+
+        return cursor.rowcount
+
+    def prune(self, name: str, fingerprint: str) -> int:
+        """Supports discarding the stored values for the specified function name which
+        were stored for other fingerprints, such as before the function's code changed,
+        as well as any expired values, returning the number of values discarded."""
+
+        with self._connection() as connection:
+            cursor = connection.execute(
+                "DELETE FROM results WHERE (name = ? AND fingerprint != ?) "
+                "OR expires <= ?",
+                (name, fingerprint, time.time()),
+            )
+
+        return cursor.rowcount
+
+
+__all__ = [
+    "Store",
+    "SQLiteStore",
+    "fingerprint",
+]
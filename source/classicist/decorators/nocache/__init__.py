@@ -1,10 +1,50 @@
+from __future__ import annotations
+
 from classicist.logging import logger
+from classicist.inspector import unwrap
 
 logger = logger.getChild(__name__)
 
 
 def nocache(function: callable):
     """A no-cache decorator to specifically call out functions and properties that must
-    not be cached using the functools.cache decorator or similar."""
+    not be cached using the functools.cache decorator or similar. The decorator marks
+    the function via its `_classicist_nocache` attribute, which is honoured by the
+    library's own caching decorators, such as @memoize, which refuse to cache functions
+    marked as not cacheable, and which can be checked via the is_nocache() helper; as
+    before the marker was introduced, objects that cannot hold the marker, such as the
+    built-in functions, are returned unchanged, with a warning being logged instead."""
+
+    logger.debug("nocache(function: %s)", function)
+
+    # Properties cannot hold arbitrary attributes, so their getter is marked instead
+    thing = function.fget if isinstance(function, property) else function
+
+    try:
+        thing._classicist_nocache = True
+    except AttributeError:
+        logger.warning(
+            "The @nocache decorator cannot mark an object of type %s!", type(thing)
+        )
 
     return function
+
+
+def is_nocache(function: object) -> bool:
+    """The is_nocache() helper method can be used to determine if a function, method or
+    property has been marked as not cacheable, including if the marked function has
+    since been wrapped by other decorators that reference it via __wrapped__."""
+
+    if getattr(function, "_classicist_nocache", False) is True:
+        return True
+
+    try:
+        return getattr(unwrap(function), "_classicist_nocache", False) is True
+    except ValueError:
+        return False
+
+
+__all__ = [
+    "nocache",
+    "is_nocache",
+]
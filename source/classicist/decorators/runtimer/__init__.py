@@ -1,28 +1,110 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import wraps, partial
 from inspect import unwrap
-
-from classicist.logging import logger
+from random import random
+
+import inspect
+import threading
+import weakref
+
+from classicist.inspector import layers, locate, reference
+from classicist.logging import logger, tracing
+from classicist.decorators.runtimer.clock import (
+    Clock,
+    ManualClock,
+    clocks,
+    resolve,
+)
+from classicist.decorators.runtimer.histogram import Histogram
+from classicist.decorators.runtimer.statistics import (
+    Statistics,
+    summarise,
+)
+from classicist.decorators.runtimer.registry import (
+    Registry,
+    registry,
+    runtimers,
+    snapshot,
+    export_json,
+    export_openmetrics,
+)
+from classicist.decorators.runtimer.profiler import (
+    Profiler,
+    profiler,
+)
 
 logger = logger.getChild(__name__)
 
 
 class Runtimer(object):
-    """The Runtimer class times and tracks the runtime of function calls."""
+    """The Runtimer class times and tracks the runtime of function calls. Timestamps are
+    recorded as integer nanoseconds from the Runtimer's clock, which by default is the
+    monotonic `time.perf_counter_ns` clock, and are only converted into `datetime` and
+    `timedelta` values when the corresponding properties are accessed.
+
+    In addition to the most recent call's timestamps, the duration of every timed call is
+    recorded into a log-bucketed Histogram, so that the call count, the total, minimum,
+    maximum and mean call times, and percentiles such as the median or 99th percentile,
+    can be obtained for the function, using a bounded amount of memory regardless of how
+    many calls are made. Coroutine functions, generators and asynchronous generators are
+    also supported, with their durations including the time spent awaiting, or for the
+    generators, spanning the whole stream, with the time to the first item and count of
+    items produced also being recorded.
+
+    As a decorated function may be called concurrently from many threads, each thread
+    records its call times into its own Statistics, without taking any locks, and these
+    per-thread statistics are merged together whenever the statistics are read; those
+    of threads that have since finished are folded into a single Statistics instance
+    so that the number of instances held does not grow with thread churn.
+
+    For functions that are called so frequently that timing every call would add too
+    much overhead, the Runtimer can time just a sample of the calls, either a random
+    fraction of the calls via the `sample` property, or every nth call via the `every`
+    property, while still counting all of the calls, so that the statistics reflect
+    the sampled calls, and the total call time for all calls can be estimated."""
 
     _funcobj: callable = None
-    _started: datetime = None
-    _stopped: datetime = None
-
-    def __init__(self, function: callable):
+    _clock: Clock = None
+    _now: callable = None
+    _latest: tuple[int, int | None] = None
+    _precision: int = None
+    _local: threading.local = None
+    _lock: threading.Lock = None
+    _shards: list[tuple[weakref.ref, Statistics]] = None
+    _retired: Statistics = None
+    _mode: tuple[str, float | int] | None = None
+
+    def __init__(
+        self,
+        function: callable,
+        clock: Clock | str | callable = None,
+        precision: int = 6,
+        sample: float = None,
+        every: int = None,
+    ):
         """Supports instantiating an instance of the Runtimer class."""
 
         if not callable(function):
             raise TypeError("The 'function' argument must reference a callable!")
 
         self._funcobj = function
+        self._precision = precision
+        self._lock = threading.Lock()
+
+        self.clock = clock
+
+        registry.register(self)
+
+        if sample is not None and every is not None:
+            raise ValueError(
+                "The 'sample' and 'every' arguments cannot be specified together!"
+            )
+        elif sample is not None:
+            self.sample = sample
+        elif every is not None:
+            self.every = every
 
     def __str__(self) -> str:
         """Returns a string representation of the current Runtimer instance."""
@@ -34,68 +116,487 @@ class Runtimer(object):
 
         return f"<{self.__class__.__name__}(started: {self.started}, stopped: {self.stopped}, duration: {self.duration}) @ {hex(id(self))}>"
 
+    def __reduce__(self) -> tuple[callable, tuple[str, str]]:
+        """Supports pickling the Runtimer by reference, so that unpickling returns the
+        Runtimer of the timed function of the same module and qualified name within the
+        unpickling process; the timings recorded by each process remain its own."""
+
+        return (_located, reference(self._funcobj))
+
+    def _shard(self) -> Statistics:
+        """Creates and registers the Statistics for the calling thread; this is only done
+        on the thread's first recorded call, and is the only time the lock is taken."""
+
+        statistics = self._local.statistics = Statistics(precision=self._precision)
+
+        with self._lock:
+            self._shards.append((weakref.ref(threading.current_thread()), statistics))
+
+        return statistics
+
     def reset(self) -> Runtimer:
         """Supports resetting the Runtimer timing information."""
 
-        self._started = None
-        self._stopped = None
+        with self._lock:
+            self._latest = None
+
+            # Replacing the thread-local storage detaches every thread's statistics, so
+            # each thread will register new statistics on its next recorded call
+            self._local = threading.local()
+            self._shards = []
+            self._retired = Statistics(precision=self._precision)
 
         return self
 
+    def skip(self) -> bool:
+        """Supports determining if the current call should be skipped rather than timed
+        when the Runtimer is sampling calls, counting the call if it is to be skipped;
+        this is only called by the decorated function's wrapper when sampling is on."""
+
+        # The sampling mode is read once, as it may be changed concurrently by another
+        # thread; as the mode is replaced as a whole, the read is always consistent
+        if (mode := self._mode) is None:
+            return False
+
+        try:
+            statistics = self._local.statistics
+        except AttributeError:
+            statistics = self._shard()
+
+        if mode[0] == "every":
+            # Count the calls per thread so that the sampling remains deterministic
+            calls = statistics.successes.count + statistics.failures.count
+            if (calls + statistics.skipped + 1) % mode[1] == 0:
+                return False
+        elif random() < mode[1]:
+            return False
+
+        statistics.skipped += 1
+
+        return True
+
     def start(self) -> Runtimer:
-        """Supports starting the Runtimer timer by recording the current datetime."""
+        """Supports starting the Runtimer timer by recording the current timestamp; the
+        start() and stop() methods support manually timing sequential operations, while
+        calls to decorated functions are timed independently via the record() method."""
 
-        self._started = datetime.now()
-        self._stopped = None
+        self._latest = (self._now(), None)
 
         return self
 
     def stop(self) -> Runtimer:
-        """Supports stopping the Runtimer timer by recording the current datetime."""
+        """Supports stopping the Runtimer timer by recording the current timestamp."""
 
-        if self._started is None:
-            self._started = datetime.now()
-        self._stopped = datetime.now()
+        stopped = self._now()
+
+        if (latest := self._latest) is not None and latest[1] is None:
+            self.record(latest[0], stopped)
+        else:
+            self._latest = (stopped, stopped)
 
         return self
 
+    def record(self, started: int, stopped: int) -> None:
+        """Supports recording a call made to the function that started and stopped at
+        the specified timestamps, obtained from the Runtimer's clock; as the timestamps
+        are held by the caller, concurrent calls are each timed independently."""
+
+        try:
+            statistics = self._local.statistics
+        except AttributeError:
+            statistics = self._shard()
+
+        statistics.successes.record(stopped - started)
+
+        # A single assignment ensures the latest timestamps are always a matched pair
+        self._latest = (started, stopped)
+
+    def record_failure(
+        self,
+        started: int,
+        stopped: int,
+        exception: BaseException,
+    ) -> None:
+        """Supports recording a call made to the function that started and stopped at
+        the specified timestamps, which failed by raising the specified exception; the
+        durations of failed calls are recorded separately from those of successful calls
+        and the failures are counted by exception type."""
+
+        try:
+            statistics = self._local.statistics
+        except AttributeError:
+            statistics = self._shard()
+
+        statistics.failures.record(stopped - started)
+
+        kind: type = type(exception)
+
+        statistics.exceptions[kind] = statistics.exceptions.get(kind, 0) + 1
+
+        self._latest = (started, stopped)
+
+    def record_stream(
+        self,
+        started: int,
+        first: int | None,
+        stopped: int,
+        items: int,
+        exception: BaseException = None,
+    ) -> None:
+        """Supports recording a stream produced by a generator or asynchronous generator
+        that started and stopped at the specified timestamps, and which produced its first
+        item at the specified timestamp, if any items were produced, and which failed by
+        raising the specified exception, if an exception was raised."""
+
+        try:
+            statistics = self._local.statistics
+        except AttributeError:
+            statistics = self._shard()
+
+        if exception is None:
+            statistics.successes.record(stopped - started)
+        else:
+            statistics.failures.record(stopped - started)
+
+            kind: type = type(exception)
+
+            statistics.exceptions[kind] = statistics.exceptions.get(kind, 0) + 1
+
+        if first is not None:
+            statistics.first.record(first - started)
+
+        statistics.items += items
+
+        self._latest = (started, stopped)
+
+    def merge(self, other: Runtimer | Histogram) -> Runtimer:
+        """Supports merging the call time statistics gathered by another Runtimer, or
+        recorded in a Histogram, into the statistics gathered by this Runtimer, such as
+        to combine the statistics gathered for a function by several processes."""
+
+        if isinstance(other, Runtimer):
+            other = other.statistics
+        elif isinstance(other, Histogram):
+            histogram, other = other, Statistics(precision=other.precision)
+            other.successes.merge(histogram)
+        elif not isinstance(other, Statistics):
+            raise TypeError(
+                "The 'other' argument must reference a Runtimer, Statistics or Histogram instance!"
+            )
+
+        with self._lock:
+            self._retired.merge(other)
+
+        return self
+
+    def snapshot(self, statistics: Statistics = None) -> dict[str, object]:
+        """Supports obtaining a snapshot of the function's call time statistics as a
+        dictionary, with times reported in seconds, from a single consistent copy of
+        the statistics, so that the values do not change while being reported. The
+        optional `statistics` argument allows the snapshot to be taken of statistics
+        merged from several Runtimer instances that time the same function."""
+
+        if statistics is None:
+            statistics = self.statistics
+        elif not isinstance(statistics, Statistics):
+            raise TypeError(
+                "The 'statistics' argument, if specified, must reference a Statistics instance!"
+            )
+
+        snapshot: dict[str, object] = {
+            "function": self.qualname,
+            "module": self.module,
+            "clock": self._clock.name,
+            **summarise(statistics.durations),
+            "calls": statistics.durations.count + statistics.skipped,
+            "skipped": statistics.skipped,
+            "estimated_total": statistics.estimated_total / 1e9,
+            "successes": summarise(statistics.successes),
+            "failures": summarise(statistics.failures),
+            "errors": statistics.errors,
+        }
+
+        # Report the stream statistics for generators and asynchronous generators
+        if statistics.first.count > 0 or statistics.items > 0:
+            snapshot["items"] = statistics.items
+            snapshot["first"] = summarise(statistics.first)
+
+        return snapshot
+
+    def percentile(self, quantile: float) -> float:
+        """Supports returning the estimated call time in seconds at the quantile, such
+        as 0.5 for the median or 0.99 for the 99th percentile, of all timed calls."""
+
+        return (self.histogram.percentile(quantile) or 0) / 1e9
+
     @property
     def function(self) -> callable:
         """Supports returning the Runtimer instance's associated function/method."""
 
         return self._funcobj
 
+    @property
+    def module(self) -> str | None:
+        """Supports returning the name of the module the function was defined in."""
+
+        return getattr(self._funcobj, "__module__", None)
+
+    @property
+    def qualname(self) -> str:
+        """Supports returning the qualified name of the function within its module."""
+
+        return getattr(self._funcobj, "__qualname__", None) or repr(self._funcobj)
+
+    @property
+    def name(self) -> str:
+        """Supports returning the fully qualified name of the function, comprised of the
+        name of its module and its qualified name within the module."""
+
+        if module := self.module:
+            return f"{module}.{self.qualname}"
+
+        return self.qualname
+
+    @property
+    def clock(self) -> Clock:
+        """Supports returning the Clock instance used by the Runtimer for timestamps."""
+
+        return self._clock
+
+    @clock.setter
+    def clock(self, clock: Clock | str | callable):
+        """Supports changing the Clock instance used by the Runtimer for timestamps; as
+        timings from different clocks are not comparable, this resets the Runtimer."""
+
+        self._clock = resolve(clock)
+        self._now = self._clock.function
+
+        self.reset()
+
+    @property
+    def sample(self) -> float | None:
+        """Supports returning the fraction of calls that are randomly sampled, if set."""
+
+        if (mode := self._mode) is not None and mode[0] == "sample":
+            return mode[1]
+
+    @sample.setter
+    def sample(self, sample: float | None):
+        """Supports changing the fraction of calls that are randomly sampled and timed,
+        which takes effect immediately; the value None or 1.0 results in all calls being
+        timed. Setting the sampling fraction replaces any `every` sampling interval."""
+
+        if sample is None:
+            pass
+        elif not isinstance(sample, (int, float)) or isinstance(sample, bool):
+            raise TypeError("The 'sample' argument must have a numeric value!")
+        elif not 0.0 < sample <= 1.0:
+            raise ValueError(
+                "The 'sample' argument must have a value greater than 0.0 and up to 1.0!"
+            )
+
+        # The mode is replaced in a single assignment, so concurrent calls never observe
+        # a partially changed mode, such as one with neither a fraction nor an interval
+        self._mode = None if sample is None else ("sample", sample)
+
+    @property
+    def every(self) -> int | None:
+        """Supports returning the interval at which calls are sampled, if set."""
+
+        if (mode := self._mode) is not None and mode[0] == "every":
+            return mode[1]
+
+    @every.setter
+    def every(self, every: int | None):
+        """Supports changing the interval at which calls are sampled and timed, so that
+        every nth call is timed, which takes effect immediately; the value None or 1 will
+        result in all calls being timed. Setting the sampling interval replaces any random
+        sampling fraction."""
+
+        if every is None:
+            pass
+        elif not isinstance(every, int) or isinstance(every, bool):
+            raise TypeError("The 'every' argument must have an integer value!")
+        elif not every >= 1:
+            raise ValueError("The 'every' argument must have a positive value!")
+
+        # The mode is replaced in a single assignment, so concurrent calls never observe
+        # a partially changed mode, such as one with neither a fraction nor an interval
+        self._mode = None if every is None else ("every", every)
+
     @property
     def started(self) -> datetime:
         """Supports returning the started datetime or the current time as a fallback."""
 
-        return self._started or datetime.now()
+        if (latest := self._latest) is None:
+            return datetime.now()
+
+        return self._clock.datetime(latest[0])
 
     @property
     def stopped(self) -> datetime:
         """Supports returning the stopped datetime or the current time as a fallback."""
 
-        return self._stopped or datetime.now()
+        if (latest := self._latest) is None or latest[1] is None:
+            return datetime.now()
+
+        return self._clock.datetime(latest[1])
+
+    @property
+    def nanoseconds(self) -> int:
+        """Supports returning the decorated function's call time in nanoseconds."""
+
+        if (latest := self._latest) is None or latest[1] is None:
+            return 0
+
+        return latest[1] - latest[0]
 
     @property
     def timedelta(self) -> timedelta:
         """Supports returning the timedelta for the decorated function's call time."""
 
-        if isinstance(self._started, datetime) and isinstance(self._stopped, datetime):
-            return self._stopped - self._started
-        else:
-            return timedelta(0)
+        return timedelta(microseconds=self.nanoseconds / 1e3)
 
     @property
     def duration(self) -> float:
         """Supports returning the duration of the decorated function's call time."""
 
-        return self.timedelta.total_seconds()
+        return self.nanoseconds / 1e9
+
+    @property
+    def statistics(self) -> Statistics:
+        """Supports returning the function's recorded call time statistics, merged from
+        the statistics recorded by each of the threads that have called the function."""
+
+        with self._lock:
+            shards: list[tuple[weakref.ref, Statistics]] = []
+
+            for thread_ref, statistics in self._shards:
+                # Fold the statistics of finished threads into the retired statistics, as
+                # those threads can no longer record any further calls
+                if (thread := thread_ref()) is None or not thread.is_alive():
+                    self._retired.merge(statistics)
+                else:
+                    shards.append((thread_ref, statistics))
+
+            self._shards = shards
+
+            merged = self._retired.snapshot()
+
+            for _, statistics in shards:
+                merged.merge(statistics)
+
+        return merged
+
+    @property
+    def histogram(self) -> Histogram:
+        """Supports returning a Histogram of the function's recorded call times in
+        nanoseconds, merged from each of the threads that have called the function."""
+
+        return self.statistics.durations
+
+    @property
+    def failures(self) -> int:
+        """Supports returning the number of calls to the function that raised exceptions."""
+
+        return self.statistics.failures.count
+
+    @property
+    def errors(self) -> dict[str, int]:
+        """Supports returning the number of failed calls keyed by exception type name."""
+
+        return self.statistics.errors
+
+    @property
+    def items(self) -> int:
+        """Supports returning the number of items produced by generator functions."""
+
+        return self.statistics.items
+
+    @property
+    def count(self) -> int:
+        """Supports returning the number of timed calls made to the function."""
+
+        return self.histogram.count
+
+    @property
+    def calls(self) -> int:
+        """Supports returning the number of calls made to the function, including those
+        that were not timed when the Runtimer is sampling calls."""
+
+        statistics = self.statistics
+
+        return statistics.durations.count + statistics.skipped
+
+    @property
+    def estimated_total(self) -> float:
+        """Supports returning the estimated total call time in seconds of all calls made
+        to the function, extrapolated from the timed calls when sampling, which will be
+        the same as the total when all calls are timed."""
+
+        return self.statistics.estimated_total / 1e9
+
+    @property
+    def total(self) -> float:
+        """Supports returning the total call time in seconds of all timed calls."""
+
+        return self.histogram.total / 1e9
 
+    @property
+    def minimum(self) -> float:
+        """Supports returning the shortest call time in seconds of all timed calls."""
+
+        return (self.histogram.minimum or 0) / 1e9
+
+    @property
+    def maximum(self) -> float:
+        """Supports returning the longest call time in seconds of all timed calls."""
 
-def runtimer(function: callable) -> callable:
+        return (self.histogram.maximum or 0) / 1e9
+
+    @property
+    def mean(self) -> float:
+        """Supports returning the mean call time in seconds of all timed calls."""
+
+        return self.histogram.mean / 1e9
+
+
+def runtimer(
+    function: callable = None,
+    /,
+    clock: Clock | str | callable = None,
+    sample: float = None,
+    every: int = None,
+) -> callable:
     """The runtimer decorator method creates an instance of the Runtimer class for the
-    specified function, allowing calls to the function to be timed."""
+    specified function, allowing calls to the function to be timed. The decorator can be
+    used without arguments, or with the optional `clock` keyword argument to specify the
+    clock used for timing, which may be the name of one of the available clocks, such as
+    'perf_counter' (the default), 'monotonic', 'process_time' or 'thread_time', a Clock
+    instance, or a callable that returns the current time as integer nanoseconds.
+
+    The decorator supports regular functions and methods, as well as coroutine functions,
+    for which the time spent awaiting is included, and generators and asynchronous
+    generators, for which the duration spans from the first request for an item through
+    to the exhaustion or closure of the stream, with the time taken to produce the first
+    item and the number of items produced also being recorded. Calls that raise are timed
+    too, with their durations recorded separately from those of the successful calls,
+    and with the number of failures being counted by exception type.
+
+    To limit the overhead of timing functions that are called very frequently, the
+    optional `sample` keyword argument can be used to time a random fraction of calls,
+    such as 0.01 to time 1% of calls, or the optional `every` keyword argument can be
+    used to time every nth call, such as 100 to time every hundredth call; all calls are
+    still counted, and the sampling can be changed later via the Runtimer's properties.
+    """
+
+    if function is None:
+        return partial(runtimer, clock=clock, sample=sample, every=every)
+
+    if sample is not None and every is not None:
+        raise ValueError(
+            "The 'sample' and 'every' arguments cannot be specified together!"
+        )
 
     if not callable(function):
         raise TypeError("The 'function' argument must reference a callable!")
@@ -106,25 +607,211 @@ def runtimer(function: callable) -> callable:
     if isinstance(
         _runtimer := getattr(function, "_classicist_runtimer", None), Runtimer
     ):
-        _runtimer.reset()
+        if clock is None:
+            _runtimer.reset()
+        else:
+            _runtimer.clock = clock  # Changing the clock also resets the Runtimer
+
+        if sample is not None:
+            _runtimer.sample = sample
+        elif every is not None:
+            _runtimer.every = every
     else:
         # Otherwise, create a new instance and associate it with the function
-        _runtimer = function._classicist_runtimer = Runtimer(function)
-
-    @wraps(function)
-    def wrapper(*args, **kwargs):
-        logger.debug(
-            "runtimer(function: %s).wrapper(args: %s, kwargs: %s)",
+        _runtimer = function._classicist_runtimer = Runtimer(
             function,
-            args,
-            kwargs,
+            clock=clock,
+            sample=sample,
+            every=every,
         )
 
-        _runtimer.start()
-        result = function(*args, **kwargs)
-        _runtimer.stop()
+    if inspect.iscoroutinefunction(function):
+
+        @wraps(function)
+        async def wrapper(*args, **kwargs):
+            if tracing._enabled:
+                logger.debug(
+                    "runtimer(function: %s).wrapper(args: %s, kwargs: %s)",
+                    function,
+                    args,
+                    kwargs,
+                )
+
+            if _runtimer._mode and _runtimer.skip():
+                return await function(*args, **kwargs)
+
+            if profiler._enabled:
+                return await profiler.acall(_runtimer, function, args, kwargs)
+
+            # The timing includes any time spent awaiting, not just creating the coroutine
+            started = _runtimer._now()
+
+            try:
+                result = await function(*args, **kwargs)
+            except BaseException as exception:
+                # Failed calls, including cancellations, such as due to timeouts, are
+                # recorded separately from the successful calls
+                _runtimer.record_failure(started, _runtimer._now(), exception)
+                raise
+
+            _runtimer.record(started, _runtimer._now())
+
+            return result
+
+    elif inspect.isasyncgenfunction(function):
+
+        @wraps(function)
+        async def wrapper(*args, **kwargs):
+            if tracing._enabled:
+                logger.debug(
+                    "runtimer(function: %s).wrapper(args: %s, kwargs: %s)",
+                    function,
+                    args,
+                    kwargs,
+                )
+
+            now: callable = _runtimer._now
+
+            generator = function(*args, **kwargs)
+
+            # Streams that are skipped when sampling are still delegated to, but not timed
+            sampled: bool = not (_runtimer._mode and _runtimer.skip())
+
+            started: int = now()
+            first: int = None
+            items: int = 0
+            failure: BaseException = None
+
+            # Delegate to the wrapped asynchronous generator, passing through any sent or
+            # thrown values, as `yield from` is unavailable for asynchronous generators
+            try:
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+
+                while True:
+                    if first is None:
+                        first = now()
+
+                    items += 1
+
+                    try:
+                        value = yield item
+                    except GeneratorExit:
+                        await generator.aclose()
+                        raise
+                    except BaseException as exception:
+                        try:
+                            item = await generator.athrow(exception)
+                        except StopAsyncIteration:
+                            return
+                    else:
+                        try:
+                            item = await generator.asend(value)
+                        except StopAsyncIteration:
+                            return
+            except GeneratorExit:
+                raise  # The closure of a stream by its consumer is not a failure
+            except BaseException as exception:
+                failure = exception
+                raise
+            finally:
+                if sampled:
+                    _runtimer.record_stream(started, first, now(), items, failure)
+
+    elif inspect.isgeneratorfunction(function):
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if tracing._enabled:
+                logger.debug(
+                    "runtimer(function: %s).wrapper(args: %s, kwargs: %s)",
+                    function,
+                    args,
+                    kwargs,
+                )
+
+            now: callable = _runtimer._now
+
+            generator = function(*args, **kwargs)
+
+            if _runtimer._mode and _runtimer.skip():
+                return (yield from generator)
+
+            started: int = now()
+            first: int = None
+            items: int = 0
+            failure: BaseException = None
+
+            # Delegate to the wrapped generator, passing through any sent or thrown values,
+            # as per `yield from`, while counting the items and timing the first item
+            try:
+                try:
+                    item = next(generator)
+                except StopIteration as stop:
+                    return stop.value
+
+                while True:
+                    if first is None:
+                        first = now()
+
+                    items += 1
+
+                    try:
+                        value = yield item
+                    except GeneratorExit:
+                        generator.close()
+                        raise
+                    except BaseException as exception:
+                        try:
+                            item = generator.throw(exception)
+                        except StopIteration as stop:
+                            return stop.value
+                    else:
+                        try:
+                            item = generator.send(value)
+                        except StopIteration as stop:
+                            return stop.value
+            except GeneratorExit:
+                raise  # The closure of a stream by its consumer is not a failure
+            except BaseException as exception:
+                failure = exception
+                raise
+            finally:
+                _runtimer.record_stream(started, first, now(), items, failure)
+
+    else:
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if tracing._enabled:
+                logger.debug(
+                    "runtimer(function: %s).wrapper(args: %s, kwargs: %s)",
+                    function,
+                    args,
+                    kwargs,
+                )
+
+            if _runtimer._mode and _runtimer.skip():
+                return function(*args, **kwargs)
+
+            if profiler._enabled:
+                return profiler.call(_runtimer, function, args, kwargs)
+
+            # The timestamps are held locally so concurrent calls are timed independently
+            started = _runtimer._now()
 
-        return result
+            try:
+                result = function(*args, **kwargs)
+            except BaseException as exception:
+                # Failed calls are recorded separately from the successful calls
+                _runtimer.record_failure(started, _runtimer._now(), exception)
+                raise
+
+            _runtimer.record(started, _runtimer._now())
+
+            return result
 
     return wrapper
 
@@ -132,7 +819,8 @@ def runtimer(function: callable) -> callable:
 def runtime(function: callable) -> Runtimer | None:
     """The runtime helper method can be used to obtain the Runtimer instance for the
     specified function, if one is present, allowing access to the most recent function
-    call start and stop time stamps and call duration."""
+    call start and stop time stamps and call duration, as well as to the call count and
+    call time statistics, including percentiles, gathered across all timed calls."""
 
     if not callable(function):
         raise TypeError("The 'function' argument must reference a callable!")
@@ -147,6 +835,23 @@ def runtime(function: callable) -> Runtimer | None:
         return _runtimer
 
 
+def _located(module: str, qualname: str) -> Runtimer:
+    """Supports obtaining the Runtimer of the timed function located by its module and
+    qualified name, such as when a Runtimer that was pickled by reference is unpickled.
+    """
+
+    function: callable = locate(module, qualname)
+
+    # Class and static methods are unwrapped via __func__, which all versions support
+    for layer in layers(getattr(function, "__func__", function)):
+        if isinstance(
+            _runtimer := getattr(layer, "_classicist_runtimer", None), Runtimer
+        ):
+            return _runtimer
+
+    raise AttributeError(f"Cannot locate the Runtimer of '{module}.{qualname}'!")
+
+
 def has_runtimer(function: callable) -> bool:
     """The has_runtimer helper method can be used to determine if the specified function
     has an associated Runtimer instance or not, returning a boolean to indicate this."""
@@ -161,5 +866,18 @@ __all__ = [
     "Runtimer",
     "runtimer",
     "runtime",
-    "hasruntimer",
+    "has_runtimer",
+    "Clock",
+    "ManualClock",
+    "clocks",
+    "Histogram",
+    "Statistics",
+    "Registry",
+    "registry",
+    "runtimers",
+    "snapshot",
+    "export_json",
+    "export_openmetrics",
+    "Profiler",
+    "profiler",
 ]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+
+from datetime import datetime, timedelta
+
+import time
+
+logger = logger.getChild(__name__)
+
+
+class Clock(object):
+    """The Clock class wraps a function that returns integer nanosecond timestamps, such
+    as `time.perf_counter_ns`, so that the Runtimer class can record timestamps as plain
+    integers on its hot path, deferring any conversion to `datetime` and `timedelta`
+    values until those values are actually requested.
+
+    As monotonic and CPU-time clocks have an undefined reference point, each Clock takes
+    an anchor reading of the wall clock and of its own clock when it is created, which
+    is used to lazily convert its timestamps into approximate wall-clock `datetime` values;
+    for the CPU-time clocks, only the durations between timestamps are meaningful."""
+
+    _name: str = None
+    _function: callable = None
+    _anchor: tuple[int, int] = None
+
+    def __init__(self, name: str, function: callable):
+        """Supports instantiating an instance of the Clock class."""
+
+        if not isinstance(name, str):
+            raise TypeError("The 'name' argument must have a string value!")
+
+        if not callable(function):
+            raise TypeError("The 'function' argument must reference a callable!")
+
+        self._name = name
+        self._function = function
+        self._anchor = (time.time_ns(), function())
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Clock instance."""
+
+        return f"<{self.__class__.__name__}(name: {self.name})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Clock instance."""
+
+        return f"<{self.__class__.__name__}(name: {self.name}) @ {hex(id(self))}>"
+
+    def __call__(self) -> int:
+        """Supports obtaining the current time from the clock in nanoseconds."""
+
+        return self._function()
+
+    @property
+    def name(self) -> str:
+        """Supports returning the Clock instance's name."""
+
+        return self._name
+
+    @property
+    def function(self) -> callable:
+        """Supports returning the Clock instance's underlying timestamp function, which
+        can be called directly on hot paths to avoid the cost of calling the Clock."""
+
+        return self._function
+
+    def datetime(self, timestamp: int) -> datetime:
+        """Supports converting a timestamp from the clock into a wall-clock datetime."""
+
+        wall, base = self._anchor
+
+        # Integer arithmetic avoids the floating point rounding of large timestamps
+        seconds, nanoseconds = divmod(wall + (timestamp - base), 1_000_000_000)
+
+        return datetime.fromtimestamp(seconds) + timedelta(
+            microseconds=nanoseconds // 1_000
+        )
+
+
+class ManualClock(Clock):
+    """The ManualClock class provides a clock whose time only changes when it is advanced
+    or set explicitly, allowing deterministic timings to be recorded in tests."""
+
+    _now: int = 0
+
+    def __init__(self, now: int = 0, name: str = "manual"):
+        """Supports instantiating an instance of the ManualClock class."""
+
+        if not isinstance(now, int):
+            raise TypeError("The 'now' argument must have an integer value!")
+
+        self._now = now
+
+        super().__init__(name=name, function=self.__call__)
+
+    def __call__(self) -> int:
+        """Supports obtaining the current time from the clock in nanoseconds."""
+
+        return self._now
+
+    def advance(self, nanoseconds: int) -> ManualClock:
+        """Supports advancing the clock's current time by the specified nanoseconds."""
+
+        if not isinstance(nanoseconds, int):
+            raise TypeError("The 'nanoseconds' argument must have an integer value!")
+        elif nanoseconds < 0:
+            raise ValueError("The 'nanoseconds' argument must not be negative!")
+
+        self._now += nanoseconds
+
+        return self
+
+    def set(self, now: int) -> ManualClock:
+        """Supports setting the clock's current time to the specified nanoseconds."""
+
+        if not isinstance(now, int):
+            raise TypeError("The 'now' argument must have an integer value!")
+
+        self._now = now
+
+        return self
+
+
+# The named clocks that are available for use by the Runtimer class; perf_counter is the
+# default as it offers the highest available resolution and is unaffected by changes to
+# the system's wall clock, unlike datetime.now() which can step forwards and backwards:
+clocks: dict[str, Clock] = {
+    "perf_counter": Clock("perf_counter", time.perf_counter_ns),
+    "monotonic": Clock("monotonic", time.monotonic_ns),
+    "process_time": Clock("process_time", time.process_time_ns),
+    "thread_time": Clock("thread_time", time.thread_time_ns),
+}
+
+
+def resolve(clock: Clock | str | callable = None) -> Clock:
+    """The resolve helper method resolves the specified clock name, Clock instance or
+    timestamp function into a Clock instance, using perf_counter by default."""
+
+    if clock is None:
+        return clocks["perf_counter"]
+    elif isinstance(clock, Clock):
+        return clock
+    elif isinstance(clock, str):
+        if not clock in clocks:
+            raise ValueError(
+                "The 'clock' argument, if specified as a string, must reference one of the named clocks: %s!"
+                % (", ".join(clocks))
+            )
+        return clocks[clock]
+    elif callable(clock):
+        return Clock(getattr(clock, "__name__", "custom"), clock)
+    else:
+        raise TypeError(
+            "The 'clock' argument, if specified, must reference a Clock instance, a clock name, or a callable!"
+        )
+
+
+__all__ = [
+    "Clock",
+    "ManualClock",
+    "clocks",
+    "resolve",
+]
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+
+import math
+
+logger = logger.getChild(__name__)
+
+
+class Histogram(object):
+    """The Histogram class records the distribution of integer values, such as call times
+    in nanoseconds, using logarithmically sized buckets in the style of HDR histograms.
+    Values are grouped into buckets by their power of two, with each power of two being
+    further divided into a fixed number of linear sub-buckets, determined by the number
+    of bits of precision, so that the relative error of any reported value is bounded by
+    the precision, while the number of buckets, and thus the memory used, remains bounded
+    by the range of recorded values rather than by the number of values recorded.
+
+    With the default precision of 6 bits, each power of two is divided into 32 buckets,
+    giving a relative error of at most 1/64 (about 1.6%) for reported percentile values,
+    and, as a value range of nanoseconds through to hours spans about 42 powers of two,
+    at most a little over 1,300 buckets will ever be held, regardless of call volume."""
+
+    _precision: int = None
+    _linear: int = None
+    _half: int = None
+    _counts: dict[int, int] = None
+    _count: int = 0
+    _total: int = 0
+    _minimum: int = None
+    _maximum: int = None
+
+    def __init__(self, precision: int = 6):
+        """Supports instantiating an instance of the Histogram class."""
+
+        if not isinstance(precision, int):
+            raise TypeError("The 'precision' argument must have an integer value!")
+        elif not 2 <= precision <= 16:
+            raise ValueError("The 'precision' argument must be between 2 and 16!")
+
+        self._precision = precision
+        self._linear = 1 << precision
+        self._half = 1 << (precision - 1)
+
+        self.reset()
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Histogram instance."""
+
+        return f"<{self.__class__.__name__}(count: {self.count}, minimum: {self.minimum}, maximum: {self.maximum})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Histogram instance."""
+
+        return f"<{self.__class__.__name__}(count: {self.count}, minimum: {self.minimum}, maximum: {self.maximum}) @ {hex(id(self))}>"
+
+    def __len__(self) -> int:
+        """Returns the number of values recorded by the current Histogram instance."""
+
+        return self._count
+
+    @property
+    def precision(self) -> int:
+        """Supports returning the number of bits of precision used by the Histogram."""
+
+        return self._precision
+
+    @property
+    def count(self) -> int:
+        """Supports returning the number of values recorded by the Histogram."""
+
+        return self._count
+
+    @property
+    def total(self) -> int:
+        """Supports returning the sum of the values recorded by the Histogram."""
+
+        return self._total
+
+    @property
+    def minimum(self) -> int | None:
+        """Supports returning the smallest value recorded by the Histogram, if any."""
+
+        return self._minimum
+
+    @property
+    def maximum(self) -> int | None:
+        """Supports returning the largest value recorded by the Histogram, if any."""
+
+        return self._maximum
+
+    @property
+    def mean(self) -> float:
+        """Supports returning the mean of the values recorded by the Histogram."""
+
+        if self._count == 0:
+            return 0.0
+
+        return self._total / self._count
+
+    @property
+    def buckets(self) -> list[tuple[int, int, int]]:
+        """Supports returning the populated buckets as a list of (lower, upper, count)
+        tuples, sorted by value, where the lower and upper bounds are inclusive."""
+
+        return [
+            (*self._bounds(index), count)
+            for index, count in sorted(self._counts.items())
+        ]
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Returns the inclusive lower and upper value bounds of the specified bucket."""
+
+        if index < self._linear:
+            return (index, index)
+
+        shift = (index // self._half) - 1
+        mantissa = index - (shift * self._half)
+
+        return (mantissa << shift, ((mantissa + 1) << shift) - 1)
+
+    def record(self, value: int) -> Histogram:
+        """Supports recording the specified non-negative integer value."""
+
+        if value < 0:
+            value = 0
+
+        # Values below the linear limit have their own buckets; larger values are placed
+        # into one of the sub-buckets for their power of two, each of which are indexed
+        # after those of the preceding powers of two, found via the value's bit length:
+        if value < self._linear:
+            index = value
+        else:
+            shift = value.bit_length() - self._precision
+            index = (shift * self._half) + (value >> shift)
+
+        # The minimum and maximum are updated before the count, so that a reader merging
+        # the histogram concurrently, which checks the count, finds them already set
+        if self._minimum is None or value < self._minimum:
+            self._minimum = value
+        if self._maximum is None or value > self._maximum:
+            self._maximum = value
+
+        counts = self._counts
+        counts[index] = counts.get(index, 0) + 1
+
+        self._count += 1
+        self._total += value
+
+        return self
+
+    def percentile(self, quantile: float) -> int | None:
+        """Supports returning the estimated value at the specified quantile, which must
+        be specified as a value between 0.0 and 1.0, such that 0.99 returns the value at
+        or below which 99% of the recorded values fall; the estimate is the midpoint of
+        the bucket in which the quantile falls, clamped to the recorded value range."""
+
+        if not isinstance(quantile, (int, float)):
+            raise TypeError("The 'quantile' argument must have a numeric value!")
+        elif not 0.0 <= quantile <= 1.0:
+            raise ValueError("The 'quantile' argument must be between 0.0 and 1.0!")
+
+        if self._count == 0:
+            return None
+        elif quantile == 0.0:
+            return self._minimum
+        elif quantile == 1.0:
+            return self._maximum
+
+        # The rank of the value at the quantile, rounded up, so that at least one is used
+        rank = max(1, math.ceil(round(quantile * self._count, 9)))
+
+        cumulative = 0
+
+        for index, count in sorted(self._counts.items()):
+            if (cumulative := cumulative + count) >= rank:
+                lower, upper = self._bounds(index)
+                return min(max((lower + upper) // 2, self._minimum), self._maximum)
+
+        return self._maximum
+
+    def merge(self, other: Histogram) -> Histogram:
+        """Supports merging the values recorded by another Histogram into this one."""
+
+        if not isinstance(other, Histogram):
+            raise TypeError("The 'other' argument must reference a Histogram instance!")
+        elif not other._precision == self._precision:
+            raise ValueError(
+                "The 'other' Histogram must have the same precision as this Histogram!"
+            )
+
+        if other._count == 0:
+            return self
+
+        counts = self._counts
+
+        for index, count in other._counts.copy().items():
+            counts[index] = counts.get(index, 0) + count
+
+        self._count += other._count
+        self._total += other._total
+
+        # The other histogram may be recording values concurrently, so its minimum and
+        # maximum are read once, and are skipped if they have not yet been set
+        if (minimum := other._minimum) is not None:
+            if self._minimum is None or minimum < self._minimum:
+                self._minimum = minimum
+        if (maximum := other._maximum) is not None:
+            if self._maximum is None or maximum > self._maximum:
+                self._maximum = maximum
+
+        return self
+
+    def reset(self) -> Histogram:
+        """Supports resetting the Histogram, discarding all of the recorded values."""
+
+        self._counts = {}
+        self._count = 0
+        self._total = 0
+        self._minimum = None
+        self._maximum = None
+
+        return self
+
+    def snapshot(self) -> Histogram:
+        """Supports taking an independent copy of the Histogram's current state."""
+
+        return self.__class__(precision=self._precision).merge(self)
+
+
+__all__ = [
+    "Histogram",
+]
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+
+import contextvars
+import threading
+import weakref
+
+logger = logger.getChild(__name__)
+
+
+class Node(object):
+    """The Node class represents a call path within the Profiler's call tree, identified
+    by the fully qualified names of the timed functions along the path from the root."""
+
+    __slots__ = (
+        "name",
+        "path",
+        "children",
+        "lock",
+    )
+
+    def __init__(self, name: str = None, parent: Node = None):
+        """Supports instantiating an instance of the Node class."""
+
+        self.name: str = name
+        self.path: tuple[str, ...] = (*parent.path, name) if parent else ()
+        self.children: dict[str, Node] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Node instance."""
+
+        return f"<{self.__class__.__name__}(path: {';'.join(self.path)})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Node instance."""
+
+        return f"<{self.__class__.__name__}(path: {';'.join(self.path)}) @ {hex(id(self))}>"
+
+    def child(self, name: str) -> Node:
+        """Returns the child node for the specified function name, creating it if needed;
+        the lock is only taken the first time that a call path is seen."""
+
+        try:
+            return self.children[name]
+        except KeyError:
+            with self.lock:
+                if (node := self.children.get(name)) is None:
+                    node = self.children[name] = Node(name=name, parent=self)
+
+            return node
+
+
+class Profiler(object):
+    """The Profiler class builds a call tree from calls made to @runtimer decorated
+    functions and coroutine functions, tracking which timed functions were called from
+    within other timed functions, and accumulating the number of calls as well as the
+    inclusive and exclusive time spent along each call path, where the exclusive time
+    is the time spent within a function outside of any timed functions it called.
+
+    The current call path is tracked via a context variable, so that each thread and
+    each asyncio task follows its own path, with tasks inheriting the path from which
+    they were created; for concurrently awaited tasks, the time spent in child calls
+    may overlap, so exclusive times are floored at zero. The times are accumulated per
+    thread without locking, and merged when read, as per the Runtimer statistics.
+
+    The Profiler is disabled by default, and when disabled adds only a single attribute
+    check to each timed call; once enabled, via the `enable()` method, the call tree is
+    built from calls timed from then on, and can be exported as collapsed stacks, for
+    use with flame graph tools, via the `collapsed()` method. Generators and asynchronous
+    generators do not take part in the call tree, as their bodies run in the context of
+    their consumer, so any timed calls they make are attributed to the consumer's path.
+    """
+
+    _enabled: bool = False
+    _root: Node = None
+    _current: contextvars.ContextVar = None
+    _local: threading.local = None
+    _lock: threading.Lock = None
+    _shards: list[tuple[weakref.ref, dict[Node, list[int]]]] = None
+    _retired: dict[Node, list[int]] = None
+
+    def __init__(self):
+        """Supports instantiating an instance of the Profiler class."""
+
+        self._current = contextvars.ContextVar(f"classicist.profiler.{id(self)}")
+        self._lock = threading.Lock()
+
+        self.reset()
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Profiler instance."""
+
+        return f"<{self.__class__.__name__}(enabled: {self._enabled})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Profiler instance."""
+
+        return (
+            f"<{self.__class__.__name__}(enabled: {self._enabled}) @ {hex(id(self))}>"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Supports returning whether the Profiler is currently enabled."""
+
+        return self._enabled
+
+    def enable(self) -> Profiler:
+        """Supports enabling the Profiler, so that it builds the call tree from timed
+        calls made from now on."""
+
+        self._enabled = True
+
+        return self
+
+    def disable(self) -> Profiler:
+        """Supports disabling the Profiler; the call tree built so far is retained."""
+
+        self._enabled = False
+
+        return self
+
+    def reset(self) -> Profiler:
+        """Supports resetting the Profiler, discarding the call tree built so far."""
+
+        with self._lock:
+            self._root = Node()
+            self._local = threading.local()
+            self._shards = []
+            self._retired = {}
+
+        return self
+
+    def _totals(self) -> dict[Node, list[int]]:
+        """Creates and registers the call path totals for the calling thread."""
+
+        totals = self._local.totals = {}
+
+        with self._lock:
+            self._shards.append((weakref.ref(threading.current_thread()), totals))
+
+        return totals
+
+    def enter(self, runtimer: object) -> tuple[list, contextvars.Token]:
+        """Supports entering a call to the function timed by the specified Runtimer,
+        making its call path the current call path; the returned frame and token must
+        be passed to the `exit()` method once the call has completed."""
+
+        parent = self._current.get(None)
+
+        node = (parent[0] if parent else self._root).child(runtimer.name)
+
+        # The frame holds the node and accumulates the time spent in any child calls
+        frame = [node, 0]
+
+        return (frame, self._current.set(frame))
+
+    def exit(self, frame: list, token: contextvars.Token, elapsed: int) -> None:
+        """Supports exiting a call entered via the `enter()` method, which took the
+        specified number of nanoseconds, restoring the parent call path as current."""
+
+        self._current.reset(token)
+
+        if (parent := self._current.get(None)) is not None:
+            parent[1] += elapsed
+
+        try:
+            totals = self._local.totals
+        except AttributeError:
+            totals = self._totals()
+
+        if (entry := totals.get(node := frame[0])) is None:
+            entry = totals[node] = [0, 0, 0]
+
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += max(0, elapsed - frame[1])
+
+    def call(
+        self,
+        runtimer: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports calling the specified function, timed by the specified Runtimer,
+        while tracking the call within the call tree."""
+
+        now: callable = runtimer._now
+
+        frame, token = self.enter(runtimer)
+
+        started: int = now()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as exception:
+            runtimer.record_failure(started, stopped := now(), exception)
+            raise
+        else:
+            runtimer.record(started, stopped := now())
+        finally:
+            self.exit(frame, token, stopped - started)
+
+        return result
+
+    async def acall(
+        self,
+        runtimer: object,
+        function: callable,
+        args: tuple,
+        kwargs: dict,
+    ) -> object:
+        """Supports awaiting the specified coroutine function, timed by the specified
+        Runtimer, while tracking the call within the call tree."""
+
+        now: callable = runtimer._now
+
+        frame, token = self.enter(runtimer)
+
+        started: int = now()
+
+        try:
+            result = await function(*args, **kwargs)
+        except BaseException as exception:
+            runtimer.record_failure(started, stopped := now(), exception)
+            raise
+        else:
+            runtimer.record(started, stopped := now())
+        finally:
+            self.exit(frame, token, stopped - started)
+
+        return result
+
+    def totals(self) -> dict[tuple[str, ...], tuple[int, int, int]]:
+        """Supports returning the call count, and the inclusive and exclusive times in
+        nanoseconds, for each call path, merged from the totals of every thread."""
+
+        with self._lock:
+            shards = []
+
+            for reference, totals in self._shards:
+                if (thread := reference()) is None or not thread.is_alive():
+                    self._merge(self._retired, totals)
+                else:
+                    shards.append((reference, totals))
+
+            self._shards = shards
+
+            merged: dict[Node, list[int]] = self._merge({}, self._retired)
+
+            for _, totals in shards:
+                self._merge(merged, totals)
+
+        return {
+            node.path: tuple(entry)
+            for node, entry in sorted(merged.items(), key=lambda item: item[0].path)
+        }
+
+    @staticmethod
+    def _merge(target: dict, source: dict) -> dict:
+        """Merges the call path totals from the source into the target."""
+
+        for node, entry in source.copy().items():
+            if (existing := target.get(node)) is None:
+                target[node] = list(entry)
+            else:
+                for index, value in enumerate(entry):
+                    existing[index] += value
+
+        return target
+
+    def snapshot(self) -> list[dict[str, object]]:
+        """Supports obtaining a snapshot of the call tree as a list of dictionaries, one
+        for each call path, with the inclusive and exclusive times reported in seconds.
+        """
+
+        return [
+            {
+                "path": list(path),
+                "count": count,
+                "inclusive": inclusive / 1e9,
+                "exclusive": exclusive / 1e9,
+            }
+            for path, (count, inclusive, exclusive) in self.totals().items()
+        ]
+
+    def collapsed(self, unit: str = "us") -> str:
+        """Supports exporting the call tree in the collapsed stack format used by flame
+        graph tools, with one line per call path, comprised of the function names along
+        the path separated by semicolons, followed by the exclusive time spent on that
+        path, in the specified unit of 'ns', 'us' (the default), 'ms' or 's'."""
+
+        divisors: dict[str, int] = {
+            "ns": 1,
+            "us": 1_000,
+            "ms": 1_000_000,
+            "s": 1_000_000_000,
+        }
+
+        if not unit in divisors:
+            raise ValueError(
+                "The 'unit' argument must have a value of %s!" % (", ".join(divisors))
+            )
+
+        lines: list[str] = []
+
+        for path, (_, _, exclusive) in self.totals().items():
+            if (value := exclusive // divisors[unit]) > 0:
+                lines.append(f"{';'.join(path)} {value}")
+
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+# The process-wide Profiler which builds the call tree for all @runtimer functions
+profiler: Profiler = Profiler()
+
+
+__all__ = [
+    "Node",
+    "Profiler",
+    "profiler",
+]
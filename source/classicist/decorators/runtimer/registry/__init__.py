@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+from classicist.decorators.runtimer.statistics import percentiles
+
+import json
+import re
+import threading
+import weakref
+
+logger = logger.getChild(__name__)
+
+
+class Registry(object):
+    """The Registry class tracks every Runtimer instance created within the process, so
+    that the call time statistics of all of the timed functions can be obtained at once,
+    without needing a reference to each function. The Registry only holds weak references
+    to the Runtimer instances, so that the functions they time, and the Runtimers, can be
+    garbage collected as normal, such as for functions defined within other functions.
+    """
+
+    _runtimers: weakref.WeakSet = None
+    _lock: threading.Lock = None
+
+    def __init__(self):
+        """Supports instantiating an instance of the Registry class."""
+
+        self._runtimers = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of Runtimer instances currently held by the Registry."""
+
+        return len(self._runtimers)
+
+    def __contains__(self, runtimer: object) -> bool:
+        """Returns whether the specified Runtimer instance is held by the Registry."""
+
+        return runtimer in self._runtimers
+
+    def __iter__(self):
+        """Supports iterating over the Runtimer instances held by the Registry."""
+
+        return iter(self.runtimers())
+
+    def register(self, runtimer: object) -> object:
+        """Supports registering the specified Runtimer instance with the Registry."""
+
+        with self._lock:
+            self._runtimers.add(runtimer)
+
+        return runtimer
+
+    def unregister(self, runtimer: object) -> object:
+        """Supports unregistering the specified Runtimer instance from the Registry."""
+
+        with self._lock:
+            self._runtimers.discard(runtimer)
+
+        return runtimer
+
+    def runtimers(self) -> list[object]:
+        """Supports returning a list of the Runtimer instances held by the Registry,
+        sorted by the fully qualified names of the functions that they time."""
+
+        with self._lock:
+            runtimers = list(self._runtimers)
+
+        return sorted(runtimers, key=lambda runtimer: runtimer.name)
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """Supports obtaining a snapshot of the call time statistics of every function
+        timed by a Runtimer held by the Registry, keyed by the fully qualified name of
+        each function; the statistics of any Runtimer instances timing functions of the
+        same name, such as for functions redefined within a loop, are merged together.
+        """
+
+        groups: dict[str, tuple[object, object]] = {}
+
+        with self._lock:
+            runtimers = list(self._runtimers)
+
+            for runtimer in runtimers:
+                statistics = runtimer.statistics
+
+                if (name := runtimer.name) in groups:
+                    groups[name][1].merge(statistics)
+                else:
+                    groups[name] = (runtimer, statistics)
+
+        return {
+            name: runtimer.snapshot(statistics)
+            for name, (runtimer, statistics) in sorted(groups.items())
+        }
+
+
+# The process-wide Registry with which each Runtimer instance registers itself
+registry: Registry = Registry()
+
+
+def runtimers() -> list[object]:
+    """The runtimers helper method returns a list of every Runtimer instance within the
+    process, sorted by the fully qualified names of the functions that they time."""
+
+    return registry.runtimers()
+
+
+def snapshot() -> dict[str, dict[str, object]]:
+    """The snapshot helper method returns a snapshot of the call time statistics of every
+    function timed by a Runtimer within the process, keyed by the function's fully
+    qualified name."""
+
+    return registry.snapshot()
+
+
+def export_json(snapshot: dict[str, dict] = None, **kwargs) -> str:
+    """The export_json helper method returns the call time statistics of every function
+    timed by a Runtimer within the process, or the statistics of the specified snapshot,
+    encoded as JSON; any keyword arguments are passed through to `json.dumps()`."""
+
+    if snapshot is None:
+        snapshot = registry.snapshot()
+    elif not isinstance(snapshot, dict):
+        raise TypeError(
+            "The 'snapshot' argument, if specified, must reference a dictionary!"
+        )
+
+    return json.dumps(snapshot, **kwargs)
+
+
+def export_openmetrics(
+    snapshot: dict[str, dict] = None,
+    prefix: str = "classicist_runtimer",
+) -> str:
+    """The export_openmetrics helper method returns the call time statistics of every
+    function timed by a Runtimer within the process, or the statistics of the specified
+    snapshot, in the OpenMetrics text exposition format, which can also be scraped as
+    the Prometheus text format. The call times are exposed as a summary, with quantiles,
+    in seconds, alongside counters of the calls, failures by exception type, and items
+    produced by generators, each labelled with the function and module names."""
+
+    if snapshot is None:
+        snapshot = registry.snapshot()
+    elif not isinstance(snapshot, dict):
+        raise TypeError(
+            "The 'snapshot' argument, if specified, must reference a dictionary!"
+        )
+
+    if not (isinstance(prefix, str) and re.fullmatch(r"[a-zA-Z_:][\w:]*", prefix)):
+        raise ValueError(
+            "The 'prefix' argument must be a valid OpenMetrics metric name prefix!"
+        )
+
+    def escape(value: object) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    def labels(statistics: dict, **extra: str) -> str:
+        labels = {
+            "function": statistics["function"],
+            "module": statistics["module"] or "",
+            **extra,
+        }
+
+        return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+    lines: list[str] = [
+        f"# TYPE {prefix}_seconds summary",
+        f"# UNIT {prefix}_seconds seconds",
+        f"# HELP {prefix}_seconds The call times of functions timed by @runtimer.",
+    ]
+
+    for statistics in snapshot.values():
+        for name, quantile in percentiles.items():
+            if name in statistics["percentiles"]:
+                lines.append(
+                    "%s_seconds{%s} %r"
+                    % (
+                        prefix,
+                        labels(statistics, quantile=str(quantile)),
+                        statistics["percentiles"][name],
+                    )
+                )
+
+        lines.append(
+            "%s_seconds_sum{%s} %r" % (prefix, labels(statistics), statistics["total"])
+        )
+        lines.append(
+            "%s_seconds_count{%s} %d"
+            % (prefix, labels(statistics), statistics["count"])
+        )
+
+    lines += [
+        f"# TYPE {prefix}_calls counter",
+        f"# HELP {prefix}_calls The calls made to functions timed by @runtimer, including any calls skipped by sampling.",
+    ]
+
+    for statistics in snapshot.values():
+        lines.append(
+            "%s_calls_total{%s} %d"
+            % (prefix, labels(statistics), statistics.get("calls", statistics["count"]))
+        )
+
+    lines += [
+        f"# TYPE {prefix}_failures counter",
+        f"# HELP {prefix}_failures The calls made to functions timed by @runtimer that raised exceptions.",
+    ]
+
+    for statistics in snapshot.values():
+        for exception, count in (statistics.get("errors") or {}).items():
+            lines.append(
+                "%s_failures_total{%s} %d"
+                % (prefix, labels(statistics, exception=exception), count)
+            )
+
+    lines += [
+        f"# TYPE {prefix}_items counter",
+        f"# HELP {prefix}_items The items produced by generators timed by @runtimer.",
+    ]
+
+    for statistics in snapshot.values():
+        if "items" in statistics:
+            lines.append(
+                "%s_items_total{%s} %d"
+                % (prefix, labels(statistics), statistics["items"])
+            )
+
+    lines.append("# EOF")
+
+    return "\n".join(lines) + "\n"
+
+
+__all__ = [
+    "Registry",
+    "registry",
+    "runtimers",
+    "snapshot",
+    "export_json",
+    "export_openmetrics",
+]
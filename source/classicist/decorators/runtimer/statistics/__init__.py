@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+from classicist.decorators.runtimer.histogram import Histogram
+
+logger = logger.getChild(__name__)
+
+# The percentiles reported by Runtimer.snapshot(), keyed by their reporting names
+percentiles: dict[str, float] = {
+    "p50": 0.5,
+    "p90": 0.9,
+    "p99": 0.99,
+    "p999": 0.999,
+}
+
+
+def summarise(histogram: Histogram) -> dict[str, object]:
+    """Summarises the nanosecond values recorded in the specified Histogram as seconds."""
+
+    return {
+        "count": histogram.count,
+        "total": histogram.total / 1e9,
+        "minimum": (histogram.minimum or 0) / 1e9,
+        "maximum": (histogram.maximum or 0) / 1e9,
+        "mean": histogram.mean / 1e9,
+        "percentiles": {
+            name: (histogram.percentile(quantile) or 0) / 1e9
+            for name, quantile in percentiles.items()
+        },
+    }
+
+
+class Statistics(object):
+    """The Statistics class holds the call time statistics recorded by a Runtimer for
+    its function; each thread that calls the function records into its own instance of
+    the Statistics class, which are merged together into a new instance when read.
+
+    The `successes` and `failures` Histograms record the durations of the calls that
+    returned and of those that raised an exception, respectively, while `exceptions`
+    counts the failed calls by exception type; the `durations` Histogram combines the
+    durations of all calls. For generators and asynchronous generators, the duration is
+    the time from the first request for an item through to the exhaustion or closure of
+    the stream; for such streams the `first` Histogram records the time taken to produce
+    the first item and `items` counts the number of items produced by all the streams.
+    When the Runtimer is sampling calls, `skipped` counts the calls that were not timed.
+    """
+
+    __slots__ = (
+        "successes",
+        "failures",
+        "exceptions",
+        "first",
+        "items",
+        "skipped",
+    )
+
+    def __init__(self, precision: int = 6):
+        """Supports instantiating an instance of the Statistics class."""
+
+        self.successes: Histogram = Histogram(precision=precision)
+        self.failures: Histogram = Histogram(precision=precision)
+        self.exceptions: dict[type, int] = {}
+        self.first: Histogram = Histogram(precision=precision)
+        self.items: int = 0
+        self.skipped: int = 0
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Statistics instance."""
+
+        return f"<{self.__class__.__name__}(successes: {self.successes.count}, failures: {self.failures.count}, items: {self.items})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Statistics instance."""
+
+        return f"<{self.__class__.__name__}(successes: {self.successes.count}, failures: {self.failures.count}, items: {self.items}) @ {hex(id(self))}>"
+
+    @property
+    def precision(self) -> int:
+        """Supports returning the number of bits of precision used by the histograms."""
+
+        return self.successes.precision
+
+    @property
+    def durations(self) -> Histogram:
+        """Supports returning a Histogram combining the durations of all of the calls."""
+
+        return self.successes.snapshot().merge(self.failures)
+
+    @property
+    def estimated_total(self) -> float:
+        """Supports returning the estimated total duration of all calls, including any
+        skipped calls, extrapolated from the mean duration of the timed calls."""
+
+        durations: Histogram = self.durations
+
+        if durations.count == 0:
+            return 0.0
+
+        return durations.total * (durations.count + self.skipped) / durations.count
+
+    @property
+    def errors(self) -> dict[str, int]:
+        """Supports returning the number of failed calls keyed by exception type name."""
+
+        errors: dict[str, int] = {}
+
+        for exception, count in self.exceptions.copy().items():
+            if exception.__module__ == "builtins":
+                name = exception.__qualname__
+            else:
+                name = f"{exception.__module__}.{exception.__qualname__}"
+
+            errors[name] = errors.get(name, 0) + count
+
+        return errors
+
+    def merge(self, other: Statistics) -> Statistics:
+        """Supports merging the statistics held by another Statistics instance into this
+        instance, returning this instance to allow calls to be chained."""
+
+        if not isinstance(other, Statistics):
+            raise TypeError(
+                "The 'other' argument must reference a Statistics instance!"
+            )
+
+        self.successes.merge(other.successes)
+        self.failures.merge(other.failures)
+
+        for exception, count in other.exceptions.copy().items():
+            self.exceptions[exception] = self.exceptions.get(exception, 0) + count
+
+        self.first.merge(other.first)
+        self.items += other.items
+        self.skipped += other.skipped
+
+        return self
+
+    def snapshot(self) -> Statistics:
+        """Supports taking an independent copy of the current statistics."""
+
+        return self.__class__(precision=self.precision).merge(self)
+
+
+__all__ = [
+    "Statistics",
+    "percentiles",
+    "summarise",
+]
@@ -1,6 +1,7 @@
 from classicist.exceptions.decorators import (
     AliasError,
     AnnotationError,
+    CacheError,
 )
 
 from classicist.exceptions.metaclasses import (
@@ -10,5 +11,6 @@ from classicist.exceptions.metaclasses import (
 __all__ = [
     "AliasError",
     "AnnotationError",
+    "CacheError",
     "AttributeShadowingError",
 ]
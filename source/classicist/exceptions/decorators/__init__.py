@@ -1,7 +1,9 @@
 from classicist.exceptions.decorators.aliased import AliasError
 from classicist.exceptions.decorators.annotation import AnnotationError
+from classicist.exceptions.decorators.memoize import CacheError
 
 __all__ = [
     "AliasError",
     "AnnotationError",
+    "CacheError",
 ]
@@ -0,0 +1,2 @@
+class CacheError(TypeError):
+    pass
@@ -1,22 +1,51 @@
+from __future__ import annotations
+
 from classicist.logging import logger
 
+import importlib
+import weakref
 import sys
 
 logger = logger.getChild(__name__)
 
+# The cache of decorator chains, keyed by the id of the outermost object in the chain,
+# mapping to a weak reference to that object and the layers beneath it; the outermost
+# object is held weakly so that functions can still be garbage collected, at which
+# point the weak reference callback discards the corresponding cache entry
+_layers: dict[int, tuple[weakref.ref, tuple[callable]]] = {}
 
-def unwrap(function: callable) -> callable:
-    """Support unwrapping methods decorated with @property and other descriptor protocol
-    decorators such as @classmethod and @staticmethod as well as function decorators
-    that follow best-practice and have a __wrapped__ attribute referencing the original
-    function, so that the original function can be found by unwrapping via the chain of
-    the __wrapped__ and fget attributes.
+# The sentinel used to identify missing attributes while locating objects
+_missing: object = object()
+
+
+def _discard(key: int) -> callable:
+    """Supports creating the weak reference callback that discards a cache entry."""
+
+    def discard(reference: weakref.ref):
+        if (entry := _layers.get(key)) and entry[0] is reference:
+            _layers.pop(key, None)
+
+    return discard
 
-    This implementation is based on the standard library's inspect.unwrap() method."""
 
-    original: callable = function
+def layers(function: callable) -> tuple[callable]:
+    """Supports obtaining the full chain of decorator layers of a function in one pass,
+    from the outermost object, such as a property or a wrapper function created by a
+    decorator, through each layer reached via the __wrapped__ and fget attributes, down
+    to the original function, which is always the last item in the returned tuple; an
+    object that does not wrap another is returned as a chain of one layer.
 
-    functionids: dict[id, callable] = {id(function): function}
+    Chains are cached, weakly keyed on the outermost object, so repeated introspection
+    of the same object is a single dictionary lookup after the first; objects that do
+    not support weak references, such as property objects, are unwrapped on each call.
+    A ValueError is raised if a wrapper loop is found while unwrapping the chain."""
+
+    if (entry := _layers.get(id(function))) and entry[0]() is function:
+        return (function, *entry[1])
+
+    chain: list[callable] = [function]
+
+    functionids: set[int] = {id(function)}
 
     recursion_limit: int = sys.getrecursionlimit()
 
@@ -30,9 +59,102 @@ def unwrap(function: callable) -> callable:
 
         if (functionid in functionids) or (len(functionids) >= recursion_limit):
             raise ValueError(
-                "Found wrapper loop while unwrapping {!r}!".format(original)
+                "Found wrapper loop while unwrapping {!r}!".format(chain[0])
+            )
+
+        functionids.add(functionid)
+
+        chain.append(function)
+
+    # Only chains of more than one layer are cached, as an object that does not wrap
+    # another is resolved by the attribute checks above without any allocation; the
+    # outermost layer is excluded from the cached entry so that it is not kept alive
+    if len(chain) > 1:
+        try:
+            reference = weakref.ref(chain[0], _discard(key := id(chain[0])))
+        except TypeError:
+            pass
+        else:
+            _layers[key] = (reference, tuple(chain[1:]))
+
+    return tuple(chain)
+
+
+def unwrap(function: callable) -> callable:
+    """Support unwrapping methods decorated with @property and other descriptor protocol
+    decorators such as @classmethod and @staticmethod as well as function decorators
+    that follow best-practice and have a __wrapped__ attribute referencing the original
+    function, so that the original function can be found by unwrapping via the chain of
+    the __wrapped__ and fget attributes.
+
+    This implementation is based on the standard library's inspect.unwrap() method; the
+    result is obtained from the cached decorator chain maintained by `layers()`."""
+
+    return layers(function)[-1]
+
+
+def forget(function: callable = None):
+    """Supports discarding the cached decorator chain of the given function, such as
+    after its __wrapped__ attribute has been reassigned, or all cached chains if no
+    function is specified."""
+
+    if function is None:
+        _layers.clear()
+    elif (entry := _layers.get(id(function))) and entry[0]() is function:
+        _layers.pop(id(function), None)
+
+
+def reference(function: callable) -> tuple[str, str]:
+    """Supports obtaining the module and qualified name by which a function, such as the
+    function wrapped by a decorator or descriptor, can be located via `locate()`, so that
+    objects derived from the function can be pickled by reference; a TypeError is raised
+    if the function cannot be located by name, such as when it was defined in another
+    function or is a lambda."""
+
+    module: str = getattr(function, "__module__", None)
+    qualname: str = getattr(function, "__qualname__", None)
+
+    if not (isinstance(module, str) and isinstance(qualname, str)) or ("<" in qualname):
+        raise TypeError(
+            "Cannot reference %r by name, as it is not defined at the top level of a module or class!"
+            % (function)
+        )
+
+    return (module, qualname)
+
+
+def locate(module: str, qualname: str) -> object:
+    """Supports locating an object by its module and qualified name, as the pickle module
+    does for functions and classes, such as when an object pickled by reference is being
+    unpickled; the attributes of classes along the path are obtained from the __dict__
+    of the classes in their MRO, so that descriptors, such as hybrid methods and class
+    properties, are returned themselves, rather than being invoked as they would be by
+    getattr(). An AttributeError is raised if the object cannot be located."""
+
+    value: object = importlib.import_module(module)
+
+    for name in qualname.split("."):
+        if isinstance(value, type):
+            for klass in value.__mro__:
+                if name in klass.__dict__:
+                    value = klass.__dict__[name]
+                    break
+            else:
+                raise AttributeError(
+                    f"Cannot locate '{qualname}' in the '{module}' module!"
+                )
+        elif (value := getattr(value, name, _missing)) is _missing:
+            raise AttributeError(
+                f"Cannot locate '{qualname}' in the '{module}' module!"
             )
 
-        functionids[functionid] = function
+    return value
+
 
-    return function
+__all__ = [
+    "layers",
+    "unwrap",
+    "forget",
+    "reference",
+    "locate",
+]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from types import ModuleType
+
+import importlib
+import sys
+
+
+class LazyModule(ModuleType):
+    """The LazyModule class is assigned as the class of packages that export their names
+    lazily via `exports()`, to prevent the import system from replacing an exported name
+    with the submodule of the same name, such as `classicist.decorators.hybridmethod`,
+    when the submodule is imported directly; the exported name is bound instead."""
+
+    def __setattr__(self, name: str, value: object):
+        if (
+            isinstance(value, ModuleType)
+            and name in self.__dict__.get("_classicist_exports", ())
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
+
+
+def exports(module: str, names: dict[str, str]) -> tuple[callable, callable]:
+    """Supports exporting names lazily from a package via PEP 562, by returning the
+    module-level __getattr__() and __dir__() functions for the named package, given the
+    mapping of each exported name to the module that defines it; the defining module is
+    only imported when the name is first accessed, after which the name is bound on the
+    package so that later accesses do not incur any further cost."""
+
+    package: ModuleType = sys.modules[module]
+
+    package.__class__ = LazyModule
+
+    package._classicist_exports = names
+
+    def __getattr__(name: str) -> object:
+        if (path := names.get(name)) is None:
+            raise AttributeError(f"module '{module}' has no attribute '{name}'")
+
+        value = getattr(importlib.import_module(path), name)
+
+        setattr(package, name, value)
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(package.__dict__) | set(names))
+
+    return __getattr__, __dir__
+
+
+__all__ = [
+    "LazyModule",
+    "exports",
+]
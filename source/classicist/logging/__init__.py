@@ -1,3 +1,106 @@
+from __future__ import annotations
+
 import logging
 
 logger = logging.getLogger("classicist")
+
+
+class Tracing(object):
+    """The Tracing class provides the library-wide instrumentation switch that governs
+    whether the library's hot paths, such as the wrappers created by the decorators and
+    the descriptor `__get__` methods invoked on every attribute access, emit their debug
+    log messages. Tracing is disabled by default, so the hot paths do not call
+    `logger.debug()`, and so avoid paying for the call, its level check and the packing
+    of its arguments on every call even when debug logging is not enabled.
+
+    Hot paths that can be swapped out, such as the `@hybridmethod` descriptor's `__get__`
+    method, which is looked up on its class, subscribe to the switch via the `subscribe()`
+    method to be regenerated with or without their logging whenever tracing is toggled.
+    Those that cannot be swapped out, such as the wrapper functions returned by the
+    `@runtimer` and `@memoize` decorators, still check the switch's `_enabled` attribute
+    on every call, but only call `logger.debug()` while tracing is enabled."""
+
+    _enabled: bool = False
+    _callbacks: list[callable] = None
+
+    def __init__(self, enabled: bool = False):
+        """Supports instantiating an instance of the Tracing class."""
+
+        if not isinstance(enabled, bool):
+            raise TypeError("The 'enabled' argument must have a boolean value!")
+
+        self._enabled = enabled
+        self._callbacks = []
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Tracing instance."""
+
+        return f"<{self.__class__.__name__}(enabled: {self._enabled})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Tracing instance."""
+
+        return (
+            f"<{self.__class__.__name__}(enabled: {self._enabled}) @ {hex(id(self))}>"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Supports returning whether tracing is currently enabled."""
+
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        """Supports enabling or disabling tracing, notifying any subscribers."""
+
+        if not isinstance(enabled, bool):
+            raise TypeError("The 'enabled' property must be assigned a boolean value!")
+
+        if enabled is self._enabled:
+            return
+
+        self._enabled = enabled
+
+        for callback in self._callbacks:
+            callback(enabled)
+
+    def enable(self) -> Tracing:
+        """Supports enabling tracing, so the hot paths emit their debug log messages."""
+
+        self.enabled = True
+
+        return self
+
+    def disable(self) -> Tracing:
+        """Supports disabling tracing, so the hot paths skip their debug logging."""
+
+        self.enabled = False
+
+        return self
+
+    def subscribe(self, callback: callable) -> callable:
+        """Supports subscribing a callback to be called with the current state of the
+        switch, and then again with the new state whenever tracing is toggled, allowing
+        a hot path to be regenerated with or without its logging; the callback is then
+        returned, so that the method can also be used as a decorator."""
+
+        if not callable(callback):
+            raise TypeError("The 'callback' argument must reference a callable!")
+
+        self._callbacks.append(callback)
+
+        callback(self._enabled)
+
+        return callback
+
+
+# The library-wide tracing switch, which is disabled by default
+tracing: Tracing = Tracing()
+
+
+__all__ = [
+    "logger",
+    "Tracing",
+    "tracing",
+]
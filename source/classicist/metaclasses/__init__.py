@@ -1,7 +1,17 @@
-from classicist.metaclasses.aliased import aliased
-from classicist.metaclasses.shadowproof import shadowproof
+from classicist.metaclasses.composable import Feature, composed, composable
+from classicist.metaclasses.aliased import Aliasing, aliased
+from classicist.metaclasses.shadowproof import Shadowing, shadowproof
+from classicist.metaclasses.model import Modelling, model, Model
 
 __all__ = [
+    "Feature",
+    "composed",
+    "composable",
+    "Aliasing",
     "aliased",
+    "Shadowing",
     "shadowproof",
+    "Modelling",
+    "model",
+    "Model",
 ]
@@ -1,41 +1,69 @@
+from __future__ import annotations
+
 from classicist.logging import logger
 from classicist.exceptions.decorators.aliased import AliasError
+from classicist.inspector import unwrap
+from classicist.metaclasses.composable import Feature, composed
 
 logger = logger.getChild(__name__)
 
 
-class aliased(type):
+class Aliasing(Feature):
+    """The Aliasing feature looks for methods that have been decorated with @alias(...)
+    and creates the corresponding aliases for those methods on the class."""
+
+    def prepare(
+        self,
+        name: str,
+        bases: tuple[type],
+        namespace: dict[str, object],
+        options: dict[str, object],
+    ) -> list[tuple[str, object, tuple[str]]]:
+        """Supports preparing the list of the aliases to create on the class."""
+
+        return []
+
+    def visit(self, state: list, attribute: str, value: object):
+        """Supports recording the aliases annotated on the given class attribute."""
+
+        # If a function has been wrapped by a well behaved decorator, unwrap it, to get
+        # to the original function, and thus to the alias annotation we need to create
+        # the function aliases in the class; without access to the annotation the
+        # aliases cannot be created, so any decorators used should follow best practice
+        # and apply the __wrapped__ attribute to point back to the wrapped function using
+        # functools.wraps or similar or use property getter practice; values that cannot
+        # be unwrapped, such as the Null singleton whose attributes all resolve back to
+        # itself, are skipped, as they cannot carry an alias annotation:
+        try:
+            function = unwrap(value)
+        except ValueError:
+            return
+
+        if aliases := getattr(function, "_classicist_aliases", None):
+            state.append((attribute, value, aliases))
+
+    def finish(self, state: list, klass: type):
+        """Supports installing the recorded aliases on the newly created class."""
+
+        for name, original, aliases in state:
+            for alias in aliases:
+                if hasattr(klass, alias):
+                    raise AliasError(
+                        f"Cannot create alias '{alias}' for method '{name}' as '{klass.__name__}.{alias}' already exists!"
+                    )
+
+                # The alias points to the original function or property accessor
+                setattr(klass, alias, original)
+
+
+class aliased(composed):
     """Metaclass that looks for methods that have been decorated with @alias(...) and
     automatically creates the corresponding aliases for those methods on the class."""
 
-    def __new__(cls: object, name: str, bases: tuple[object], namespace: dict):
-        # Create the class first
-        cls = super().__new__(cls, name, bases, namespace)
-
-        # Walk through the class body (namespace) and install the aliases
-        for name, value in namespace.items():
-            original: object = value
-
-            # If a function has been wrapped by a well behaved decorator, unwrap it, to
-            # get to the original function, and thus to the alias annotation we need to
-            # create the function aliases in the class; without access to the annotation
-            # the aliases cannot be created, so any decorators used should follow best
-            # practice and apply the __wrapped__ attribute to point back to the wrapped
-            # function using functools.wraps or similar or use property getter practice:
-            while (w := hasattr(value, "__wrapped__")) or (p := hasattr(value, "fget")):
-                if w is True:  # Get the original wrapped function
-                    value = getattr(value, "__wrapped__")
-                elif p is True:  # Get the original property function
-                    value = getattr(value, "fget")
-
-            if aliases := getattr(value, "_classicist_aliases", None):
-                for alias in aliases:
-                    if hasattr(cls, alias):
-                        raise AliasError(
-                            f"Cannot create alias '{alias}' for method '{name}' as '{cls.__name__}.{alias}' already exists!"
-                        )
-
-                    # The alias points to the original function or property accessor
-                    setattr(cls, alias, original)
-
-        return cls
+    _classicist_features: tuple[Feature] = (Aliasing(),)
+
+
+__all__ = [
+    "Aliasing",
+    "aliased",
+]
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+
+import threading
+
+logger = logger.getChild(__name__)
+
+
+class Feature(object):
+    """The Feature class provides the base class for the features, such as aliasing and
+    attribute shadowing protection, that can be composed into a metaclass derived from
+    the `composed` metaclass, allowing several features to be combined on one class and
+    to be applied in a single pass over the class namespace as each class is created.
+
+    Features override the hook methods below as needed; for each class being created,
+    `prepare()` is called first to create the feature's state for that class, which is
+    then passed to `visit()` for each attribute in the class namespace, and to `finish()`
+    once the class has been created; `changed()` is called when an attribute is assigned
+    to or deleted from a class after it has been created. Features may also declare class
+    keyword options, and their default values, via the `options` class attribute, which
+    are passed to `prepare()` rather than to `type.__new__()`."""
+
+    options: dict[str, object] = {}
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current Feature instance."""
+
+        return f"<{self.__class__.__name__}>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current Feature instance."""
+
+        return f"<{self.__class__.__name__} @ {hex(id(self))}>"
+
+    def prepare(
+        self,
+        name: str,
+        bases: tuple[type],
+        namespace: dict[str, object],
+        options: dict[str, object],
+    ) -> object:
+        """Supports preparing the feature's state for the class being created, which is
+        passed to the `visit()` and `finish()` methods for the same class."""
+
+        return None
+
+    def visit(self, state: object, attribute: str, value: object):
+        """Supports visiting each attribute in the namespace of the class being created,
+        before the class has been created; the namespace may be modified while visiting,
+        as the attributes are visited from a snapshot of the namespace."""
+
+        pass
+
+    def finish(self, state: object, klass: type):
+        """Supports completing the feature's work once the class has been created."""
+
+        pass
+
+    def changed(self, klass: type, attribute: str):
+        """Supports responding to an attribute being assigned to or deleted from a class
+        after it has been created."""
+
+        pass
+
+
+def _overrides(feature: Feature, method: str) -> bool:
+    """Supports determining if a feature overrides one of the Feature hook methods, so
+    that hooks that would do nothing are not called for every attribute or class."""
+
+    return getattr(type(feature), method) is not getattr(Feature, method)
+
+
+class composed(type):
+    """The composed metaclass provides the base metaclass for composable metaclasses,
+    each of which lists the features it applies via its `_classicist_features` class
+    attribute; metaclasses derived from several composable metaclasses combine their
+    features automatically, so that all of the features are applied in a single pass
+    over the class namespace, rather than each metaclass walking it independently."""
+
+    _classicist_features: tuple[Feature] = ()
+    _classicist_options: dict[str, object] = {}
+    _classicist_visitors: tuple[tuple[int, callable]] = ()
+    _classicist_finishers: tuple[tuple[int, callable]] = ()
+    _classicist_watchers: tuple[callable] = ()
+
+    def __init_subclass__(metaclass, **kwargs):
+        """Supports combining the features of the base metaclasses of a metaclass, when
+        the metaclass does not list its own features, and precomputing the hooks that
+        need to be called for each class the metaclass creates."""
+
+        super().__init_subclass__(**kwargs)
+
+        if "_classicist_features" in metaclass.__dict__:
+            features = tuple(metaclass.__dict__["_classicist_features"])
+        else:
+            features = _combine(metaclass.__mro__[1:])
+
+        for feature in features:
+            if not isinstance(feature, Feature):
+                raise TypeError(
+                    "The '_classicist_features' attribute must only reference Feature class instances!"
+                )
+
+        options: dict[str, object] = {}
+
+        for feature in features:
+            options.update(feature.options)
+
+        metaclass._classicist_features = features
+        metaclass._classicist_options = options
+        metaclass._classicist_visitors = tuple(
+            (index, feature.visit)
+            for index, feature in enumerate(features)
+            if _overrides(feature, "visit")
+        )
+        metaclass._classicist_finishers = tuple(
+            (index, feature.finish)
+            for index, feature in enumerate(features)
+            if _overrides(feature, "finish")
+        )
+        metaclass._classicist_watchers = tuple(
+            feature.changed for feature in features if _overrides(feature, "changed")
+        )
+
+    def __new__(
+        metaclass,
+        name: str,
+        bases: tuple[type],
+        namespace: dict[str, object],
+        **kwargs,
+    ):
+        # Separate the options declared by the features from any other class keyword
+        # arguments, which are passed on to type.__new__() and __init_subclass__()
+        options: dict[str, object] = {
+            option: kwargs.pop(option, default)
+            for option, default in metaclass._classicist_options.items()
+        }
+
+        states: list[object] = [
+            feature.prepare(name, bases, namespace, options)
+            for feature in metaclass._classicist_features
+        ]
+
+        # Visit each attribute in the class namespace once, for all of the features; the
+        # attributes are visited from a snapshot, so features may modify the namespace
+        if visitors := metaclass._classicist_visitors:
+            for attribute, value in tuple(namespace.items()):
+                for index, visit in visitors:
+                    visit(states[index], attribute, value)
+
+        klass = super().__new__(metaclass, name, bases, namespace, **kwargs)
+
+        for index, finish in metaclass._classicist_finishers:
+            finish(states[index], klass)
+
+        return klass
+
+    def __init__(
+        cls,
+        name: str,
+        bases: tuple[type],
+        namespace: dict[str, object],
+        **kwargs,
+    ):
+        """Supports initialising the class, without passing on the class options."""
+
+        super().__init__(name, bases, namespace)
+
+    def __setattr__(cls, attribute: str, value: object):
+        """Supports notifying the features when a class attribute is assigned."""
+
+        super().__setattr__(attribute, value)
+
+        for changed in type(cls)._classicist_watchers:
+            changed(cls, attribute)
+
+    def __delattr__(cls, attribute: str):
+        """Supports notifying the features when a class attribute is deleted."""
+
+        super().__delattr__(attribute)
+
+        for changed in type(cls)._classicist_watchers:
+            changed(cls, attribute)
+
+
+def _combine(metaclasses: tuple[type]) -> tuple[Feature]:
+    """Supports combining the features of the given metaclasses in order, omitting any
+    duplicate features, such as those inherited from a shared base metaclass."""
+
+    features: list[Feature] = []
+
+    for metaclass in metaclasses:
+        if isinstance(metaclass, type) and issubclass(metaclass, composed):
+            for feature in metaclass.__dict__.get("_classicist_features", ()):
+                if not any(type(feature) is type(other) for other in features):
+                    features.append(feature)
+
+    return tuple(features)
+
+
+_composed: dict[tuple, type] = {}
+
+_lock: threading.Lock = threading.Lock()
+
+
+def composable(*parts: tuple[type | Feature]) -> type:
+    """Supports creating a metaclass that combines the given composable metaclasses, such
+    as `aliased` and `shadowproof`, and features, so that each class created with the
+    metaclass has all of the features applied in a single pass over its namespace; the
+    metaclass created for each combination of parts is cached and reused."""
+
+    if len(parts) == 0:
+        raise TypeError("The composable() function requires at least one argument!")
+
+    for part in parts:
+        if isinstance(part, Feature):
+            continue
+        elif isinstance(part, type) and issubclass(part, composed):
+            continue
+        else:
+            raise TypeError(
+                "The composable() function arguments must reference composed metaclasses or Feature class instances, not %s!"
+                % (type(part))
+            )
+
+    with _lock:
+        if (metaclass := _composed.get(parts)) is None:
+            metaclasses: tuple[type] = tuple(
+                part for part in parts if isinstance(part, type)
+            ) or (composed,)
+
+            features: list[Feature] = list(_combine(metaclasses))
+
+            for part in parts:
+                if isinstance(part, Feature):
+                    if not any(type(part) is type(other) for other in features):
+                        features.append(part)
+
+            metaclass = _composed[parts] = type(
+                "_".join(
+                    part.__name__ if isinstance(part, type) else type(part).__name__
+                    for part in parts
+                ),
+                metaclasses,
+                {
+                    "__module__": __name__,
+                    "_classicist_features": tuple(features),
+                },
+            )
+
+    return metaclass
+
+
+__all__ = [
+    "Feature",
+    "composed",
+    "composable",
+]
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from classicist.logging import logger
+from classicist.metaclasses.composable import Feature, composed
+from classicist.types.null import Null
+
+import typing
+
+logger = logger.getChild(__name__)
+
+# The types of default values that cannot be shared safely between instances
+MUTABLES: tuple[type] = (list, dict, set, bytearray)
+
+# The parameter names of the generated methods for the instance and the other instance,
+# which are reserved so that they cannot clash with the names of the fields
+SELF: str = "_classicist_self"
+OTHER: str = "_classicist_other"
+
+
+def _annotations(namespace: dict[str, object]) -> dict[str, object]:
+    """Supports obtaining the annotations from a class namespace, including on versions
+    of Python where annotations are evaluated lazily, and the class namespace holds an
+    __annotate__ function rather than the __annotations__ dictionary."""
+
+    if isinstance(annotations := namespace.get("__annotations__"), dict):
+        return annotations
+
+    if callable(annotate := namespace.get("__annotate__")):
+        from annotationlib import Format, call_annotate_function
+
+        return call_annotate_function(annotate, Format.FORWARDREF)
+
+    return {}
+
+
+def _classvar(annotation: object) -> bool:
+    """Supports determining if an annotation marks a class variable rather than a field,
+    whether the annotation has been evaluated or is held as a string."""
+
+    if isinstance(annotation, str):
+        return annotation.startswith(("ClassVar", "typing.ClassVar"))
+
+    return getattr(annotation, "__origin__", annotation) is typing.ClassVar
+
+
+class Modelling(Feature):
+    """The Modelling feature turns the annotated class attributes of a class into fields
+    that are stored in `__slots__`, so that instances do not carry a `__dict__`, with
+    any fields that are not given a value, either as a default in the class body or on
+    instantiation, defaulting to the `Null` singleton, so that null-safe navigation can
+    be used on the instances; it also generates the `__init__()`, `__eq__()` and
+    `__repr__()` methods for the class, unless the class defines its own."""
+
+    def prepare(
+        self,
+        name: str,
+        bases: tuple[type],
+        namespace: dict[str, object],
+        options: dict[str, object],
+    ) -> tuple[str, dict, tuple[str], dict[str, object], set[str]]:
+        """Supports preparing the class' fields, by combining the fields inherited from
+        its base classes with the fields annotated in its namespace, and adding the
+        slots for the new fields to the namespace."""
+
+        fields: dict[str, None] = {}
+        defaults: dict[str, object] = {}
+
+        for base in reversed(bases):
+            for field in getattr(base, "_classicist_fields", ()):
+                fields[field] = None
+            defaults.update(getattr(base, "_classicist_defaults", {}))
+
+        inherited: set[str] = set(fields)
+
+        for field, annotation in _annotations(namespace).items():
+            if _classvar(annotation):
+                continue
+
+            fields[field] = None
+
+        slots: tuple[str] = tuple(field for field in fields if not field in inherited)
+
+        if isinstance(declared := namespace.get("__slots__", ()), str):
+            declared = (declared,)
+
+        namespace["__slots__"] = tuple(declared) + tuple(
+            slot for slot in slots if not slot in declared
+        )
+
+        return (name, namespace, tuple(fields), defaults, set(namespace) - set(fields))
+
+    def visit(self, state: tuple, attribute: str, value: object):
+        """Supports moving the default values of the fields out of the namespace, as the
+        values of class attributes would otherwise replace the slots of the same name;
+        this is done while visiting, so that any other features composed with this one
+        also visit the default values, such as to check them for attribute shadowing."""
+
+        name, namespace, fields, defaults, defined = state
+
+        if attribute in fields:
+            if isinstance(value, MUTABLES):
+                raise ValueError(
+                    f"The '{attribute}' field of the '{name}' class cannot have a mutable default value of type {type(value).__name__}!"
+                )
+
+            defaults[attribute] = namespace.pop(attribute)
+
+    def finish(self, state: tuple, klass: type):
+        """Supports generating the `__init__()`, `__eq__()` and `__repr__()` methods for
+        the new class, unless it defines its own, and recording its fields."""
+
+        name, namespace, fields, defaults, defined = state
+
+        setattr(klass, "_classicist_fields", fields)
+        setattr(klass, "_classicist_defaults", defaults)
+
+        generated: dict[str, object] = {"Null": Null, "defaults": defaults}
+
+        exec(
+            compile(
+                self.generate(fields, defaults),
+                f"<model {klass.__qualname__}>",
+                "exec",
+            ),
+            generated,
+        )
+
+        for method in ("__init__", "__eq__", "__repr__"):
+            if not method in defined:
+                generated[method].__qualname__ = f"{klass.__qualname__}.{method}"
+                setattr(klass, method, generated[method])
+
+        # As with dataclasses, instances with a generated __eq__() are not hashable
+        if not ("__eq__" in defined or "__hash__" in defined):
+            setattr(klass, "__hash__", None)
+
+    @staticmethod
+    def generate(fields: tuple[str], defaults: dict[str, object]) -> str:
+        """Supports generating the source code of the methods for the given fields; the
+        instance and the other instance are referenced via reserved parameter names, so
+        that fields may have any name, including 'self' and 'other'."""
+
+        parameters: str = ", ".join(
+            f"{field}=defaults[{field!r}]" if field in defaults else f"{field}=Null"
+            for field in fields
+        )
+
+        assignments: list[str] = [f"    {SELF}.{field} = {field}" for field in fields]
+
+        values: str = "".join(f"{SELF}.{field}, " for field in fields)
+        others: str = "".join(f"{OTHER}.{field}, " for field in fields)
+
+        representation: str = ", ".join(
+            f"{field}={{{SELF}.{field}!r}}" for field in fields
+        )
+
+        return "\n".join(
+            [
+                (
+                    f"def __init__({SELF}, {parameters}):"
+                    if fields
+                    else f"def __init__({SELF}):"
+                ),
+                *(assignments or ["    pass"]),
+                "",
+                f"def __eq__({SELF}, {OTHER}):",
+                f"    if {OTHER}.__class__ is not {SELF}.__class__:",
+                "        return NotImplemented",
+                f"    return ({values}) == ({others})",
+                "",
+                f"def __repr__({SELF}):",
+                f"    return f'{{{SELF}.__class__.__name__}}({representation})'",
+            ]
+        )
+
+
+class model(composed):
+    """The model metaclass supports creating compact data model classes, whose annotated
+    class attributes become fields stored in `__slots__` rather than in a per-instance
+    `__dict__`, and whose fields default to the `Null` singleton when they are not given
+    a value, so that null-safe navigation can be used on memory-compact instances; the
+    `__init__()`, `__eq__()` and `__repr__()` methods are generated for each class."""
+
+    _classicist_features: tuple[Feature] = (Modelling(),)
+
+
+class Model(object, metaclass=model):
+    """The Model class provides a convenient base class for compact data model classes,
+    as created by the `model` metaclass; as the class defines no instance attributes of
+    its own, subclasses whose base classes all define `__slots__` have compact instances
+    without a per-instance `__dict__`."""
+
+    __slots__ = ()
+
+
+__all__ = [
+    "Modelling",
+    "model",
+    "Model",
+]
@@ -1,36 +1,215 @@
+from __future__ import annotations
+
 from classicist.logging import logger
 from classicist.exceptions.metaclasses.shadowproof import AttributeShadowingError
+from classicist.metaclasses.composable import Feature, composed
+
+import weakref
 
 logger = logger.getChild(__name__)
 
 
-class shadowproof(type):
+# The cache of attribute name indexes, each mapping the names of the attributes that are
+# available on a class to the nearest class in its hierarchy that defines them, weakly
+# keyed on the classes so that the cache does not keep dynamically created classes alive
+_indexes: weakref.WeakKeyDictionary[type, dict[str, type]] = weakref.WeakKeyDictionary()
+
+# The type flag that marks classes created at runtime, whose attributes can be changed
+HEAPTYPE: int = 1 << 9
+
+
+def _names(klass: type) -> dict[str, type]:
+    """Supports mapping the non-special attribute names in a class' __dict__ to the
+    class, without invoking any of the descriptors held in the __dict__."""
+
+    return {
+        name: klass
+        for name in klass.__dict__
+        if not (name.startswith("__") and name.endswith("__"))
+    }
+
+
+def _watched(klass: type) -> bool:
+    """Supports determining if changes to the attributes of a class are reported to the
+    Shadowing feature, so that cached indexes that include the class can be updated,
+    which is the case for classes created by metaclasses composed with the feature, or
+    if the attributes of the class cannot be changed, as for the built-in types."""
+
+    if not klass.__flags__ & HEAPTYPE:
+        return True
+
+    return any(
+        isinstance(feature, Shadowing)
+        for feature in getattr(type(klass), "_classicist_features", ())
+    )
+
+
+def _cacheable(klass: type) -> bool:
+    """Supports determining if the index of a class can be cached, which is only the
+    case if changes to any of the classes in its hierarchy would be reported, as the
+    cached index would otherwise become stale when an unwatched class is changed; as
+    the indexes of the base classes are obtained first, and are cached on the same
+    terms, the class' base classes are watched if their indexes have been cached."""
+
+    return _watched(klass) and all(base in _indexes for base in klass.__bases__)
+
+
+def _index(klass: type) -> dict[str, type]:
+    """Supports obtaining the attribute name index for the given class, which is built
+    from its own __dict__ and the indexes of its base classes as needed, and is cached
+    if the class and its base classes are all watched for changes."""
+
+    if (index := _indexes.get(klass)) is None:
+        index = _merge(klass.__bases__, klass.__mro__[1:])
+
+        index.update(_names(klass))
+
+        if _cacheable(klass):
+            _indexes[klass] = index
+
+    return index
+
+
+def _linearise(bases: tuple[type]) -> list[type]:
+    """Supports computing the method resolution order that a class with the given base
+    classes will have, excluding the class itself, via the C3 linearisation used by
+    Python, as the order is needed before the class has been created; if the bases have
+    no consistent order, the class cannot be created, so any order is returned."""
+
+    sequences: list[list[type]] = [list(base.__mro__) for base in bases]
+    sequences.append(list(bases))
+
+    mro: list[type] = []
+
+    while sequences := [sequence for sequence in sequences if sequence]:
+        for sequence in sequences:
+            head: type = sequence[0]
+
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            return list(
+                dict.fromkeys(klass for base in bases for klass in base.__mro__)
+            )
+
+        mro.append(head)
+
+        for sequence in sequences:
+            if sequence[0] is head:
+                del sequence[0]
+
+    return mro
+
+
+def _merge(bases: tuple[type], mro: tuple[type] = None) -> dict[str, type]:
+    """Supports merging the attribute name indexes of the given base classes into a new
+    index, where each name maps to the class that defines it which is nearest along the
+    method resolution order; as the order of each base class' own method resolution
+    order is preserved, the index of the first base class is copied as is, and only the
+    names also found in the indexes of any other base classes need to be compared."""
+
+    if not bases:
+        return {}
+
+    index: dict[str, type] = dict(_index(bases[0]))
+
+    if len(bases) > 1:
+        position: dict[type, int] = {
+            klass: order for order, klass in enumerate(mro or _linearise(bases))
+        }
+
+        for base in bases[1:]:
+            for name, owner in _index(base).items():
+                if (current := index.get(name)) is None:
+                    index[name] = owner
+                elif position[owner] < position[current]:
+                    index[name] = owner
+
+    return index
+
+
+class Shadowing(Feature):
+    """The Shadowing feature detects attributes defined by a class that shadow attributes
+    of the same name defined by its base classes, raising an AttributeShadowingError, or
+    logging a warning instead if the class is created with the `raises=False` option."""
+
+    options: dict[str, object] = {"raises": True}
+
+    def prepare(
+        self,
+        name: str,
+        bases: tuple[type],
+        namespace: dict[str, object],
+        options: dict[str, object],
+    ) -> tuple[str, dict[str, type], bool]:
+        """Supports preparing the merged attribute name index of the base classes."""
+
+        return (name, _merge(bases), options["raises"])
+
+    def visit(self, state: tuple, attribute: str, value: object):
+        """Supports checking the given class attribute for attribute shadowing."""
+
+        # Skip special Python attributes and methods
+        if attribute.startswith("__") and attribute.endswith("__"):
+            return
+
+        name, index, raises = state
+
+        # Check for attribute shadowing in any of the base classes
+        if (base := index.get(attribute)) is not None:
+            message = f"The '{attribute}' attribute in the '{name}' class shadows the attribute of the same name in the '{base.__name__}' base class!"
+
+            if raises is True:
+                raise AttributeShadowingError(message)
+            else:
+                logger.warning(message)
+
+    def finish(self, state: tuple, klass: type):
+        """Supports caching the new class' index, reusing the merged index of its bases."""
+
+        name, index, raises = state
+
+        index.update(_names(klass))
+
+        if _cacheable(klass):
+            _indexes[klass] = index
+
+    def changed(self, klass: type, attribute: str):
+        """Supports updating the cached indexes when a class attribute is assigned or
+        deleted; the class' own index is updated in place if it has no subclasses, as
+        is the case while aliases are being installed on a newly created class, while
+        otherwise all cached indexes are discarded, and are rebuilt as needed."""
+
+        if attribute.startswith("__") and attribute.endswith("__"):
+            return
+
+        if (index := _indexes.get(klass)) is None:
+            return
+        elif type.__subclasses__(klass):
+            _indexes.clear()
+        elif attribute in klass.__dict__:
+            index[attribute] = klass
+        else:
+            _indexes.pop(klass, None)
+
+
+class shadowproof(composed):
     """The shadowproof type provides support for detecting overwritten attributes – that
     is attributes from a superclass that get shadowed by a subclass' attributes, helping
     to protect against bugs which can sometimes be difficult to detect when a subclass
-    unintentionally shadows a superclass' attribute with its own."""
+    unintentionally shadows a superclass' attribute with its own.
 
-    def __new__(
-        cls,
-        name: str,
-        bases: tuple[object],
-        attributes: dict[str, object],
-        raises: bool = True,
-    ):
-        # Iterate through attributes defined in the current class
-        for attribute, value in attributes.items():
-            # Skip special Python attributes and methods
-            if attribute.startswith("__") and attribute.endswith("__"):
-                continue
-
-            # Check for attribute shadowing in any of the base classes
-            for base in bases:
-                if hasattr(base, attribute):
-                    message = f"The '{attribute}' attribute in the '{name}' class shadows the attribute of the same name in the '{base.__name__}' base class!"
-
-                    if raises is True:
-                        raise AttributeShadowingError(message)
-                    else:
-                        logger.warning(message)
-
-        return super().__new__(cls, name, bases, attributes)
+    Shadowing is detected by consulting an index of the attribute names defined in the
+    `__dict__` of each class along the method resolution order of the base classes, so
+    that descriptors defined on the base classes, such as class properties, are never
+    invoked while checking; the index of each class is cached and reused to build the
+    index of its subclasses, so class creation cost does not grow with the depth of the
+    class hierarchy or with the number of attributes defined by its base classes."""
+
+    _classicist_features: tuple[Feature] = (Shadowing(),)
+
+
+__all__ = [
+    "Shadowing",
+    "shadowproof",
+]
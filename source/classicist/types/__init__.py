@@ -1,6 +1,32 @@
-from classicist.types.null import NullType, Null
+from classicist.lazy import exports
+
+# The types are imported lazily, when first accessed, so that using one of the types does
+# not import the modules of the others, nor the standard library modules they depend on
+__getattr__, __dir__ = exports(
+    __name__,
+    {
+        "NullType": "classicist.types.null",
+        "Null": "classicist.types.null",
+        "NullPath": "classicist.types.nullpath",
+        "nullpath": "classicist.types.nullpath",
+        "NullSafe": "classicist.types.nullsafe",
+        "nullsafe": "classicist.types.nullsafe",
+        "unwrapped": "classicist.types.nullsafe",
+        "NullEncoder": "classicist.types.nulljson",
+        "dumps": "classicist.types.nulljson",
+        "dump": "classicist.types.nulljson",
+    },
+)
 
 __all__ = [
     "NullType",
     "Null",
+    "NullPath",
+    "nullpath",
+    "NullSafe",
+    "nullsafe",
+    "unwrapped",
+    "NullEncoder",
+    "dumps",
+    "dump",
 ]
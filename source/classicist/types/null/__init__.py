@@ -35,10 +35,28 @@ class NullType(object):
         return cls._instance
 
     def __getattr__(self, name: str) -> NullType:
-        """Support nested attribute access by returning the singleton instance."""
+        """Support nested attribute access by returning the singleton instance; special
+        attributes that do not exist raise an AttributeError instead, so that protocol
+        probes, such as those made by the copy and pickle modules, behave as expected.
+        """
+
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        return self.__class__._instance
+
+    def __getitem__(self, key: object) -> NullType:
+        """Support nested item access by returning the singleton instance."""
 
         return self.__class__._instance
 
+    def __iter__(self):
+        """Support iteration by returning an iterator that does not produce any items."""
+
+        return iter(())
+
     def __bool__(self) -> bool:
         """Support falsey equality checks for boolean comparisons against NullType."""
 
@@ -54,6 +72,21 @@ class NullType(object):
         else:
             return self is value
 
+    def __reduce__(self) -> str:
+        """Support pickling by reference, so that unpickling returns the singleton."""
+
+        return "Null"
+
+    def __copy__(self) -> NullType:
+        """Support shallow copying by returning the singleton instance."""
+
+        return self
+
+    def __deepcopy__(self, memo: dict) -> NullType:
+        """Support deep copying by returning the singleton instance."""
+
+        return self
+
     def __str__(self) -> str:
         return "Null"
 
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from classicist.types.null import Null
+from classicist.types.nullsafe import NullSafe, unwrapped
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import IO
+
+import copy
+import json
+
+
+class _Stream(list):
+    """The _Stream class allows an arbitrary iterable, such as a generator, to be encoded
+    as a JSON array by the standard library's JSON encoder without first collecting its
+    items into a list, so that the items are only produced as the array is encoded; the
+    first item is obtained in advance, as the encoder needs to know if the array is empty
+    before iterating it, and it is produced again before the remaining items."""
+
+    __slots__ = ("_first", "_rest")
+
+    def __init__(self, first: object, rest: Iterator[object]):
+        self._first = first
+        self._rest = rest
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __iter__(self):
+        yield self._first
+        yield from self._rest
+
+
+class NullEncoder(json.JSONEncoder):
+    """The NullEncoder class extends the standard library's JSON encoder to support the
+    encoding of the `Null` singleton as JSON `null`, of `NullSafe` proxies as the values
+    they wrap, of model instances created via the `model` metaclass as objects holding
+    their fields, of other mappings as objects, and of any other iterables, such as sets
+    and generators, as arrays, without requiring a `default` hook for each call.
+
+    When encoding to a string, via `encode()` or `json.dumps()` with the `cls` argument,
+    the standard library's faster one-shot encoder is used, as the full string is built
+    anyway; when encoding incrementally, via `iterencode()` or `dump()`, the items of
+    iterables, such as generators, are only produced as they are encoded, allowing large
+    object graphs to be streamed to a file without being held in memory at once."""
+
+    _collect: bool = False
+
+    def default(self, value: object) -> object:
+        """Supports converting values that JSON cannot represent natively into values
+        that it can, or raises a TypeError for any values that cannot be converted."""
+
+        if value is Null:
+            return None
+
+        if type(value) is NullSafe:
+            return unwrapped(value)
+
+        if (fields := getattr(type(value), "_classicist_fields", None)) is not None:
+            return {field: getattr(value, field) for field in fields}
+
+        if isinstance(value, Mapping):
+            return dict(value)
+
+        if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
+            if self._collect is True:
+                return list(value)
+
+            for first in (iterator := iter(value)):
+                return _Stream(first, iterator)
+
+            return []
+
+        return super().default(value)
+
+    def encode(self, value: object) -> str:
+        """Supports encoding the value as a JSON string via the one-shot encoder, which
+        collects the items of any iterables into lists as they are encountered; this is
+        done via a copy of the encoder, so that the encoder itself is never modified, and
+        may be shared safely by concurrent threads encoding incrementally."""
+
+        collector = copy.copy(self)
+        collector._collect = True
+
+        return super(NullEncoder, collector).encode(value)
+
+    def iterencode(self, value: object, _one_shot: bool = False):
+        """Supports encoding the value incrementally, yielding each chunk of the encoded
+        JSON as it is produced; the one-shot encoder is only used via `encode()`, as it
+        cannot encode the items of iterables lazily."""
+
+        return super().iterencode(value, _one_shot=_one_shot and self._collect)
+
+
+def dumps(value: object, **options) -> str:
+    """Supports encoding a value, which may contain `Null`, model instances and proxies,
+    as a JSON string; any options are passed on to the NullEncoder class."""
+
+    return NullEncoder(**options).encode(value)
+
+
+def dump(value: object, file: IO[str], buffer: int = 65536, **options) -> int:
+    """Supports encoding a value, which may contain `Null`, model instances and proxies,
+    as JSON written incrementally to the given file object, without building the full
+    JSON string in memory; the encoded chunks are collected until at least `buffer`
+    characters are held, before they are written to the file, to minimise the number of
+    writes. Returns the number of characters written; any other options are passed on
+    to the NullEncoder class."""
+
+    if not (isinstance(buffer, int) and not isinstance(buffer, bool)):
+        raise TypeError("The 'buffer' argument must have an integer value!")
+    elif buffer < 0:
+        raise ValueError("The 'buffer' argument must have a non-negative value!")
+
+    chunks: list[str] = []
+    held: int = 0
+    written: int = 0
+
+    for chunk in NullEncoder(**options).iterencode(value):
+        chunks.append(chunk)
+
+        if (held := held + len(chunk)) >= buffer:
+            file.write("".join(chunks))
+            written += held
+            chunks = []
+            held = 0
+
+    if chunks:
+        file.write("".join(chunks))
+        written += held
+
+    return written
+
+
+__all__ = [
+    "NullEncoder",
+    "dumps",
+    "dump",
+]
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from classicist.types.null import Null
+
+from functools import lru_cache
+from typing import Generator, Iterable
+
+import keyword
+import re
+
+# The pattern that matches each step of a path; attribute steps are identifiers that are
+# preceded by a "." separator unless they start the path, while key and index steps are
+# enclosed in square brackets, holding an integer index or a quoted or bare string key
+STEP = re.compile(
+    r"""
+    (?P<separator>\.?)(?P<attribute>[^\W\d]\w*)
+    |\[(?:
+        (?P<index>-?\d+)
+        |"(?P<double>[^"\\]*)"
+        |'(?P<single>[^'\\]*)'
+        |(?P<key>[^\W\d]\w*)
+    )\]
+    """,
+    re.VERBOSE,
+)
+
+
+class NullPath(object):
+    """The NullPath class supports compiling a null-safe path, such as `a.b.c[0].d`, into
+    an accessor that navigates the path on any object, returning the value at the end of
+    the path or the `Null` singleton as soon as any step along the path is missing, or is
+    `None` or `Null`, without raising an exception. Paths consist of attribute steps, as
+    well as key and index steps enclosed in square brackets, such as `["key"]` or `[0]`.
+
+    The path is parsed once when it is compiled, and the accessor is generated as Python
+    code with each of the steps inlined, so that the path can be applied efficiently to
+    one object by calling the NullPath instance, or to many objects at once via its
+    `extract()` method, which avoids a function call per object as well as any parsing;
+    the `nullpath()` function should be used to create instances, as it caches them."""
+
+    _path: str = None
+    _steps: tuple[tuple[str, str | int]] = None
+    _get: callable = None
+    _list: callable = None
+    _generate: callable = None
+
+    def __init__(self, path: str):
+        """Supports instantiating an instance of the NullPath class, by compiling the
+        given path into its accessor functions."""
+
+        if not isinstance(path, str):
+            raise TypeError("The 'path' argument must have a string value!")
+
+        self._path = path
+        self._steps = NullPath.parse(path)
+
+        namespace: dict[str, object] = {"Null": Null}
+
+        exec(compile(self._compile(), f"<nullpath '{path}'>", "exec"), namespace)
+
+        self._get = namespace["get"]
+        self._list = namespace["extract"]
+        self._generate = namespace["generate"]
+
+    def __str__(self) -> str:
+        """Returns a string representation of the current NullPath instance."""
+
+        return f"<{self.__class__.__name__}({self._path})>"
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the current NullPath instance."""
+
+        return f"<{self.__class__.__name__}({self._path}) @ {hex(id(self))}>"
+
+    def __call__(self, value: object) -> object:
+        """Supports navigating the path on the given object, returning the value at the
+        end of the path, or `Null` if any step along the path could not be navigated."""
+
+        return self._get(value)
+
+    @property
+    def path(self) -> str:
+        """Supports returning the path that the accessor navigates."""
+
+        return self._path
+
+    @property
+    def steps(self) -> tuple[tuple[str, str | int]]:
+        """Supports returning the parsed steps of the path, as (kind, operand) pairs."""
+
+        return self._steps
+
+    def extract(
+        self,
+        values: Iterable[object],
+        lazy: bool = False,
+    ) -> list[object] | Generator[object, None, None]:
+        """Supports navigating the path on each of the given objects, returning a list of
+        the values found at the end of the path, or a generator of those values if the
+        `lazy` argument is set to `True`, with `Null` in place of any missing values."""
+
+        if not isinstance(lazy, bool):
+            raise TypeError("The 'lazy' argument must have a boolean value!")
+
+        return self._generate(values) if lazy else self._list(values)
+
+    @staticmethod
+    def parse(path: str) -> tuple[tuple[str, str | int]]:
+        """Supports parsing a path into its steps, each of which is returned as a tuple
+        of the kind of step, "attribute", "key" or "index", and its operand."""
+
+        steps: list[tuple[str, str | int]] = []
+
+        position: int = 0
+
+        for match in STEP.finditer(path):
+            if match.start() != position:
+                break
+            elif match.group("attribute") and bool(match.group("separator")) is not (
+                position > 0
+            ):
+                break
+
+            position = match.end()
+
+            if (attribute := match.group("attribute")) is not None:
+                steps.append(("attribute", attribute))
+            elif (index := match.group("index")) is not None:
+                steps.append(("index", int(index)))
+            else:
+                for group in ("double", "single", "key"):
+                    if (key := match.group(group)) is not None:
+                        steps.append(("key", key))
+                        break
+
+        if position != len(path) or len(steps) == 0:
+            raise ValueError(f"The path '{path}' is not a valid null-safe path!")
+
+        return tuple(steps)
+
+    def _compile(self) -> str:
+        """Supports generating the source code of the accessor functions for the path,
+        with each of the steps inlined, and each generated function handling a missing
+        step in its own way: by returning, appending or yielding `Null` respectively."""
+
+        def render(indent: str, fail: list[str]) -> list[str]:
+            lines: list[str] = []
+
+            for kind, operand in self._steps:
+                if kind == "attribute" and keyword.iskeyword(operand):
+                    lines.append(f"value = getattr(value, {operand!r}, None)")
+                elif kind == "attribute":
+                    lines += [
+                        "try:",
+                        f"    value = value.{operand}",
+                        "except AttributeError:",
+                        "    value = None",
+                    ]
+                elif kind == "key":
+                    # Dictionaries are accessed via get() so that missing keys, which are
+                    # common in records, do not incur the cost of raising a KeyError
+                    lines += [
+                        "if type(value) is dict:",
+                        f"    value = value.get({operand!r})",
+                        "else:",
+                        "    try:",
+                        f"        value = value[{operand!r}]",
+                        "    except (LookupError, TypeError):",
+                        "        value = None",
+                    ]
+                else:
+                    lines += [
+                        "try:",
+                        f"    value = value[{operand}]",
+                        "except (LookupError, TypeError):",
+                        "    value = None",
+                    ]
+
+                lines += [
+                    "if value is None or value is Null:",
+                    *[f"    {line}" for line in fail],
+                ]
+
+            return [indent + line for line in lines]
+
+        return "\n".join(
+            [
+                "def get(value):",
+                *render("    ", ["return Null"]),
+                "    return value",
+                "",
+                "def extract(values):",
+                "    result = []",
+                "    append = result.append",
+                "    for value in values:",
+                *render("        ", ["append(Null)", "continue"]),
+                "        append(value)",
+                "    return result",
+                "",
+                "def generate(values):",
+                "    for value in values:",
+                *render("        ", ["yield Null", "continue"]),
+                "        yield value",
+            ]
+        )
+
+
+@lru_cache(maxsize=1024)
+def nullpath(path: str) -> NullPath:
+    """Supports compiling a null-safe path, such as `a.b.c[0].d`, into a NullPath accessor
+    which can be applied to one or many objects; compiled paths are cached and reused.
+    """
+
+    return NullPath(path)
+
+
+__all__ = [
+    "NullPath",
+    "nullpath",
+]
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from classicist.types.null import Null
+
+# The sentinel used to identify missing attributes
+MISSING: object = object()
+
+
+class NullSafe(object):
+    """The NullSafe class provides a lightweight proxy around an arbitrary object, which
+    allows the object graph reachable from it to be navigated null-safely, even though
+    the objects themselves return `None` rather than `Null` for missing values, as is the
+    case for third-party objects. Attribute access, item access, iteration and calls on
+    a proxy are passed on to the wrapped object, and their results are wrapped lazily as
+    they are accessed, with missing attributes, keys and indexes and any `None` values
+    collapsing to the `Null` singleton; scalar values, such as strings and numbers, are
+    returned as they are. The wrapped objects are never copied.
+
+    Proxies should be created via the `nullsafe()` function, and the wrapped object can
+    be obtained from a proxy via the `unwrapped()` function; as any attribute accessed on
+    a proxy is passed on to the wrapped object, the proxy offers no attributes of its own
+    beyond the special methods needed to support item access, iteration and calls."""
+
+    __slots__ = ("_classicist_value",)
+
+    def __init__(self, value: object):
+        """Supports instantiating an instance of the NullSafe class around a value."""
+
+        object.__setattr__(self, "_classicist_value", value)
+
+    def __getattribute__(self, name: str) -> object:
+        """Supports null-safe attribute access on the wrapped object; all attributes are
+        looked up on the wrapped object directly, rather than first being looked up on
+        the proxy, which would raise an AttributeError internally for every attribute
+        before falling back to __getattr__(). Special attributes that do not exist raise
+        an AttributeError, rather than returning `Null`, so that protocol checks made
+        via hasattr() on the proxy behave as expected."""
+
+        value = getattr(_value(self), name, MISSING)
+
+        if value is MISSING and name.startswith("__") and name.endswith("__"):
+            raise AttributeError(
+                f"'{type(_value(self)).__name__}' object has no attribute '{name}'"
+            )
+
+        return _wrap(value)
+
+    def __setattr__(self, name: str, value: object):
+        """Supports assigning attributes on the wrapped object."""
+
+        setattr(_value(self), name, unwrapped(value))
+
+    def __delattr__(self, name: str):
+        """Supports deleting attributes from the wrapped object."""
+
+        delattr(_value(self), name)
+
+    def __getitem__(self, key: object) -> object:
+        """Supports null-safe item access on the wrapped object, returning `Null` for any
+        missing keys or indexes, or if the object does not support item access."""
+
+        try:
+            return _wrap(_value(self)[key])
+        except (LookupError, TypeError):
+            return Null
+
+    def __setitem__(self, key: object, value: object):
+        """Supports assigning items on the wrapped object."""
+
+        _value(self)[key] = unwrapped(value)
+
+    def __delitem__(self, key: object):
+        """Supports deleting items from the wrapped object."""
+
+        del _value(self)[key]
+
+    def __iter__(self):
+        """Supports iterating over the wrapped object, wrapping each item as it is
+        produced by the iteration."""
+
+        for value in _value(self):
+            yield _wrap(value)
+
+    def __call__(self, *args, **kwargs) -> object:
+        """Supports calling the wrapped object, wrapping the returned value."""
+
+        return _wrap(_value(self)(*args, **kwargs))
+
+    def __len__(self) -> int:
+        """Supports obtaining the length of the wrapped object."""
+
+        return len(_value(self))
+
+    def __contains__(self, value: object) -> bool:
+        """Supports membership checks against the wrapped object."""
+
+        return unwrapped(value) in _value(self)
+
+    def __bool__(self) -> bool:
+        """Supports truthiness checks against the wrapped object."""
+
+        return bool(_value(self))
+
+    def __eq__(self, other: object) -> bool:
+        """Supports equality checks against the wrapped object."""
+
+        return _value(self) == unwrapped(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Supports inequality checks against the wrapped object."""
+
+        return _value(self) != unwrapped(other)
+
+    def __hash__(self) -> int:
+        """Supports hashing the proxy as per the wrapped object."""
+
+        return hash(_value(self))
+
+    def __str__(self) -> str:
+        """Returns the string representation of the wrapped object."""
+
+        return str(_value(self))
+
+    def __repr__(self) -> str:
+        """Returns a debug string representation of the proxy and the wrapped object."""
+
+        return f"nullsafe({_value(self)!r})"
+
+
+# The accessors for the wrapped object held in the proxy's slot, which are used internally,
+# as any attributes accessed on a proxy are looked up on the wrapped object instead, and
+# to create proxies without the cost of calling the class and its __init__() method
+_value: callable = NullSafe._classicist_value.__get__
+_assign: callable = NullSafe._classicist_value.__set__
+_new: callable = object.__new__
+
+# The scalar types whose values are returned as they are rather than being wrapped
+SCALARS: tuple[type] = (str, bytes, bytearray, int, float, complex, bool, NullSafe)
+
+# The cache of whether the values of each type are wrapped in proxies when accessed
+_wrapped: dict[type, bool] = {}
+
+
+def _wraps(klass: type) -> bool:
+    """Supports determining, and caching, whether values of a type are to be wrapped."""
+
+    return _wrapped.setdefault(klass, not issubclass(klass, SCALARS))
+
+
+def _wrap(value: object) -> object:
+    """Supports wrapping a value as it is accessed through a proxy, collapsing `None` to
+    the `Null` singleton, returning scalar values as they are, and wrapping any others;
+    whether the values of a type are wrapped is cached, so each value needs one lookup.
+    """
+
+    if value is None or value is Null or value is MISSING:
+        return Null
+
+    if (wraps := _wrapped.get(type(value))) is None:
+        wraps = _wraps(type(value))
+
+    if wraps is True:
+        _assign(proxy := _new(NullSafe), value)
+        return proxy
+
+    return value
+
+
+def nullsafe(value: object) -> NullSafe | object:
+    """Supports wrapping an object in a NullSafe proxy, so that the object graph that is
+    reachable from it can be navigated null-safely; `None` values are returned as `Null`
+    and scalar values are returned as they are, as these have no graph to navigate."""
+
+    return _wrap(value)
+
+
+def unwrapped(value: object) -> object:
+    """Supports obtaining the wrapped object from a NullSafe proxy, returning any values
+    that are not proxies as they are."""
+
+    if type(value) is NullSafe:
+        return _value(value)
+
+    return value
+
+
+__all__ = [
+    "NullSafe",
+    "nullsafe",
+    "unwrapped",
+]
@@ -11,14 +11,25 @@ assert classicist.__file__ == os.path.join(path, classicist.__name__, "__init__.
 
 # Override the default alpha sort of the test modules, into the order we wish to test
 TEST_MODULE_ORDER = [
+    "test_importtime",
+    "test_tracing",
     "test_aliased",
     "test_annotation",
+    "test_inspector",
     "test_classproperty",
     "test_deprecated",
     "test_hybridmethod",
+    "test_histogram",
+    "test_memoize",
     "test_runtimer",
     "test_shadowproof",
+    "test_composable",
+    "test_model",
     "test_nulltype",
+    "test_nullpath",
+    "test_nullsafe",
+    "test_nulljson",
+    "test_pickling",
 ]
 
 
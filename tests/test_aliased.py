@@ -331,3 +331,28 @@ def test_alias_class_method_alias_with_subclass():
 
     # Ensure that the aliased method functionality operates as expected
     assert subsubwelcome.sweet("me") == "sweet, me!"
+
+
+def test_alias_class_with_null_attributes():
+    """Test that classes holding the Null singleton, or NullSafe proxies, as attributes
+    can be created with the aliased metaclass, alone or composed with others."""
+
+    from classicist import Null, composable, model, nullsafe
+
+    class Thing(object, metaclass=aliased):
+        value = Null
+        proxy = nullsafe(object())
+
+        @alias("greet")
+        def hello(self) -> str:
+            return "hello"
+
+    assert Thing.value is Null
+    assert Thing().greet() == "hello"
+
+    class Person(object, metaclass=composable(model, aliased)):
+        __slots__ = ()
+
+        name: str = Null
+
+    assert Person().name is Null
@@ -1,6 +1,10 @@
+import gc
 import pytest
+import threading
+import time
+import weakref
 
-from classicist import classproperty
+from classicist import classproperty, cachedclassproperty
 
 
 @pytest.fixture(scope="module", name="exampleclass")
@@ -31,3 +35,102 @@ def test_classproperty_overwrite(exampleclass: type):
     # intervene and provide behaviour we had previously with @classmethod and @property
     exampleclass.name = "hello"
     assert exampleclass.name == "hello"
+
+
+def test_cachedclassproperty():
+    """Test the cachedclassproperty decorator caches its value per concrete class."""
+
+    calls: list[type] = []
+
+    class Base(object):
+        @cachedclassproperty
+        def schema(cls) -> dict[str, type]:
+            """Sample cached class property."""
+
+            calls.append(cls)
+
+            return {name: type(value) for name, value in vars(cls).items()}
+
+    class Subclass(Base):
+        value: int = 1
+
+    assert Base.schema is Base.schema
+    assert Base().schema is Base.schema
+
+    assert Subclass.schema is Subclass.schema
+    assert Subclass.schema is not Base.schema
+    assert Subclass.schema["value"] is int
+
+    assert calls == [Base, Subclass]
+
+    descriptor = vars(Base)["schema"]
+
+    assert isinstance(descriptor, classproperty)
+    assert descriptor.__doc__ == "Sample cached class property."
+
+    # Invalidating a class only discards the cached value for that class
+    assert descriptor.invalidate(Subclass) is descriptor
+
+    Base.schema
+    Subclass.schema
+
+    assert calls == [Base, Subclass, Subclass]
+
+    descriptor.invalidate()
+
+    Base.schema
+    Subclass.schema
+
+    assert calls == [Base, Subclass, Subclass, Base, Subclass]
+
+    with pytest.raises(TypeError):
+        descriptor.invalidate("Subclass")
+
+    # The cached value of a garbage collected class is discarded
+    reference = weakref.ref(Subclass)
+
+    del Subclass
+
+    calls.clear()
+
+    gc.collect()
+
+    assert reference() is None
+
+    assert len(descriptor._cache) == 1
+
+
+def test_cachedclassproperty_with_concurrent_first_access():
+    """Test that the cachedclassproperty value is computed once on concurrent access."""
+
+    calls: list[type] = []
+
+    class Example(object):
+        @cachedclassproperty
+        def table(cls) -> list[int]:
+            calls.append(cls)
+
+            time.sleep(0.01)  # Widen the window for concurrent first accesses to race
+
+            return list(range(10))
+
+    barrier = threading.Barrier(8)
+
+    values: list[list[int]] = []
+
+    def access():
+        barrier.wait()
+
+        values.append(Example.table)
+
+    threads = [threading.Thread(target=access) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert calls == [Example]
+    assert len(values) == 8
+    assert all(value is values[0] for value in values)
@@ -0,0 +1,133 @@
+from classicist import alias, aliased, shadowproof, composable
+from classicist.metaclasses import Feature, composed
+from classicist.exceptions.metaclasses.shadowproof import AttributeShadowingError
+
+import pytest
+
+
+def test_composable_combines_features():
+    """Test combining the aliased and shadowproof metaclasses on the same classes."""
+
+    metaclass = composable(aliased, shadowproof)
+
+    # The combined metaclass is cached and reused for the same combination of parts
+    assert composable(aliased, shadowproof) is metaclass
+
+    assert issubclass(metaclass, aliased)
+    assert issubclass(metaclass, shadowproof)
+
+    class Thing(object, metaclass=metaclass):
+        greeting: str = "hello"
+
+        @alias("farewell")
+        def goodbye(self) -> str:
+            return "goodbye"
+
+    assert isinstance(Thing, aliased)
+    assert isinstance(Thing, shadowproof)
+
+    thing = Thing()
+
+    assert thing.goodbye() == "goodbye"
+    assert thing.farewell() == "goodbye"
+
+    # The aliases installed on a class are included in its attribute index
+    with pytest.raises(AttributeShadowingError) as exception:
+
+        class SomeThing(Thing):
+            farewell: str = "au revoir"
+
+    assert "in the 'Thing' base class!" in str(exception.value)
+
+
+def test_composable_derived_metaclass():
+    """Test that metaclasses derived from composable metaclasses combine features."""
+
+    class metaclass(aliased, shadowproof):
+        pass
+
+    assert [type(feature).__name__ for feature in metaclass._classicist_features] == [
+        "Aliasing",
+        "Shadowing",
+    ]
+
+    class Thing(object, metaclass=metaclass):
+        greeting: str = "hello"
+
+    class SomeThing(Thing, raises=False):
+        greeting: str = "goodbye"
+
+    assert SomeThing.greeting == "goodbye"
+
+
+def test_composable_custom_feature():
+    """Test composing a custom feature, which visits each attribute in one pass."""
+
+    class Counting(Feature):
+        options: dict[str, object] = {"prefix": "_"}
+
+        def prepare(self, name, bases, namespace, options) -> dict:
+            return {"prefix": options["prefix"], "count": 0}
+
+        def visit(self, state: dict, attribute: str, value: object):
+            if attribute.startswith("__"):
+                return
+            elif not attribute.startswith(state["prefix"]):
+                state["count"] += 1
+
+        def finish(self, state: dict, klass: type):
+            klass.count = state["count"]
+
+    metaclass = composable(shadowproof, Counting())
+
+    class Thing(object, metaclass=metaclass):
+        a: int = 1
+        b: int = 2
+
+    assert Thing.count == 2
+
+    # Options declared by features are not passed on to __init_subclass__
+    class SomeThing(Thing, prefix="c"):
+        c: int = 3
+        d: int = 4
+
+    assert SomeThing.count == 1
+
+    # The shadowproof feature also applies, so reassigning 'a' is detected
+    with pytest.raises(AttributeShadowingError):
+
+        class OtherThing(Thing):
+            a: int = 5
+
+
+def test_composable_init_subclass_arguments():
+    """Test that class keyword arguments other than options reach __init_subclass__."""
+
+    class Thing(object, metaclass=shadowproof):
+        def __init_subclass__(cls, label: str = None, **kwargs):
+            super().__init_subclass__(**kwargs)
+            cls.label = label
+
+    class SomeThing(Thing, label="some", raises=False):
+        pass
+
+    assert SomeThing.label == "some"
+
+
+def test_composable_invalid_arguments():
+    """Test that composable() rejects arguments that are not metaclasses or features."""
+
+    with pytest.raises(TypeError):
+        composable()
+
+    with pytest.raises(TypeError):
+        composable(type)
+
+    with pytest.raises(TypeError):
+        composable("aliased")
+
+    # A composed metaclass without any features creates regular classes
+    class Thing(object, metaclass=composed):
+        greeting: str = "hello"
+
+    assert Thing.greeting == "hello"
@@ -0,0 +1,159 @@
+from classicist import Histogram
+
+import pytest
+import random
+
+
+def test_histogram_empty():
+    """Test the statistics reported by an empty Histogram."""
+
+    histogram = Histogram()
+
+    assert len(histogram) == 0
+    assert histogram.count == 0
+    assert histogram.total == 0
+    assert histogram.minimum is None
+    assert histogram.maximum is None
+    assert histogram.mean == 0.0
+    assert histogram.percentile(0.5) is None
+    assert histogram.buckets == []
+
+
+def test_histogram_small_values_are_exact():
+    """Test that values below the linear limit are recorded into their own buckets."""
+
+    histogram = Histogram(precision=6)
+
+    for value in range(1, 11):
+        histogram.record(value)
+
+    assert histogram.count == 10
+    assert histogram.total == 55
+    assert histogram.minimum == 1
+    assert histogram.maximum == 10
+    assert histogram.mean == 5.5
+
+    assert histogram.percentile(0.0) == 1
+    assert histogram.percentile(0.5) == 5
+    assert histogram.percentile(0.9) == 9
+    assert histogram.percentile(1.0) == 10
+
+
+def test_histogram_bucket_bounds_are_contiguous():
+    """Test that the bucket bounds cover the value range without gaps or overlaps."""
+
+    histogram = Histogram(precision=4)
+
+    for value in range(0, 5000):
+        histogram.record(value)
+
+    buckets = histogram.buckets
+
+    assert buckets[0][0] == 0
+
+    for (_, upper, _), (lower, _, _) in zip(buckets, buckets[1:]):
+        assert lower == upper + 1
+
+    for lower, upper, count in buckets:
+        assert count == min(upper, 4999) - lower + 1
+
+
+def test_histogram_percentile_relative_error():
+    """Test that percentiles are reported within the Histogram's relative error bound."""
+
+    generator = random.Random(1234)
+
+    values = sorted(int(generator.lognormvariate(13, 1.5)) for _ in range(20_000))
+
+    histogram = Histogram(precision=6)
+
+    for value in values:
+        histogram.record(value)
+
+    for quantile in (0.5, 0.9, 0.99, 0.999):
+        expected = values[int(quantile * len(values)) - 1]
+
+        assert abs(histogram.percentile(quantile) - expected) / expected < 1 / 32
+
+
+def test_histogram_memory_is_bounded():
+    """Test that the number of buckets is bounded by the value range, not by volume."""
+
+    histogram = Histogram(precision=6)
+
+    for value in range(0, 10**9, 997):
+        histogram.record(value)
+
+    # Values up to 10**9 span 30 powers of two, each with at most 32 sub-buckets
+    assert len(histogram.buckets) <= 64 + (30 * 32)
+    assert histogram.count == len(range(0, 10**9, 997))
+
+
+def test_histogram_merge_snapshot_and_reset():
+    """Test merging, snapshotting and resetting Histograms."""
+
+    first = Histogram()
+    second = Histogram()
+
+    for value in (10, 20, 30):
+        first.record(value)
+
+    for value in (5, 500_000):
+        second.record(value)
+
+    snapshot = first.snapshot()
+
+    assert first.merge(second) is first
+
+    assert first.count == 5
+    assert first.total == 500_065
+    assert first.minimum == 5
+    assert first.maximum == 500_000
+
+    # The snapshot is independent of subsequent changes to the original
+    assert snapshot.count == 3
+    assert snapshot.maximum == 30
+
+    assert first.reset() is first
+    assert first.count == 0
+    assert first.minimum is None
+
+    with pytest.raises(ValueError):
+        first.merge(Histogram(precision=8))
+
+    with pytest.raises(TypeError):
+        first.merge(123)
+
+
+def test_histogram_merge_while_recording():
+    """Test merging a Histogram that is part way through recording a value in another
+    thread, whose count has been updated before its minimum and maximum."""
+
+    recording = Histogram()
+
+    # Simulate the intermediate state of a value being recorded concurrently
+    recording._count = 1
+    recording._total = 10
+    recording._counts[10] = 1
+
+    merged = Histogram().merge(recording)
+
+    assert merged.count == 1
+    assert merged.minimum is None and merged.maximum is None
+
+    merged.record(20)
+
+    assert merged.minimum == merged.maximum == 20
+
+
+def test_histogram_invalid_arguments():
+    """Test the Histogram's argument validation."""
+
+    with pytest.raises(ValueError):
+        Histogram(precision=1)
+
+    with pytest.raises(TypeError):
+        Histogram(precision="6")
+
+    with pytest.raises(ValueError):
+        Histogram().percentile(1.5)
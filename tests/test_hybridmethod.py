@@ -1,4 +1,8 @@
+import gc
+import inspect
 import pytest
+import types
+import weakref
 
 from classicist import hybridmethod
 
@@ -146,3 +150,47 @@ def test_hybridmethod(hybridcollection: type):
 
     # Ensure that the class' items list still contains the expected items
     assert hybridcollection.items == ["ABC"]
+
+
+def test_hybridmethod_binding():
+    """Test that the hybridmethod decorator returns regular bound methods, caching the
+    method bound to the defining class, and preserving the method's metadata."""
+
+    class Example(object):
+        @hybridmethod
+        def method(self, value: int) -> int:
+            """Sample hybrid method."""
+
+            return value
+
+    class Subclass(Example):
+        pass
+
+    example = Example()
+
+    assert isinstance(Example.method, types.MethodType)
+    assert isinstance(example.method, types.MethodType)
+
+    assert Example.method.__self__ is Example
+    assert example.method.__self__ is example
+    assert Subclass.method.__self__ is Subclass
+    assert Subclass().method.__self__.__class__ is Subclass
+
+    # The method bound to the defining class is cached
+    assert Example.method is Example.method
+
+    assert Example.method.__name__ == example.method.__name__ == "method"
+    assert Example.method.__doc__ == "Sample hybrid method."
+    assert str(inspect.signature(Example.method)) == "(value: int) -> int"
+    assert str(inspect.signature(example.method)) == "(value: int) -> int"
+
+    assert Example.method(1) == example.method(1) == Subclass.method(1) == 1
+
+    # Subclasses are not kept alive by the hybrid method defined on their superclass
+    reference = weakref.ref(Subclass)
+
+    del Subclass
+
+    gc.collect()
+
+    assert reference() is None
@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The library source path, so that the subprocesses import the library under test
+path = os.path.join(os.path.dirname(__file__), "..", "source")
+
+# The import time budget for the top-level package, in microseconds
+budget: int = 20_000
+
+
+def run(code: str, *options: tuple[str]) -> subprocess.CompletedProcess:
+    """Runs the given code in a new interpreter, with the library on its import path."""
+
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        env={**os.environ, "PYTHONPATH": path},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def imported(statement: str) -> set[str]:
+    """Returns the names of the modules newly imported by running the given statement."""
+
+    process = run(
+        "import sys, json; before = set(sys.modules); "
+        + statement
+        + "; print(json.dumps(sorted(set(sys.modules) - before)))"
+    )
+
+    return set(json.loads(process.stdout))
+
+
+def test_import_is_lazy():
+    """Test that importing the package does not import any of the library's modules."""
+
+    modules = imported("import classicist")
+
+    assert "classicist" in modules
+    assert not [module for module in modules if module.startswith("classicist.d")]
+    assert not {"asyncio", "datetime", "inspect", "logging", "sqlite3"} & modules
+
+
+def test_import_null_is_lazy():
+    """Test that importing Null only imports the modules that define it."""
+
+    modules = imported("from classicist import Null")
+
+    assert "classicist.types.null" in modules
+    assert not [module for module in modules if module.startswith("classicist.d")]
+    assert not {"asyncio", "datetime", "inspect", "logging", "sqlite3"} & modules
+
+
+def test_import_hybridmethod_is_lazy():
+    """Test that importing hybridmethod does not import the other decorator modules."""
+
+    modules = imported("from classicist import hybridmethod")
+
+    assert "classicist.decorators.hybridmethod" in modules
+    assert "classicist.decorators.memoize" not in modules
+    assert "classicist.decorators.runtimer" not in modules
+    assert not {"asyncio", "datetime", "inspect", "sqlite3"} & modules
+
+
+def test_import_submodule_does_not_shadow_export():
+    """Test that importing a decorator's module directly does not replace the decorator
+    exported by the package with the module of the same name."""
+
+    process = run(
+        "import classicist.decorators.nocache\n"
+        "from classicist.decorators import nocache\n"
+        "from classicist import hybridmethod, memoize\n"
+        "import classicist.decorators\n"
+        "print(type(nocache).__name__, hybridmethod.__name__, memoize.__name__)\n"
+        "print(type(classicist.decorators.memoize).__name__)"
+    )
+
+    assert process.stdout.split() == [
+        "function",
+        "hybridmethod",
+        "memoize",
+        "function",
+    ]
+
+
+def test_import_unknown_name():
+    """Test that accessing an unknown name on the package raises an AttributeError."""
+
+    import classicist
+
+    with pytest.raises(AttributeError) as exception:
+        classicist.unknown
+
+    assert str(exception.value) == "module 'classicist' has no attribute 'unknown'"
+
+    assert set(classicist.__all__) <= set(dir(classicist))
+
+
+def test_import_time_budget():
+    """Test that the import time of the package, as reported by `python -X importtime`,
+    is within the budget; the lowest of several runs is taken to reduce noise."""
+
+    timings: list[int] = []
+
+    for attempt in range(5):
+        process = run("import classicist", "-X", "importtime")
+
+        for line in process.stderr.splitlines():
+            # Each line has the form: "import time: <self> | <cumulative> | <module>"
+            if line.startswith("import time:") and line.endswith("| classicist"):
+                timings.append(int(line.split("|")[1]))
+
+    assert len(timings) == 5
+
+    assert min(timings) < budget
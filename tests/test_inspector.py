@@ -0,0 +1,118 @@
+from classicist.inspector import layers, unwrap, forget
+
+import classicist.inspector
+
+import functools
+import gc
+import pytest
+
+# Obtain a reference to the inspector module, for access to its chain cache
+inspector = classicist.inspector
+
+
+def decorator(function: callable) -> callable:
+    """Sample decorator that follows best practice by using functools.wraps."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def test_layers_function():
+    """Test obtaining the decorator chain of a function wrapped by several decorators."""
+
+    def original() -> str:
+        return "hello"
+
+    inner = decorator(original)
+    outer = decorator(inner)
+
+    assert layers(outer) == (outer, inner, original)
+    assert layers(inner) == (inner, original)
+    assert unwrap(outer) is original
+
+    # An object that does not wrap another is a chain of one layer, and is not cached
+    assert layers(original) == (original,)
+    assert unwrap(original) is original
+    assert id(original) not in inspector._layers
+
+
+def test_layers_property():
+    """Test obtaining the decorator chain of a property wrapping a decorated getter."""
+
+    def getter(self) -> str:
+        return "hello"
+
+    wrapped = decorator(getter)
+
+    prop = property(wrapped)
+
+    assert layers(prop) == (prop, wrapped, getter)
+    assert unwrap(prop) is getter
+
+
+def test_layers_cached():
+    """Test that resolved decorator chains are cached and reused on repeat lookups."""
+
+    def original() -> str:
+        return "hello"
+
+    wrapper = decorator(original)
+
+    assert layers(wrapper) == (wrapper, original)
+
+    # The chain is cached against the outermost layer, without holding it strongly
+    assert inspector._layers[id(wrapper)][0]() is wrapper
+    assert inspector._layers[id(wrapper)][1] == (original,)
+
+    # Reassigning the chain is not seen until the cached chain has been forgotten
+    wrapper.__wrapped__ = replacement = lambda: "goodbye"
+
+    assert unwrap(wrapper) is original
+
+    forget(wrapper)
+
+    assert id(wrapper) not in inspector._layers
+
+    assert unwrap(wrapper) is replacement
+
+
+def test_layers_collected():
+    """Test that cached decorator chains do not prevent functions being collected."""
+
+    def original() -> str:
+        return "hello"
+
+    wrapper = decorator(original)
+
+    assert unwrap(wrapper) is original
+
+    key = id(wrapper)
+
+    assert key in inspector._layers
+
+    del wrapper
+
+    gc.collect()
+
+    assert key not in inspector._layers
+
+
+def test_layers_loop():
+    """Test that a wrapper loop is detected while unwrapping a decorator chain."""
+
+    def first():
+        pass
+
+    def second():
+        pass
+
+    first.__wrapped__ = second
+    second.__wrapped__ = first
+
+    with pytest.raises(ValueError) as exception:
+        layers(first)
+
+    assert str(exception.value).startswith("Found wrapper loop while unwrapping")
@@ -0,0 +1,775 @@
+import asyncio
+import gc
+import pytest
+import threading
+
+from classicist import (
+    memoize,
+    memoizer,
+    is_memoized,
+    nocache,
+    is_nocache,
+    runtimer,
+    Cache,
+    Memoizer,
+    CacheError,
+)
+from classicist.decorators.memoize import (
+    cachekey,
+    sizeof,
+    resident,
+    Store,
+    SQLiteStore,
+    fingerprint,
+)
+
+import array
+import os
+import pickle
+import subprocess
+import sys
+
+
+def test_nocache_marker():
+    """Test that the @nocache decorator marks functions, methods and properties."""
+
+    @nocache
+    def function() -> int:
+        return 1
+
+    class Example(object):
+        @property
+        @nocache
+        def value(self) -> int:
+            return 1
+
+        @nocache
+        @property
+        def other(self) -> int:
+            return 2
+
+    assert function._classicist_nocache is True
+    assert is_nocache(function) is True
+    assert is_nocache(vars(Example)["value"]) is True
+    assert is_nocache(vars(Example)["other"]) is True
+
+    # The marker is found through any wrappers that reference the marked function
+    assert is_nocache(runtimer(function)) is True
+
+    assert is_nocache(lambda: None) is False
+
+    # Objects that cannot hold the marker are returned unchanged, as they were before
+    assert nocache(len) is len
+    assert is_nocache(len) is False
+
+
+def test_memoize_refuses_nocache_functions():
+    """Test that the @memoize decorator refuses to memoize @nocache functions."""
+
+    @nocache
+    def function() -> int:
+        return 1
+
+    with pytest.raises(CacheError) as exception:
+        memoize(function)
+
+    assert "marked as @nocache" in str(exception.value)
+
+    with pytest.raises(CacheError):
+        memoize(maxsize=10)(runtimer(function))
+
+    def generator():
+        yield 1
+
+    with pytest.raises(CacheError):
+        memoize(generator)
+
+
+def test_memoize_function():
+    """Test memoizing a function, including its statistics and invalidation."""
+
+    calls: list[tuple] = []
+
+    @memoize
+    def square(value: int, offset: int = 0) -> int:
+        """Sample memoized function."""
+
+        calls.append((value, offset))
+
+        return value * value + offset
+
+    assert is_memoized(square) is True
+    assert isinstance(memoizer(square), Memoizer)
+    assert memoizer(lambda: None) is None
+
+    assert square.__name__ == "square"
+    assert square.__doc__ == "Sample memoized function."
+
+    assert square(2) == square(2) == 4
+    assert square(2, offset=1) == square(2, offset=1) == 5
+    assert square(3) == 9
+
+    assert calls == [(2, 0), (2, 1), (3, 0)]
+
+    assert memoizer(square).statistics == {
+        "hits": 2,
+        "misses": 3,
+        "evictions": 0,
+        "expirations": 0,
+        "coalesced": 0,
+        "caches": 1,
+        "size": 3,
+        "bytes": 0,
+    }
+
+    assert memoizer(square).invalidate(2) is True
+    assert memoizer(square).invalidate(2) is False
+
+    assert square(2) == 4
+
+    assert calls[-1] == (2, 0)
+
+    memoizer(square).clear()
+
+    assert memoizer(square).statistics["size"] == 0
+    assert memoizer(square).statistics["hits"] == 0
+
+    # Calls that raise are not cached
+    with pytest.raises(TypeError):
+        square("2")
+
+    assert memoizer(square).statistics["size"] == 0
+
+    with pytest.raises(TypeError):
+        square([2])  # Unhashable arguments cannot be used as cache keys
+
+
+def test_memoize_typed_keys():
+    """Test that typed keys cache arguments of differing types separately."""
+
+    @memoize(typed=True)
+    def typed(value: object, other: object) -> str:
+        return type(value).__name__
+
+    @memoize
+    def untyped(value: object, other: object) -> str:
+        return type(value).__name__
+
+    assert typed(1, 0) == "int"
+    assert typed(1.0, 0) == "float"
+
+    assert untyped(1, 0) == "int"
+    assert untyped(1.0, 0) == "int"  # As 1 == 1.0 the cached result for 1 is returned
+
+    assert cachekey((1,), {}) == 1
+    assert cachekey((1,), {}, typed=True) == (1, int)
+    assert cachekey((1,), {"a": 2}) != cachekey((1, "a", 2), {})
+
+
+def test_memoize_lru_eviction():
+    """Test that least recently used results are evicted beyond the maximum size."""
+
+    @memoize(maxsize=2)
+    def identity(value: int) -> int:
+        return value
+
+    identity(1)
+    identity(2)
+    identity(1)  # Result 1 is now the most recently used result
+    identity(3)  # Result 2 is evicted to make room for result 3
+
+    cache = memoizer(identity).caches[0]
+
+    assert 1 in cache and 3 in cache and not 2 in cache
+
+    assert memoizer(identity).statistics["evictions"] == 1
+
+    with pytest.raises(TypeError):
+        memoize(maxsize="2")(lambda: None)
+
+    with pytest.raises(ValueError):
+        memoize(maxsize=-1)(lambda: None)
+
+
+def test_memoize_ttl_expiration():
+    """Test that results expire once they have been cached for the time to live."""
+
+    now: list[float] = [0.0]
+
+    @memoize(ttl=10, clock=lambda: now[0])
+    def identity(value: int) -> int:
+        return value
+
+    identity(1)
+
+    now[0] = 5.0
+
+    identity(2)
+    identity(1)
+
+    assert memoizer(identity).statistics["hits"] == 1
+
+    now[0] = 12.0
+
+    identity(1)  # Result 1 has expired, so is discarded and computed afresh
+    identity(2)
+
+    assert memoizer(identity).statistics == {
+        "hits": 2,
+        "misses": 3,
+        "evictions": 0,
+        "expirations": 1,
+        "coalesced": 0,
+        "caches": 1,
+        "size": 2,
+        "bytes": 0,
+    }
+
+    now[0] = 30.0
+
+    identity(3)  # Adding a result discards the expired results from the cache
+
+    assert memoizer(identity).statistics["expirations"] == 3
+    assert memoizer(identity).statistics["size"] == 1
+
+    with pytest.raises(ValueError):
+        Cache(ttl=0)
+
+
+def test_memoize_instance_and_class_scopes():
+    """Test caching results per instance and per class for methods."""
+
+    calls: list[object] = []
+
+    class Example(object):
+        def __init__(self, factor: int):
+            self.factor = factor
+
+        @memoize(scope="instance")
+        def scale(self, value: int) -> int:
+            calls.append(self)
+
+            return value * self.factor
+
+        @memoize(scope="class")
+        def describe(self, value: int) -> str:
+            calls.append(self)
+
+            return f"{self.__name__ if isinstance(self, type) else 'instance'}:{value}"
+
+    class Subclass(Example):
+        pass
+
+    first = Example(2)
+    second = Example(3)
+
+    assert first.scale(2) == first.scale(2) == 4
+    assert second.scale(2) == 6
+
+    assert calls == [first, second]
+
+    assert memoizer(Example.scale).statistics["caches"] == 2
+    assert memoizer(Example.scale).invalidate(first, 2) is True
+
+    # The cache of an instance is discarded when the instance is garbage collected
+    calls.clear()
+
+    del second
+
+    gc.collect()
+
+    assert memoizer(Example.scale).statistics["caches"] == 1
+
+    # Results are shared by a class and its instances, but not by its subclasses
+    assert first.describe(1) == "instance:1"
+    assert Example(5).describe(1) == "instance:1"
+    assert Subclass(1).describe(1) == "instance:1"
+
+    assert len(calls) == 2
+    assert memoizer(Example.describe).statistics["caches"] == 2
+
+    with pytest.raises(CacheError):
+        Example.scale()  # Instance scope methods must be called with an instance
+
+    with pytest.raises(ValueError):
+        memoize(scope="module")(lambda: None)
+
+
+def test_memoize_coroutine_function():
+    """Test memoizing a coroutine function caches its awaited results."""
+
+    calls: list[int] = []
+
+    @memoize
+    async def fetch(value: int) -> int:
+        calls.append(value)
+
+        await asyncio.sleep(0)
+
+        return value
+
+    async def main() -> list[int]:
+        return [await fetch(1), await fetch(1), await fetch(2)]
+
+    assert asyncio.run(main()) == [1, 1, 2]
+
+    assert calls == [1, 2]
+
+
+def test_memoize_with_concurrent_threads():
+    """Test that memoized functions remain consistent under concurrent access."""
+
+    @memoize(maxsize=16)
+    def identity(value: int) -> int:
+        return value
+
+    barrier = threading.Barrier(8)
+
+    errors: list[Exception] = []
+
+    def work():
+        barrier.wait()
+
+        try:
+            for index in range(1000):
+                assert identity(index % 32) == index % 32
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+    statistics = memoizer(identity).statistics
+
+    assert statistics["hits"] + statistics["misses"] == 8000
+    assert statistics["size"] <= 16
+
+
+def test_memoize_singleflight_with_concurrent_threads():
+    """Test that concurrent calls in single-flight mode share one in-flight call."""
+
+    calls: list[int] = []
+
+    started = threading.Event()
+    release = threading.Event()
+
+    @memoize(singleflight=True)
+    def compute(value: int) -> int:
+        calls.append(value)
+
+        started.set()
+        release.wait(timeout=5)
+
+        if value < 0:
+            raise ValueError("The value must be non-negative!")
+
+        return value * 2
+
+    def call(value: int, results: list):
+        try:
+            results.append(compute(value))
+        except ValueError as exception:
+            results.append(exception)
+
+    for value in (21, -1):
+        results: list = []
+
+        started.clear()
+        release.clear()
+
+        leader = threading.Thread(target=call, args=(value, results))
+        leader.start()
+
+        started.wait(timeout=5)
+
+        followers = [
+            threading.Thread(target=call, args=(value, results)) for _ in range(7)
+        ]
+
+        for follower in followers:
+            follower.start()
+
+        # Wait for the followers to coalesce onto the leader's in-flight call
+        for _ in range(5000):
+            if memoizer(compute).statistics["coalesced"] == len(calls) * 7:
+                break
+
+            threading.Event().wait(0.001)
+
+        release.set()
+
+        for thread in [leader, *followers]:
+            thread.join()
+
+        if value < 0:
+            # Exceptions are shared by the coalesced callers, but are not cached
+            assert all(isinstance(result, ValueError) for result in results)
+            assert len(set(id(result) for result in results)) == 1
+        else:
+            assert results == [42] * 8
+
+    assert calls == [21, -1]
+
+    statistics = memoizer(compute).statistics
+
+    assert statistics["coalesced"] == 14
+    assert statistics["size"] == 1
+
+
+def test_memoize_singleflight_with_concurrent_tasks():
+    """Test that concurrent tasks in single-flight mode share one in-flight call."""
+
+    calls: list[int] = []
+
+    @memoize(singleflight=True)
+    async def fetch(value: int) -> int:
+        calls.append(value)
+
+        await asyncio.sleep(0.01)
+
+        if value < 0:
+            raise ValueError("The value must be non-negative!")
+
+        return value
+
+    async def main() -> list:
+        return await asyncio.gather(
+            *[fetch(1) for _ in range(5)],
+            *[fetch(-1) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+
+    assert results[:5] == [1] * 5
+    assert all(isinstance(result, ValueError) for result in results[5:])
+
+    assert calls == [1, -1]
+
+    assert memoizer(fetch).statistics["coalesced"] == 6
+
+    # A cancelled follower does not cancel the in-flight call for the other callers
+    async def cancelled() -> list:
+        tasks = [asyncio.ensure_future(fetch(2)) for _ in range(3)]
+
+        await asyncio.sleep(0)
+
+        tasks[1].cancel()
+
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(cancelled())
+
+    assert results[0] == results[2] == 2
+    assert isinstance(results[1], asyncio.CancelledError)
+
+    # A cancelled leader does not cancel the in-flight call for the coalesced callers
+    async def leader_cancelled() -> tuple:
+        leader = asyncio.ensure_future(fetch(3))
+
+        await asyncio.sleep(0)
+
+        follower = asyncio.ensure_future(fetch(3))
+
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        return (results, await fetch(3))
+
+    results, cached = asyncio.run(leader_cancelled())
+
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1] == 3
+    assert cached == 3
+
+    assert calls.count(3) == 1
+
+    with pytest.raises(TypeError):
+        memoize(singleflight="yes")(lambda: None)
+
+
+def test_memoize_byte_budget():
+    """Test that results are evicted to remain within the byte budget of each cache."""
+
+    @memoize(maxbytes=1000, sizer=len)
+    def payload(size: int) -> bytes:
+        return b"x" * size
+
+    payload(400)
+    payload(400)
+    payload(300)
+
+    assert memoizer(payload).statistics["bytes"] == 700
+
+    payload(400)  # Result 400 is now the most recently used result
+    payload(500)  # Result 300 is evicted to make room for result 500
+
+    statistics = memoizer(payload).statistics
+
+    assert statistics["bytes"] == 900
+    assert statistics["evictions"] == 1
+
+    payload(2000)  # Results larger than the byte budget are not cached
+
+    assert memoizer(payload).statistics["size"] == 2
+
+    # The resident bytes include those held by every cache with a byte budget or sizer
+    assert resident() >= 900
+
+    memoizer(payload).invalidate(400)
+
+    assert memoizer(payload).statistics["bytes"] == 500
+
+    memoizer(payload).clear()
+
+    assert memoizer(payload).statistics["bytes"] == 0
+
+    with pytest.raises(TypeError):
+        memoize(maxbytes=1.5)(lambda: None)
+
+    with pytest.raises(TypeError):
+        memoize(maxbytes=10, sizer="len")(lambda: None)
+
+
+def test_memoize_sizeof():
+    """Test the default sizer's approximation of the sizes of values."""
+
+    assert sizeof(b"x" * 1000) == sys.getsizeof(b"x" * 1000)
+    assert sizeof("abc") == sys.getsizeof("abc")
+
+    items = [b"x" * 100, b"y" * 200]
+
+    assert sizeof(items) == sys.getsizeof(items) + sum(map(sys.getsizeof, items))
+    assert sizeof({"a": b"x" * 100}) > 100
+
+    # Objects exposing their data via the buffer protocol are sized by their buffer
+    assert sizeof(array.array("d", range(1000))) >= 8000
+    assert sizeof(memoryview(b"x" * 1000)) >= 1000
+
+
+def test_memoize_store_requires_the_abstract_methods():
+    """Test that Store subclasses must implement all of its abstract methods."""
+
+    # The Store class only defines the interface, so cannot be instantiated directly
+    with pytest.raises(TypeError):
+        Store()
+
+    class IncompleteStore(Store):
+        def get(self, digest: str, default: object = None) -> object:
+            return default
+
+    # A subclass that does not implement every abstract method cannot be instantiated
+    with pytest.raises(TypeError):
+        IncompleteStore()
+
+    class CompleteStore(IncompleteStore):
+        def set(self, digest, value, name, fingerprint, expires=None) -> bool:
+            return False
+
+        def delete(self, digest: str) -> bool:
+            return False
+
+        def clear(self, name: str = None) -> int:
+            return 0
+
+        def prune(self, name: str, fingerprint: str) -> int:
+            return 0
+
+    assert isinstance(CompleteStore(), Store)
+
+
+def test_memoize_persistent_store(tmp_path):
+    """Test persisting results to an SQLite store, so they survive restarts."""
+
+    store = SQLiteStore(tmp_path / "cache.db")
+
+    calls: list[int] = []
+
+    def define() -> callable:
+        @memoize(store=store)
+        def expensive(value: int) -> int:
+            calls.append(value)
+
+            return value * 2
+
+        return expensive
+
+    expensive = define()
+
+    assert expensive(2) == expensive(2) == 4
+    assert calls == [2]
+
+    # A new Memoizer, as would be created after a restart, loads the stored result
+    expensive = define()
+
+    assert expensive(2) == 4
+    assert calls == [2]
+
+    assert memoizer(expensive).invalidate(2) is True
+
+    assert expensive(2) == 4
+    assert calls == [2, 2]
+
+    memoizer(expensive).clear()
+
+    assert (
+        store.get(
+            store.digest(
+                memoizer(expensive)._name, fingerprint(expensive.__wrapped__), 2
+            ),
+            "missing",
+        )
+        == "missing"
+    )
+
+    # Results that cannot be pickled are cached, but not persisted
+    @memoize(store=store)
+    def unpicklable(value: int) -> object:
+        return lambda: value
+
+    assert unpicklable(1) is unpicklable(1)
+
+    # The store can only be used with the function scope
+    with pytest.raises(ValueError):
+        memoize(store=store, scope="instance")(lambda self: None)
+
+    with pytest.raises(TypeError):
+        memoize(store=str(tmp_path / "cache.db"))(lambda: None)
+
+    # Stores can be pickled for use in other processes, which open their own connection
+    assert pickle.loads(pickle.dumps(store)).path == store.path
+
+
+def test_memoize_persistent_store_invalidates_changed_code(tmp_path):
+    """Test that results stored for prior versions of a function's code are discarded."""
+
+    store = SQLiteStore(tmp_path / "cache.db")
+
+    @memoize(store=store)
+    def version(value: int) -> str:
+        return f"one:{value}"
+
+    assert version(1) == "one:1"
+
+    fingerprints = {fingerprint(version.__wrapped__)}
+
+    @memoize(store=store)
+    def version(value: int) -> str:
+        return f"two:{value}"
+
+    assert version(1) == "two:1"
+
+    fingerprints.add(fingerprint(version.__wrapped__))
+
+    assert len(fingerprints) == 2
+
+    # Only the result stored for the latest version of the function's code remains
+    assert store.prune(memoizer(version)._name, fingerprint(version.__wrapped__)) == 0
+    assert store.clear() == 1
+
+
+def test_memoize_persistent_store_across_processes(tmp_path):
+    """Test that processes sharing a store reuse each other's results."""
+
+    path = str(tmp_path / "cache.db")
+
+    script = "\n".join(
+        [
+            "import sys",
+            "from classicist import memoize",
+            "from classicist.decorators.memoize import SQLiteStore",
+            "store = SQLiteStore(sys.argv[1])",
+            "@memoize(store=store)",
+            "def square(value):",
+            "    print('computed', value)",
+            "    return value * value",
+            "for value in range(20):",
+            "    assert square(value) == value * value",
+        ]
+    )
+
+    environment = {
+        **os.environ,
+        "PYTHONPATH": os.path.join(os.path.dirname(__file__), "..", "source"),
+    }
+
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, path],
+            env=environment,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(3)
+    ]
+
+    outputs = [process.communicate(timeout=60)[0] for process in processes]
+
+    assert all(process.returncode == 0 for process in processes)
+
+    # Every value was computed at least once, and later processes reuse stored results
+    computed = [line for output in outputs for line in output.splitlines()]
+
+    assert set(computed) == {f"computed {value}" for value in range(20)}
+
+    process = subprocess.run(
+        [sys.executable, "-c", script, path],
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert process.returncode == 0
+    assert process.stdout == ""
+
+
+def test_memoize_persistent_store_digests_are_stable_across_processes(tmp_path):
+    """Test that fingerprints and digests are the same in every process, regardless of
+    the string hash seed, and of the memory addresses of default argument values."""
+
+    script = "\n".join(
+        [
+            "from classicist.decorators.memoize import SQLiteStore, fingerprint",
+            "_missing = object()",
+            "def member(value, default=_missing):",
+            "    return value in {'a', 'b', 'c', 'd', 'e', 'f'}",
+            "def keyword(value, *, options=frozenset(['x', 'y', 'z'])):",
+            "    return value",
+            "store = SQLiteStore(':memory:')",
+            "print(fingerprint(member))",
+            "print(fingerprint(keyword))",
+            "print(store.digest('name', 'print', ({'a', 'b', 'c', 'd'}, 1)))",
+        ]
+    )
+
+    outputs: list[str] = []
+
+    for seed in ("1", "2", "3"):
+        process = subprocess.run(
+            [sys.executable, "-c", script],
+            env={
+                **os.environ,
+                "PYTHONPATH": os.path.join(os.path.dirname(__file__), "..", "source"),
+                "PYTHONHASHSEED": seed,
+            },
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert process.returncode == 0, process.stderr
+
+        outputs.append(process.stdout)
+
+    assert outputs[0] == outputs[1] == outputs[2]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from classicist import Model, model, composable, shadowproof, Null
+from classicist.exceptions.metaclasses.shadowproof import AttributeShadowingError
+
+from typing import ClassVar
+
+import inspect
+import pickle
+import pytest
+
+
+class Person(Model):
+    """Sample model class with a mix of fields with and without default values."""
+
+    kind: ClassVar[str] = "person"
+
+    name: str
+    age: int = 0
+    related: Person
+
+
+class Employee(Person):
+    """Sample model subclass, which adds a field and overrides an inherited default."""
+
+    age: int = 18
+    employer: str
+
+
+def test_model_slots():
+    """Test that model fields are stored in __slots__ rather than in a __dict__."""
+
+    assert Person.__slots__ == ("name", "age", "related")
+    assert Employee.__slots__ == ("employer",)
+
+    person = Person(name="A")
+
+    assert not hasattr(person, "__dict__")
+
+    with pytest.raises(AttributeError):
+        person.undefined = True
+
+    # Class variables are not fields, and remain as class attributes
+    assert person.kind == "person"
+    assert Person.kind == "person"
+
+
+def test_model_defaults():
+    """Test that fields default to their class body values or to Null otherwise."""
+
+    person = Person()
+
+    assert person.name is Null
+    assert person.age == 0
+    assert person.related is Null
+
+    # Null-safe navigation can be used through any unset fields
+    assert person.related.related.name is Null
+
+    employee = Employee("B", employer="X")
+
+    assert employee.name == "B"
+    assert employee.age == 18
+    assert employee.employer == "X"
+
+    assert list(inspect.signature(Employee).parameters) == [
+        "name",
+        "age",
+        "related",
+        "employer",
+    ]
+
+
+def test_model_equality_and_representation():
+    """Test the generated __eq__() and __repr__() methods."""
+
+    assert Person("A", 1) == Person("A", 1)
+    assert Person("A", 1) != Person("A", 2)
+    assert Person("A") != Employee("A")
+
+    assert repr(Person("A", related=Person("B"))) == (
+        "Person(name='A', age=1, related=Person(name='B', age=0, related=Null))"
+    ).replace("age=1", "age=0")
+
+    # As with dataclasses, instances with generated equality are not hashable
+    with pytest.raises(TypeError):
+        hash(Person("A"))
+
+
+def test_model_field_names():
+    """Test that fields may share the names conventionally given to the parameters of
+    the generated methods, such as 'self' and 'other'."""
+
+    class Edge(Model):
+        self: str
+        other: str = "B"
+
+    edge = Edge("A")
+
+    assert edge.self == "A"
+    assert edge.other == "B"
+
+    assert Edge(self="A", other="B") == edge
+    assert Edge(other="A", self="B") != edge
+
+    assert repr(edge) == "Edge(self='A', other='B')"
+
+    assert list(inspect.signature(Edge).parameters) == ["self", "other"]
+
+
+def test_model_custom_methods():
+    """Test that methods defined by the class are not replaced by generated methods."""
+
+    class Point(Model):
+        x: int = 0
+        y: int = 0
+
+        def __repr__(self) -> str:
+            return f"<{self.x}, {self.y}>"
+
+        def __hash__(self) -> int:
+            return hash((self.x, self.y))
+
+    assert repr(Point(1, 2)) == "<1, 2>"
+    assert Point(1, 2) == Point(1, 2)
+    assert hash(Point(1, 2)) == hash((1, 2))
+
+
+def test_model_mutable_default():
+    """Test that mutable default values are rejected."""
+
+    with pytest.raises(ValueError) as exception:
+
+        class Basket(Model):
+            items: list = []
+
+    assert str(exception.value) == (
+        "The 'items' field of the 'Basket' class cannot have a mutable default value"
+        " of type list!"
+    )
+
+
+def test_model_pickling():
+    """Test that model instances can be pickled despite not having a __dict__."""
+
+    person = Person("A", 30)
+
+    assert pickle.loads(pickle.dumps(person)) == person
+
+
+def test_model_composable():
+    """Test that the model metaclass composes with other composable metaclasses."""
+
+    metaclass = composable(model, shadowproof)
+
+    class Thing(object, metaclass=metaclass):
+        __slots__ = ()
+
+        name: str
+
+        def describe(self) -> str:
+            return f"Thing {self.name}"
+
+    assert Thing("A").describe() == "Thing A"
+
+    with pytest.raises(AttributeShadowingError):
+
+        class SomeThing(Thing):
+            describe: str = "shadowed"
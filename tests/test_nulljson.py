@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from classicist import Model, Null, NullEncoder, nullsafe
+from classicist.types import dump, dumps
+
+import io
+import json
+import pytest
+import threading
+
+
+class Person(Model):
+    """Sample model class, whose unset fields default to the Null singleton."""
+
+    name: str
+    age: int
+    related: Person
+
+
+def test_nulljson_null():
+    """Test that the Null singleton is encoded as JSON null."""
+
+    assert dumps(Null) == "null"
+    assert dumps({"a": Null, "b": [Null, 1]}) == '{"a": null, "b": [null, 1]}'
+
+    # The encoder can also be used via the standard library's JSON functions
+    assert json.dumps({"a": Null}, cls=NullEncoder) == '{"a": null}'
+
+
+def test_nulljson_models():
+    """Test that model instances are encoded as objects holding their fields."""
+
+    person = Person(name="A", age=30, related=Person(name="B"))
+
+    assert json.loads(dumps(person)) == {
+        "name": "A",
+        "age": 30,
+        "related": {"name": "B", "age": None, "related": None},
+    }
+
+
+def test_nulljson_proxies_and_iterables():
+    """Test that proxies, mappings and iterables are encoded as their JSON equivalents."""
+
+    assert dumps(nullsafe({"a": [1, None]})) == '{"a": [1, null]}'
+    assert dumps((value for value in range(3))) == "[0, 1, 2]"
+    assert dumps((value for value in ())) == "[]"
+    assert json.dumps((value for value in range(3)), cls=NullEncoder) == "[0, 1, 2]"
+    assert "".join(NullEncoder().iterencode((value for value in ()))) == "[]"
+    assert dumps({"a": frozenset([1])}) == '{"a": [1]}'
+
+    with pytest.raises(TypeError):
+        dumps(object())
+
+    with pytest.raises(ValueError):
+        values: list = []
+        values.append(values)
+        dumps(values)
+
+
+def test_nulljson_options():
+    """Test that the standard JSON encoder options are supported."""
+
+    assert dumps({"b": Null, "a": 1}, sort_keys=True) == '{"a": 1, "b": null}'
+
+    assert dumps([Null], indent=2) == "[\n  null\n]"
+
+
+def test_nulljson_dump_streams():
+    """Test that dump() writes the JSON incrementally, producing the items of iterables
+    only as they are encoded, rather than building the full JSON string in memory."""
+
+    produced: list[int] = []
+
+    class Recorder(io.StringIO):
+        """Sample file object which records how many items had been produced when each
+        of the writes was made."""
+
+        writes: list[int] = None
+
+        def write(self, text: str) -> int:
+            if self.writes is None:
+                self.writes = []
+            self.writes.append(len(produced))
+            return super().write(text)
+
+    def people(count: int):
+        for index in range(count):
+            produced.append(index)
+            yield Person(name="P%d" % (index), age=index)
+
+    file = Recorder()
+
+    written = dump({"people": people(1_000)}, file, buffer=1024)
+
+    assert written == len(file.getvalue())
+
+    decoded = json.loads(file.getvalue())
+
+    assert len(decoded["people"]) == 1_000
+    assert decoded["people"][999] == {"name": "P999", "age": 999, "related": None}
+
+    # Writes were made while the items were still being produced
+    assert len(file.writes) > 1
+    assert file.writes[0] < 1_000
+
+    with pytest.raises(TypeError):
+        dump(Null, io.StringIO(), buffer="1024")
+
+    with pytest.raises(ValueError):
+        dump(Null, io.StringIO(), buffer=-1)
+
+
+def test_nulljson_shared_encoder():
+    """Test that an encoder can be shared by threads encoding both incrementally and in
+    one shot, as encoding in one shot does not modify the shared encoder."""
+
+    encoder = NullEncoder()
+
+    class Probe(object):
+        """Sample iterable which records the state of the shared encoder when iterated
+        during encoding, as seen by any other thread using the encoder at the time."""
+
+        collecting: list[bool] = []
+
+        def __iter__(self):
+            self.collecting.append(encoder._collect)
+            yield 1
+
+    assert encoder.encode(Probe()) == "[1]"
+    assert Probe.collecting == [False]
+
+    errors: list[Exception] = []
+
+    def encode():
+        try:
+            for index in range(200):
+                assert encoder.encode(iter([index])) == f"[{index}]"
+        except Exception as exception:
+            errors.append(exception)
+
+    def stream():
+        try:
+            for index in range(200):
+                chunks = list(encoder.iterencode(iter([index])))
+
+                # Incrementally encoded iterables are streamed, not collected into lists
+                assert "".join(chunks) == f"[{index}]"
+                assert encoder._collect is False
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=target) for target in (encode, stream) * 4]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from classicist import Null, NullPath, nullpath
+
+import types
+import pytest
+
+
+class Record(object):
+    """Sample record class with nested attributes, keys and indexes for navigation."""
+
+    def __init__(self, name: str = None, tags: list = None, meta: dict = None):
+        self.name = name
+        self.tags = tags
+        self.meta = meta
+        self.related = None
+
+
+def test_nullpath_parse():
+    """Test parsing paths into their attribute, key and index steps."""
+
+    assert NullPath.parse("a") == (("attribute", "a"),)
+
+    assert NullPath.parse("a.b.c[0].d") == (
+        ("attribute", "a"),
+        ("attribute", "b"),
+        ("attribute", "c"),
+        ("index", 0),
+        ("attribute", "d"),
+    )
+
+    assert NullPath.parse("""a["x y"]['z'][key][-1]""") == (
+        ("attribute", "a"),
+        ("key", "x y"),
+        ("key", "z"),
+        ("key", "key"),
+        ("index", -1),
+    )
+
+    assert NullPath.parse("[0].a") == (("index", 0), ("attribute", "a"))
+
+
+@pytest.mark.parametrize("path", ["", ".a", "a.", "a..b", "a.[0]", "a[0", "0a", "a b"])
+def test_nullpath_parse_invalid(path: str):
+    """Test that invalid paths are rejected when parsed."""
+
+    with pytest.raises(ValueError) as exception:
+        nullpath(path)
+
+    assert str(exception.value) == f"The path '{path}' is not a valid null-safe path!"
+
+
+def test_nullpath_cached():
+    """Test that compiled paths are cached and reused."""
+
+    assert nullpath("name") is nullpath("name")
+
+    assert isinstance(nullpath("name"), NullPath)
+
+    assert nullpath("name").path == "name"
+
+
+def test_nullpath_access():
+    """Test navigating paths on an object, with missing steps collapsing to Null."""
+
+    record = Record(name="A", tags=["x", "y"], meta={"size": 3, "items": [{"id": 1}]})
+
+    assert nullpath("name")(record) == "A"
+    assert nullpath("tags[0]")(record) == "x"
+    assert nullpath("tags[-1]")(record) == "y"
+    assert nullpath("meta['size']")(record) == 3
+    assert nullpath("meta[items][0][id]")(record) == 1
+
+    # Missing attributes, keys and indexes, and None values, collapse to Null
+    assert nullpath("missing")(record) is Null
+    assert nullpath("related.name")(record) is Null
+    assert nullpath("tags[2]")(record) is Null
+    assert nullpath("tags[-3]")(record) is Null
+    assert nullpath("meta['missing'].name")(record) is Null
+    assert nullpath("name[key]")(record) is Null
+    assert nullpath("name")(None) is Null
+    assert nullpath("name")(Null) is Null
+
+
+def test_nullpath_access_custom_containers():
+    """Test navigating paths through mappings and sequences that are not dicts, lists
+    or tuples, which are accessed via their __getitem__ methods."""
+
+    record = Record(meta=types.MappingProxyType({"range": range(3)}))
+
+    assert nullpath("meta['range'][1]")(record) == 1
+    assert nullpath("meta['range'][5]")(record) is Null
+    assert nullpath("meta['missing']")(record) is Null
+
+
+def test_nullpath_access_does_not_hide_errors():
+    """Test that errors raised by the objects being navigated are not suppressed."""
+
+    class Broken(object):
+        @property
+        def name(self) -> str:
+            raise RuntimeError("broken")
+
+    with pytest.raises(RuntimeError):
+        nullpath("name")(Broken())
+
+
+def test_nullpath_extract():
+    """Test navigating a path on many objects, returning a list or a generator."""
+
+    records = [
+        Record(name="A", meta={"size": 1}),
+        Record(name="B"),
+        None,
+        Record(name="C", meta={"size": 3}),
+    ]
+
+    path = nullpath("meta['size']")
+
+    assert path.extract(records) == [1, Null, Null, 3]
+
+    generator = path.extract(iter(records), lazy=True)
+
+    assert isinstance(generator, types.GeneratorType)
+
+    assert list(generator) == [1, Null, Null, 3]
+
+    with pytest.raises(TypeError):
+        path.extract(records, lazy=1)
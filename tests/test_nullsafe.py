@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from classicist import Null, NullSafe, nullsafe
+from classicist.types import unwrapped
+
+
+class Address(object):
+    """Sample third-party style class which uses None for missing values."""
+
+    def __init__(self, city: str = None, lines: list[str] = None):
+        self.city = city
+        self.lines = lines
+        self.country = None
+
+
+class Person(object):
+    """Sample third-party style class which uses None for missing values."""
+
+    def __init__(self, name: str, address: Address = None, tags: dict = None):
+        self.name = name
+        self.address = address
+        self.tags = tags
+
+    def describe(self, prefix: str = "") -> str | None:
+        return (prefix + self.name) if self.name else None
+
+    def partner(self) -> Person | None:
+        return None
+
+
+def test_nullsafe_attributes():
+    """Test null-safe attribute access through a proxied object graph."""
+
+    person = nullsafe(Person("A", address=Address(city="Paris")))
+
+    assert isinstance(person, NullSafe)
+
+    # Scalar values are returned as they are, while other objects are wrapped
+    assert person.name == "A"
+    assert type(person.name) is str
+    assert person.address.city == "Paris"
+    assert isinstance(person.address, NullSafe)
+
+    # Missing attributes and None values collapse to Null, as do any further accesses
+    assert person.address.country is Null
+    assert person.address.country.code is Null
+    assert person.missing is Null
+    assert person.missing.deeply.nested is Null
+
+    # Special attributes that do not exist raise, so protocol checks behave as expected
+    assert not hasattr(person, "__html__")
+
+
+def test_nullsafe_items_and_iteration():
+    """Test null-safe item access and iteration through a proxied object graph."""
+
+    person = nullsafe(
+        Person("A", address=Address(lines=["1 Rue", None]), tags={"role": "admin"})
+    )
+
+    assert person.tags["role"] == "admin"
+    assert person.tags["missing"] is Null
+    assert person.address.lines[0] == "1 Rue"
+    assert person.address.lines[1] is Null
+    assert person.address.lines[5] is Null
+    assert person.missing["key"] is Null
+    assert person.tags["missing"]["key"][0] is Null
+
+    assert list(person.address.lines) == ["1 Rue", Null]
+    assert len(person.address.lines) == 2
+    assert "1 Rue" in person.address.lines
+    assert list(person.tags) == ["role"]
+    assert list(person.missing) == []
+
+
+def test_nullsafe_calls():
+    """Test that calls through a proxy wrap their return values."""
+
+    person = nullsafe(Person("A"))
+
+    assert person.describe(prefix="Person ") == "Person A"
+    assert person.partner() is Null
+    assert person.partner().name is Null
+
+
+def test_nullsafe_does_not_copy():
+    """Test that proxies wrap the underlying objects, without copying them, so changes
+    made through a proxy are applied to the underlying objects."""
+
+    address = Address(city="Paris")
+    person = Person("A", address=address)
+
+    proxy = nullsafe(person)
+
+    assert unwrapped(proxy) is person
+    assert unwrapped(proxy.address) is address
+
+    proxy.address.city = "Lyon"
+    proxy.tags = nullsafe({})
+    proxy.tags["role"] = "admin"
+
+    assert address.city == "Lyon"
+    assert person.tags == {"role": "admin"}
+    assert type(person.tags) is dict
+
+    # Proxies compare and hash as per the objects they wrap
+    assert proxy.address == address
+    assert hash(proxy.address) == hash(address)
+    assert proxy.tags == {"role": "admin"}
+
+
+def test_nullsafe_values():
+    """Test wrapping None, scalar values and existing proxies."""
+
+    assert nullsafe(None) is Null
+    assert nullsafe(Null) is Null
+    assert nullsafe(1) == 1
+    assert nullsafe("A") == "A"
+
+    proxy = nullsafe([1, 2])
+
+    assert nullsafe(proxy) is proxy
+
+    assert repr(proxy) == "nullsafe([1, 2])"
+    assert str(proxy) == "[1, 2]"
+    assert bool(nullsafe([])) is False
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 from classicist import NullType, Null
 
+import copy
+import pickle
+import pytest
+
 
 def test_nulltype():
     """Test the `NullType` class."""
@@ -64,6 +68,19 @@ def test_nulltype_arbitrary_attribute_access():
     assert thing.a.c.d.e.f is Null
 
 
+def test_nulltype_arbitrary_item_access():
+    """Test arbitrary item access and iteration on the `Null` singleton instance."""
+
+    thing = Null
+
+    assert thing["a"] is Null
+    assert thing["a"][0] is Null
+    assert thing.a["b"].c is Null
+
+    assert list(thing) == []
+    assert list(thing.a["b"]) == []
+
+
 def test_nulltype_boolean_comparison():
     """Test arbitrary attribute boolean comparison on the `Null` singleton instance."""
 
@@ -263,3 +280,41 @@ def test_nulltype_with_a_custom_data_model():
 
     # We can however perform an identity check against the `Null` singleton if needed:
     assert model.relates is Null
+
+
+def test_nulltype_special_attribute_access():
+    """Test that missing special attributes raise rather than returning `Null`."""
+
+    assert Null.name is Null
+
+    with pytest.raises(AttributeError):
+        Null.__missing_special_attribute__
+
+    assert not hasattr(Null, "__length_hint__")
+
+
+def test_nulltype_pickling():
+    """Test that pickling the `Null` singleton preserves its singleton identity."""
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(Null, protocol=protocol)) is Null
+
+    # The singleton is pickled by reference, rather than via its state
+    assert pickle.dumps(Null, protocol=0) == b"cclassicist.types.null\nNull\np0\n."
+
+    values = pickle.loads(pickle.dumps({"a": Null, "b": [Null, 1]}))
+
+    assert values["a"] is Null
+    assert values["b"][0] is Null
+
+
+def test_nulltype_copying():
+    """Test that copying the `Null` singleton returns the singleton itself."""
+
+    assert copy.copy(Null) is Null
+    assert copy.deepcopy(Null) is Null
+
+    values = copy.deepcopy({"a": Null, "b": [Null, 1]})
+
+    assert values["a"] is Null
+    assert values["b"][0] is Null
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from classicist import (
+    cachedclassproperty,
+    classproperty,
+    deprecated,
+    hybridmethod,
+    memoize,
+    memoizer,
+    runtime,
+    runtimer,
+)
+from classicist.inspector import locate, reference
+
+from concurrent.futures import ProcessPoolExecutor
+
+import multiprocessing
+import os
+import pickle
+import pytest
+
+
+@runtimer
+def square(value: int) -> int:
+    """Sample CPU-bound function, timed via the @runtimer decorator."""
+
+    return value * value
+
+
+@memoize
+def cube(value: int) -> int:
+    """Sample CPU-bound function, memoized via the @memoize decorator."""
+
+    return value * value * value
+
+
+@deprecated(reason="testing")
+def negate(value: int) -> int:
+    """Sample function, marked as deprecated via the @deprecated decorator."""
+
+    return -value
+
+
+class Calculator(object):
+    """Sample class whose methods and properties are defined via classicist decorators."""
+
+    factor: int = 2
+
+    def __init__(self, factor: int = 3):
+        self.factor = factor
+
+    @hybridmethod
+    def scale(self, value: int) -> int:
+        return value * self.factor
+
+    @runtimer
+    def add(self, value: int) -> int:
+        return value + self.factor
+
+    @classmethod
+    @runtimer
+    def subtract(cls, value: int) -> int:
+        return value - cls.factor
+
+    @memoize
+    def double(self, value: int) -> int:
+        return value * 2
+
+    @classproperty
+    def name(cls) -> str:
+        return cls.__name__
+
+    @cachedclassproperty
+    def title(cls) -> str:
+        return cls.__name__.upper()
+
+
+def apply(function: callable, value: int) -> tuple[int, int]:
+    """Calls the function in the worker process, returning its result and the worker's
+    process identifier."""
+
+    return (function(value), os.getpid())
+
+
+def describe(objects: list[object]) -> list[str]:
+    """Describes the unpickled objects within the worker process."""
+
+    return [type(value).__name__ for value in objects]
+
+
+def test_pickling_by_reference():
+    """Test that the decorated functions, descriptors and helper objects are pickled
+    by reference, and that unpickling returns the same objects in this process."""
+
+    objects: list[object] = [
+        square,
+        cube,
+        negate,
+        Calculator.scale,
+        Calculator().scale,
+        Calculator.subtract,
+        vars(Calculator)["scale"],
+        vars(Calculator)["name"],
+        vars(Calculator)["title"],
+        runtime(square),
+        runtime(Calculator.add),
+        runtime(Calculator.subtract),
+        memoizer(cube),
+        memoizer(Calculator.double),
+    ]
+
+    for value in objects:
+        unpickled = pickle.loads(pickle.dumps(value))
+
+        if type(value).__name__ == "method":
+            assert unpickled.__func__ is value.__func__
+        else:
+            assert unpickled is value
+
+    # The descriptors are located on their class, rather than being invoked
+    assert locate(__name__, "Calculator.name") is vars(Calculator)["name"]
+    assert reference(square) == (__name__, "square")
+
+
+def test_pickling_locals_raises():
+    """Test that objects derived from functions that cannot be located by name raise a
+    TypeError when they are pickled, rather than being unpickled incorrectly."""
+
+    @runtimer
+    def local(value: int) -> int:
+        return value
+
+    with pytest.raises((TypeError, pickle.PicklingError, AttributeError)):
+        pickle.dumps(runtime(local))
+
+    with pytest.raises(TypeError):
+        reference(lambda: None)
+
+    with pytest.raises(AttributeError):
+        locate(__name__, "Calculator.missing")
+
+
+@pytest.mark.parametrize("method", ["fork", "spawn"])
+def test_pickling_process_pool(method: str):
+    """Test that decorated functions and methods can be run in a process pool."""
+
+    if not method in multiprocessing.get_all_start_methods():
+        pytest.skip(f"The '{method}' start method is not supported on this platform!")
+
+    context = multiprocessing.get_context(method)
+
+    functions: list[callable] = [
+        square,
+        cube,
+        negate,
+        Calculator.scale,
+        Calculator(4).scale,
+        Calculator(5).add,
+        Calculator.subtract,
+        Calculator(6).double,
+    ]
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        results = list(executor.map(apply, functions, [3] * len(functions)))
+
+        described = executor.submit(
+            describe,
+            [
+                vars(Calculator)["scale"],
+                vars(Calculator)["name"],
+                runtime(square),
+                memoizer(cube),
+            ],
+        ).result()
+
+    assert [result for (result, pid) in results] == [9, 27, -3, 6, 12, 8, 1, 6]
+
+    # The calls were made in the worker processes, so this process' timings are unused
+    assert all(pid != os.getpid() for (result, pid) in results)
+
+    assert described == ["hybridmethod", "classproperty", "Runtimer", "Memoizer"]
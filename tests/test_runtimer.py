@@ -1,6 +1,28 @@
 from classicist import Runtimer, runtimer, runtime, has_runtimer
+from classicist.decorators.runtimer import (
+    Clock,
+    ManualClock,
+    clocks,
+    registry,
+    runtimers,
+    snapshot,
+    export_json,
+    export_openmetrics,
+    profiler,
+)
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import asyncio
+import gc
+import inspect
+import json
+import pytest
+import sys
+import threading
 import time
+import weakref
 
 
 def test_runtimer_for_function():
@@ -86,3 +108,899 @@ def test_has_runtimer_helper_method():
         pass
 
     assert has_runtimer(function_without_runtimer) is False
+
+
+def test_runtimer_with_manual_clock():
+    """Test the runtimer with an injected manual clock for deterministic timings."""
+
+    clock = ManualClock(now=1_000)
+
+    @runtimer(clock=clock)
+    def advance(nanoseconds: int) -> int:
+        clock.advance(nanoseconds)
+        return nanoseconds
+
+    assert has_runtimer(advance)
+    assert isinstance(timer := runtime(advance), Runtimer)
+    assert timer.clock is clock
+
+    # Before any calls have been made, no time has been recorded
+    assert timer.nanoseconds == 0
+    assert timer.duration == 0.0
+    assert timer.timedelta == timedelta(0)
+
+    assert advance(1_500_000) == 1_500_000
+
+    assert timer.nanoseconds == 1_500_000
+    assert timer.duration == 0.0015
+    assert timer.timedelta == timedelta(microseconds=1_500)
+    assert timer.stopped - timer.started == timedelta(microseconds=1_500)
+
+
+def test_runtimer_with_named_clocks():
+    """Test the runtimer with each of the named clocks."""
+
+    for name, clock in clocks.items():
+        assert isinstance(clock, Clock)
+        assert clock.name == name
+        assert isinstance(clock(), int)
+
+        @runtimer(clock=name)
+        def function() -> int:
+            return sum(range(1000))
+
+        assert function() == 499500
+        assert runtime(function).clock is clock
+        assert runtime(function).nanoseconds >= 0
+
+
+def test_runtimer_with_callable_clock():
+    """Test the runtimer with a callable that returns integer nanosecond timestamps."""
+
+    # Note that the first timestamp is read by the Clock as its wall-clock anchor
+    timestamps = iter([0, 100, 350])
+
+    @runtimer(clock=lambda: next(timestamps))
+    def function() -> None:
+        pass
+
+    function()
+
+    assert runtime(function).nanoseconds == 250
+
+
+def test_runtimer_with_invalid_clock():
+    """Test the runtimer with an invalid clock name and clock value."""
+
+    with pytest.raises(ValueError):
+
+        @runtimer(clock="sundial")
+        def named() -> None:
+            pass
+
+    with pytest.raises(TypeError):
+
+        @runtimer(clock=123)
+        def numbered() -> None:
+            pass
+
+
+def test_runtimer_start_and_stop():
+    """Test manually starting and stopping a Runtimer instance."""
+
+    clock = ManualClock()
+
+    timer = Runtimer(lambda: None, clock=clock)
+
+    assert timer.start() is timer
+    clock.advance(2_000)
+    assert timer.stop() is timer
+
+    assert timer.nanoseconds == 2_000
+
+    assert timer.reset() is timer
+    assert timer.nanoseconds == 0
+
+
+def test_runtimer_statistics():
+    """Test the call time statistics gathered by the runtimer across calls."""
+
+    clock = ManualClock()
+
+    @runtimer(clock=clock)
+    def function(nanoseconds: int) -> None:
+        clock.advance(nanoseconds)
+
+    for milliseconds in range(1, 101):
+        function(milliseconds * 1_000_000)
+
+    timer = runtime(function)
+
+    assert timer.count == 100
+    assert timer.total == pytest.approx(5.05)
+    assert timer.minimum == pytest.approx(0.001)
+    assert timer.maximum == pytest.approx(0.1)
+    assert timer.mean == pytest.approx(0.0505)
+
+    # The percentiles are estimates, within the histogram's relative error bound
+    assert timer.percentile(0.5) == pytest.approx(0.05, rel=1 / 32)
+    assert timer.percentile(0.99) == pytest.approx(0.099, rel=1 / 32)
+
+    # The most recent call's timing remains available
+    assert timer.duration == pytest.approx(0.1)
+
+    snapshot = timer.snapshot()
+
+    assert snapshot["function"].endswith("function")
+    assert snapshot["clock"] == "manual"
+    assert snapshot["count"] == 100
+    assert snapshot["total"] == pytest.approx(5.05)
+    assert snapshot["percentiles"]["p50"] == timer.percentile(0.5)
+
+    # The snapshot is not affected by subsequent calls
+    function(1_000_000)
+
+    assert timer.count == 101
+    assert snapshot["count"] == 100
+
+    assert timer.reset() is timer
+    assert timer.count == 0
+    assert timer.percentile(0.5) == 0.0
+
+
+def test_runtimer_merge():
+    """Test merging the statistics gathered by Runtimer instances."""
+
+    clock = ManualClock()
+
+    first = Runtimer(lambda: None, clock=clock)
+    second = Runtimer(lambda: None, clock=clock)
+
+    for timer, nanoseconds in ((first, 1_000), (second, 3_000), (second, 5_000)):
+        timer.start()
+        clock.advance(nanoseconds)
+        timer.stop()
+
+    assert first.merge(second) is first
+    assert first.count == 3
+    assert first.total == pytest.approx(9e-6)
+    assert second.count == 2
+
+    with pytest.raises(TypeError):
+        first.merge(None)
+
+
+def test_runtimer_with_concurrent_threads():
+    """Test the runtimer when a decorated function is called concurrently from many
+    threads, ensuring that each call's start and stop timestamps are correctly paired
+    and that the statistics recorded by each thread are merged together when read."""
+
+    # Each thread has its own tick count, so each call's duration is known exactly, and
+    # any pairing of one call's start timestamp with another's stop would be detected
+    ticks = threading.local()
+
+    def clock() -> int:
+        return getattr(ticks, "now", 0)
+
+    @runtimer(clock=clock)
+    def function(nanoseconds: int) -> int:
+        ticks.now = clock() + nanoseconds
+        time.sleep(0)  # Encourage switching between the threads mid-call
+        return nanoseconds
+
+    threads: int = 32
+    calls: int = 500
+
+    barrier = threading.Barrier(threads)
+
+    def worker(index: int):
+        barrier.wait()
+        for _ in range(calls):
+            function((index + 1) * 1_000)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for future in [executor.submit(worker, index) for index in range(threads)]:
+            future.result()
+
+    timer = runtime(function)
+
+    assert timer.count == threads * calls
+    assert timer.histogram.total == sum(
+        (index + 1) * 1_000 * calls for index in range(threads)
+    )
+    assert timer.histogram.minimum == 1_000
+    assert timer.histogram.maximum == threads * 1_000
+
+    # Once the worker threads have finished, their histograms are folded together, but
+    # the statistics remain the same whenever they are read
+    assert timer.count == threads * calls
+    assert len(timer._shards) == 0
+
+    # Calls made from the current thread are merged with those made from the workers
+    function(1_000)
+
+    assert timer.count == threads * calls + 1
+    assert len(timer._shards) == 1
+
+    timer.reset()
+
+    assert timer.count == 0
+
+    function(1_000)
+
+    assert timer.count == 1
+
+
+def test_runtimer_for_coroutine_function():
+    """Test the runtimer for a coroutine function, ensuring that the time spent awaiting
+    is included in the timing, rather than just the time taken to create the coroutine.
+    """
+
+    @runtimer
+    async def complex(value: int, sleep: float = 0.01) -> int:
+        await asyncio.sleep(sleep)
+        return value * 2
+
+    assert inspect.iscoroutinefunction(complex)
+    assert complex.__name__ == "complex"
+    assert has_runtimer(complex)
+
+    assert asyncio.run(complex(value=2)) == 4
+
+    assert isinstance(timer := runtime(complex), Runtimer)
+    assert timer.count == 1
+    assert 0.01 <= timer.duration < 0.05
+
+
+def test_runtimer_for_concurrent_coroutines():
+    """Test the runtimer for coroutines awaited concurrently via asyncio.gather, which
+    interleave on a single thread, ensuring that each call is timed independently."""
+
+    @runtimer
+    async def complex(sleep: float) -> float:
+        await asyncio.sleep(sleep)
+        return sleep
+
+    async def main() -> list[float]:
+        return await asyncio.gather(*[complex(0.01 * (i % 3 + 1)) for i in range(30)])
+
+    assert len(asyncio.run(main())) == 30
+
+    timer = runtime(complex)
+
+    # Each call's duration includes the time it spent awaiting; the upper bounds are
+    # generous to allow for scheduling delays on heavily loaded test machines
+    assert timer.count == 30
+    assert 0.01 <= timer.minimum < 0.03
+    assert 0.03 <= timer.maximum < 0.5
+    assert 0.6 <= timer.total < 5.0
+
+
+def test_runtimer_for_generator_function():
+    """Test the runtimer for a generator function, ensuring that the whole stream is
+    timed, along with the time to the first item and the number of items produced."""
+
+    clock = ManualClock()
+
+    @runtimer(clock=clock)
+    def numbers(count: int) -> int:
+        clock.advance(5_000)  # Simulate the time taken to produce the first item
+        for number in range(count):
+            yield number
+            clock.advance(1_000)
+        return count
+
+    assert inspect.isgeneratorfunction(numbers)
+    assert numbers.__name__ == "numbers"
+
+    generator = numbers(10)
+
+    # Creating the generator does not run any of its code, so nothing has been timed
+    assert runtime(numbers).count == 0
+
+    assert list(generator) == list(range(10))
+
+    timer = runtime(numbers)
+
+    assert timer.count == 1
+    assert timer.items == 10
+    assert timer.nanoseconds == 15_000
+    assert timer.statistics.first.count == 1
+    assert timer.statistics.first.total == 5_000
+
+    snapshot = timer.snapshot()
+
+    assert snapshot["items"] == 10
+    assert snapshot["first"]["count"] == 1
+    assert snapshot["first"]["total"] == pytest.approx(5e-6)
+
+
+def test_runtimer_for_generator_function_delegation():
+    """Test that the runtimer passes through sent values, thrown exceptions, the return
+    value and closure of the wrapped generator, and records streams closed early."""
+
+    @runtimer
+    def accumulator():
+        total = 0
+        while True:
+            try:
+                value = yield total
+            except ValueError:
+                value = -total  # Reset the total when a ValueError is thrown in
+            if value is None:
+                return total
+            total += value
+
+    generator = accumulator()
+
+    assert next(generator) == 0
+    assert generator.send(5) == 5
+    assert generator.send(10) == 15
+    assert generator.throw(ValueError) == 0
+    assert generator.send(7) == 7
+
+    with pytest.raises(StopIteration) as stop:
+        generator.send(None)
+
+    assert stop.value.value == 7
+
+    assert runtime(accumulator).count == 1
+    assert runtime(accumulator).items == 5
+
+    # Closing a generator early still records the stream
+    generator = accumulator()
+
+    assert next(generator) == 0
+
+    generator.close()
+
+    assert runtime(accumulator).count == 2
+    assert runtime(accumulator).items == 6
+
+
+def test_runtimer_for_asynchronous_generator_function():
+    """Test the runtimer for an asynchronous generator function."""
+
+    @runtimer
+    async def numbers(count: int):
+        await asyncio.sleep(0.01)
+        for number in range(count):
+            await asyncio.sleep(0)
+            yield number
+
+    assert inspect.isasyncgenfunction(numbers)
+    assert numbers.__name__ == "numbers"
+
+    async def main() -> list[int]:
+        return [number async for number in numbers(5)]
+
+    assert asyncio.run(main()) == [0, 1, 2, 3, 4]
+
+    timer = runtime(numbers)
+
+    assert timer.count == 1
+    assert timer.items == 5
+    assert timer.duration >= 0.01
+    assert timer.statistics.first.minimum >= 10_000_000
+
+
+def test_runtimer_for_asynchronous_generator_function_delegation():
+    """Test that the runtimer passes through values sent to and exceptions thrown into
+    the wrapped asynchronous generator, as well as its closure."""
+
+    @runtimer
+    async def echo():
+        value = None
+        while True:
+            try:
+                value = yield value
+            except ValueError:
+                value = "reset"
+
+    async def main() -> list[object]:
+        generator = echo()
+        results = [await generator.asend(None)]
+        results.append(await generator.asend("hello"))
+        results.append(await generator.athrow(ValueError))
+        await generator.aclose()
+        return results
+
+    assert asyncio.run(main()) == [None, "hello", "reset"]
+
+    assert runtime(echo).count == 1
+    assert runtime(echo).items == 3
+
+
+def test_runtimer_for_failing_function():
+    """Test the runtimer for calls that raise exceptions, ensuring that the failed calls
+    are timed and recorded separately from the successful calls, and counted by type."""
+
+    clock = ManualClock()
+
+    @runtimer(clock=clock)
+    def divide(value: int, divisor: int, nanoseconds: int) -> float:
+        clock.advance(nanoseconds)
+        return value / divisor
+
+    assert divide(10, 2, 1_000) == 5.0
+
+    with pytest.raises(ZeroDivisionError):
+        divide(10, 0, 250_000)
+
+    with pytest.raises(TypeError):
+        divide("10", 2, 50_000)
+
+    timer = runtime(divide)
+
+    assert timer.count == 3
+    assert timer.failures == 2
+    assert timer.errors == {"ZeroDivisionError": 1, "TypeError": 1}
+
+    # The failed call's duration is recorded, rather than being left running
+    assert timer.nanoseconds == 50_000
+    assert timer.statistics.successes.total == 1_000
+    assert timer.statistics.failures.total == 300_000
+    assert timer.statistics.failures.maximum == 250_000
+
+    snapshot = timer.snapshot()
+
+    assert snapshot["count"] == 3
+    assert snapshot["successes"]["count"] == 1
+    assert snapshot["failures"]["count"] == 2
+    assert snapshot["failures"]["maximum"] == pytest.approx(250e-6)
+    assert snapshot["errors"] == {"ZeroDivisionError": 1, "TypeError": 1}
+
+
+def test_runtimer_for_failing_coroutine_function():
+    """Test the runtimer for coroutines that raise exceptions or are cancelled, such as
+    when they time out, which are recorded as failures."""
+
+    @runtimer
+    async def slow(sleep: float) -> None:
+        await asyncio.sleep(sleep)
+
+    async def main():
+        await slow(0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(slow(1.0), timeout=0.01)
+
+    asyncio.run(main())
+
+    timer = runtime(slow)
+
+    assert timer.count == 2
+    assert timer.failures == 1
+    assert timer.errors == {"asyncio.exceptions.CancelledError": 1}
+    # The event loop may fire the timeout slightly early, so allow some leeway here
+    assert timer.statistics.failures.minimum >= 5_000_000
+
+
+def test_runtimer_for_failing_generator_functions():
+    """Test the runtimer for generators and asynchronous generators that raise."""
+
+    @runtimer
+    def numbers():
+        yield 1
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        list(numbers())
+
+    generator = numbers()
+
+    assert next(generator) == 1
+
+    # Closing a stream early is not considered to be a failure
+    generator.close()
+
+    assert runtime(numbers).count == 2
+    assert runtime(numbers).failures == 1
+    assert runtime(numbers).errors == {"ValueError": 1}
+    assert runtime(numbers).items == 2
+
+    @runtimer
+    async def letters():
+        yield "a"
+        raise KeyError("b")
+
+    async def main():
+        with pytest.raises(KeyError):
+            async for _ in letters():
+                pass
+
+    asyncio.run(main())
+
+    assert runtime(letters).count == 1
+    assert runtime(letters).failures == 1
+    assert runtime(letters).errors == {"KeyError": 1}
+
+
+def test_runtimer_sampling_every_nth_call():
+    """Test the runtimer when timing every nth call, ensuring all calls are counted and
+    that the total call time is extrapolated from the timed calls."""
+
+    clock = ManualClock()
+
+    @runtimer(clock=clock, every=10)
+    def function() -> None:
+        clock.advance(1_000)
+
+    for _ in range(1_000):
+        function()
+
+    timer = runtime(function)
+
+    assert timer.every == 10
+    assert timer.sample is None
+
+    assert timer.calls == 1_000
+    assert timer.count == 100
+    assert timer.total == pytest.approx(100e-6)
+    assert timer.estimated_total == pytest.approx(1_000e-6)
+
+    snapshot = timer.snapshot()
+
+    assert snapshot["calls"] == 1_000
+    assert snapshot["skipped"] == 900
+    assert snapshot["estimated_total"] == pytest.approx(1_000e-6)
+
+    # The sampling can be changed at runtime without redecorating the function
+    timer.every = None
+
+    for _ in range(10):
+        function()
+
+    assert timer.calls == 1_010
+    assert timer.count == 110
+
+
+def test_runtimer_sampling_random_fraction_of_calls():
+    """Test the runtimer when timing a random fraction of calls."""
+
+    @runtimer(sample=0.1)
+    def function() -> None:
+        pass
+
+    for _ in range(10_000):
+        function()
+
+    timer = runtime(function)
+
+    assert timer.sample == 0.1
+    assert timer.every is None
+
+    assert timer.calls == 10_000
+    assert 500 < timer.count < 1_500
+
+    # Setting the sample to 1.0 times every call
+    timer.sample = 1.0
+
+    for _ in range(100):
+        function()
+
+    assert timer.calls == 10_100
+    assert timer.count == timer.calls - timer.snapshot()["skipped"]
+
+
+def test_runtimer_sampling_for_coroutines_and_generators():
+    """Test the runtimer when sampling calls to coroutines and generators."""
+
+    @runtimer(every=2)
+    async def coroutine() -> int:
+        return 1
+
+    async def main() -> list[int]:
+        return [await coroutine() for _ in range(10)]
+
+    assert asyncio.run(main()) == [1] * 10
+
+    assert runtime(coroutine).calls == 10
+    assert runtime(coroutine).count == 5
+
+    @runtimer(every=4)
+    def generator():
+        yield 1
+        return 2
+
+    for _ in range(8):
+        assert list(generator()) == [1]
+
+    assert runtime(generator).calls == 8
+    assert runtime(generator).count == 2
+    assert runtime(generator).items == 2
+
+    @runtimer(every=3)
+    async def agenerator():
+        yield 1
+
+    async def consume() -> list[int]:
+        return [item for _ in range(9) async for item in agenerator()]
+
+    assert asyncio.run(consume()) == [1] * 9
+
+    assert runtime(agenerator).calls == 9
+    assert runtime(agenerator).count == 3
+
+
+def test_runtimer_sampling_changed_concurrently():
+    """Test that calls made concurrently while the sampling mode is being switched at
+    runtime are counted without error, as the mode is replaced as a whole."""
+
+    @runtimer
+    def function() -> None:
+        pass
+
+    timer = runtime(function)
+
+    stop = threading.Event()
+
+    errors: list[Exception] = []
+
+    def call():
+        try:
+            while not stop.is_set():
+                function()
+        except Exception as exception:
+            errors.append(exception)
+
+    threads = [threading.Thread(target=call) for _ in range(4)]
+
+    # Switch threads as often as possible, to widen the window for any interleaving
+    interval: float = sys.getswitchinterval()
+
+    sys.setswitchinterval(1e-6)
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        for _ in range(20_000):
+            timer.sample = 0.5
+            timer.every = 10
+            timer.sample = None
+    finally:
+        stop.set()
+
+        for thread in threads:
+            thread.join()
+
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert timer.calls == timer.count + timer.snapshot()["skipped"]
+
+
+def test_runtimer_sampling_invalid_arguments():
+    """Test the runtimer's sampling argument validation."""
+
+    with pytest.raises(ValueError):
+
+        @runtimer(sample=0.5, every=2)
+        def both() -> None:
+            pass
+
+    with pytest.raises(ValueError):
+        runtimer(sample=0.0)(lambda: None)
+
+    with pytest.raises(ValueError):
+        runtimer(every=0)(lambda: None)
+
+    with pytest.raises(TypeError):
+        runtimer(every=2.5)(lambda: None)
+
+
+def test_runtimer_registry():
+    """Test the process-wide registry of Runtimer instances."""
+
+    @runtimer
+    def registered_function() -> None:
+        pass
+
+    timer = runtime(registered_function)
+
+    assert timer in registry
+    assert timer in runtimers()
+
+    registered_function()
+
+    snapshots = snapshot()
+
+    assert isinstance(snapshots, dict)
+    assert timer.name in snapshots
+    assert snapshots[timer.name]["count"] == 1
+    assert snapshots[timer.name]["function"] == timer.qualname
+    assert snapshots[timer.name]["module"] == __name__
+
+    # The registry holds weak references, so Runtimers are collected with functions
+    reference = weakref.ref(timer)
+
+    del timer, registered_function
+
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_runtimer_registry_merges_runtimers_for_the_same_function():
+    """Test that the registry snapshot merges statistics of Runtimers timing functions
+    with the same fully qualified name, such as functions redefined in a loop."""
+
+    functions = []
+
+    for _ in range(3):
+
+        @runtimer
+        def redefined_function() -> None:
+            pass
+
+        redefined_function()
+
+        functions.append(redefined_function)
+
+    name = runtime(functions[0]).name
+
+    assert snapshot()[name]["count"] == 3
+
+
+def test_runtimer_registry_exports():
+    """Test exporting the registry's statistics as JSON and in OpenMetrics format."""
+
+    @runtimer
+    def exported_function(value: int) -> float:
+        return 1 / value
+
+    exported_function(1)
+
+    with pytest.raises(ZeroDivisionError):
+        exported_function(0)
+
+    name = runtime(exported_function).name
+
+    exported = json.loads(export_json())
+
+    assert exported[name]["count"] == 2
+    assert exported[name]["errors"] == {"ZeroDivisionError": 1}
+
+    snapshots = {name: snapshot()[name]}
+
+    metrics = export_openmetrics(snapshots, prefix="test").splitlines()
+
+    labels = f'function="{runtime(exported_function).qualname}",module="{__name__}"'
+
+    assert metrics[0] == "# TYPE test_seconds summary"
+    assert metrics[1] == "# UNIT test_seconds seconds"
+    assert metrics[-1] == "# EOF"
+
+    assert f"test_seconds_count{{{labels}}} 2" in metrics
+    assert f"test_calls_total{{{labels}}} 2" in metrics
+    assert f'test_failures_total{{{labels},exception="ZeroDivisionError"}} 1' in metrics
+    assert any(
+        line.startswith(f'test_seconds{{{labels},quantile="0.99"}} ')
+        for line in metrics
+    )
+
+    with pytest.raises(ValueError):
+        export_openmetrics(snapshots, prefix="not a valid prefix")
+
+
+def test_runtimer_profiler_call_tree():
+    """Test the profiler's call tree of inclusive and exclusive times per call path."""
+
+    clock = ManualClock()
+
+    @runtimer(clock=clock)
+    def leaf_function() -> None:
+        clock.advance(100)
+
+    @runtimer(clock=clock)
+    def inner_function() -> None:
+        clock.advance(10)
+        leaf_function()
+
+    @runtimer(clock=clock)
+    def outer_function() -> None:
+        clock.advance(1000)
+        inner_function()
+        inner_function()
+        leaf_function()
+
+    outer_function()  # Calls made while the profiler is disabled are not tracked
+
+    profiler.reset().enable()
+
+    try:
+        outer_function()
+    finally:
+        profiler.disable()
+
+    outer, inner, leaf = (
+        runtime(function).name
+        for function in (outer_function, inner_function, leaf_function)
+    )
+
+    assert profiler.totals() == {
+        (outer,): (1, 1320, 1000),
+        (outer, inner): (2, 220, 20),
+        (outer, inner, leaf): (2, 200, 200),
+        (outer, leaf): (1, 100, 100),
+    }
+
+    # The Runtimers continue to record statistics while the profiler is enabled
+    assert runtime(outer_function).count == 2
+    assert runtime(leaf_function).count == 6
+
+    assert profiler.collapsed(unit="ns").splitlines() == [
+        f"{outer} 1000",
+        f"{outer};{inner} 20",
+        f"{outer};{inner};{leaf} 200",
+        f"{outer};{leaf} 100",
+    ]
+
+    assert profiler.snapshot()[1] == {
+        "path": [outer, inner],
+        "count": 2,
+        "inclusive": 220 / 1e9,
+        "exclusive": 20 / 1e9,
+    }
+
+    with pytest.raises(ValueError):
+        profiler.collapsed(unit="minutes")
+
+    profiler.reset()
+
+    assert profiler.collapsed() == ""
+
+
+def test_runtimer_profiler_across_threads_and_tasks():
+    """Test that the profiler tracks separate call paths for each thread and task."""
+
+    @runtimer
+    def threaded_child() -> None:
+        time.sleep(0.001)
+
+    @runtimer
+    def threaded_parent(value: int) -> int:
+        threaded_child()
+        return value
+
+    @runtimer
+    async def task_child() -> None:
+        await asyncio.sleep(0.001)
+
+    @runtimer
+    async def task_parent() -> None:
+        await asyncio.gather(task_child(), task_child())
+
+    profiler.reset().enable()
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(threaded_parent, range(8))) == list(range(8))
+
+        asyncio.run(task_parent())
+
+        # Failed calls are tracked within the call tree too
+        with pytest.raises(TypeError):
+            threaded_parent()
+    finally:
+        profiler.disable()
+
+    totals = profiler.totals()
+
+    parent, child = runtime(threaded_parent).name, runtime(threaded_child).name
+
+    assert totals[(parent,)][0] == 9
+    assert totals[(parent, child)][0] == 8
+    assert (child,) not in totals
+
+    parent, child = runtime(task_parent).name, runtime(task_child).name
+
+    assert totals[(parent,)][0] == 1
+    assert totals[(parent, child)][0] == 2
+
+    # Exclusive times are floored at zero, as the awaited child tasks overlap in time
+    for count, inclusive, exclusive in totals.values():
+        assert 0 <= exclusive <= inclusive
+
+    profiler.reset()
@@ -39,3 +39,212 @@ def test_subclassing_with_shadowproof():
         assert Thing.greeting == "hello"
         assert SomeThing.greeting == "hello"
         assert str(exception) == ""
+
+
+def test_shadowproof_indirect_ancestor():
+    """Test that shadowing of an attribute defined by an indirect ancestor is detected,
+    and that the message names the ancestor class that defines the attribute."""
+
+    class Thing(object, metaclass=shadowproof):
+        greeting: str = "hello"
+
+    class SomeThing(Thing):
+        farewell: str = "goodbye"
+
+    class OtherThing(SomeThing):
+        salutation: str = "hi"
+
+    with pytest.raises(AttributeShadowingError) as exception:
+
+        class AnotherThing(OtherThing):
+            greeting: str = "bonjour"
+
+    assert str(exception.value) == (
+        "The 'greeting' attribute in the 'AnotherThing' class shadows the attribute of"
+        " the same name in the 'Thing' base class!"
+    )
+
+
+def test_shadowproof_multiple_bases():
+    """Test that shadowing is detected across each of the base classes of a class."""
+
+    class Thing(object, metaclass=shadowproof):
+        greeting: str = "hello"
+
+    class Mixin(object):
+        farewell: str = "goodbye"
+
+    class SomeThing(Thing, Mixin):
+        salutation: str = "hi"
+
+    with pytest.raises(AttributeShadowingError) as exception:
+
+        class OtherThing(SomeThing):
+            farewell: str = "au revoir"
+
+    assert "in the 'Mixin' base class!" in str(exception.value)
+
+
+def test_shadowproof_diamond_inheritance():
+    """Test that shadowing is reported against the class that defines the attribute
+    which is nearest along the method resolution order of a diamond hierarchy."""
+
+    class Thing(object, metaclass=shadowproof):
+        greeting: str = "hello"
+
+    class LeftThing(Thing):
+        farewell: str = "goodbye"
+
+    class RightThing(Thing, raises=False):
+        greeting: str = "hi"
+
+    # The method resolution order is (LeftThing, RightThing, Thing, object), so the
+    # greeting resolves to the one defined by RightThing rather than by Thing
+    with pytest.raises(AttributeShadowingError) as exception:
+
+        class SomeThing(LeftThing, RightThing):
+            greeting: str = "bonjour"
+
+    assert "in the 'RightThing' base class!" in str(exception.value)
+
+    class OtherThing(LeftThing, RightThing):
+        salutation: str = "hey"
+
+    assert OtherThing.greeting == "hi"
+
+    # The same applies to subclasses of a diamond hierarchy, whose indexes are reused
+    with pytest.raises(AttributeShadowingError) as exception:
+
+        class AnotherThing(OtherThing):
+            greeting: str = "bonjour"
+
+    assert "in the 'RightThing' base class!" in str(exception.value)
+
+    # The same applies to base classes that were not created by the metaclass
+    class Plain(object):
+        greeting: str = "hello"
+
+    class LeftPlain(Plain):
+        pass
+
+    class RightPlain(Plain):
+        greeting: str = "hi"
+
+    class DiamondPlain(LeftPlain, RightPlain):
+        pass
+
+    with pytest.raises(AttributeShadowingError) as exception:
+
+        class PlainThing(DiamondPlain, metaclass=shadowproof):
+            greeting: str = "bonjour"
+
+    assert "in the 'RightPlain' base class!" in str(exception.value)
+
+
+def test_shadowproof_does_not_invoke_descriptors():
+    """Test that descriptors on the base classes are not invoked while checking."""
+
+    calls: list[str] = []
+
+    class Descriptor(object):
+        def __get__(self, instance: object, owner: type) -> str:
+            calls.append(owner.__name__)
+            return "hello"
+
+    class Thing(object, metaclass=shadowproof):
+        greeting = Descriptor()
+
+    class SomeThing(Thing):
+        farewell: str = "goodbye"
+
+    with pytest.raises(AttributeShadowingError):
+
+        class OtherThing(SomeThing):
+            greeting: str = "bonjour"
+
+    assert calls == []
+
+
+def test_shadowproof_without_raising():
+    """Test that shadowing is logged rather than raised when raises is set to False."""
+
+    class Thing(object, metaclass=shadowproof):
+        greeting: str = "hello"
+
+    class SomeThing(Thing, raises=False):
+        greeting: str = "goodbye"
+
+    assert SomeThing.greeting == "goodbye"
+
+
+def test_shadowproof_attribute_assignment():
+    """Test that attributes assigned to a class after creation are detected."""
+
+    class Thing(object, metaclass=shadowproof):
+        greeting: str = "hello"
+
+    class SomeThing(Thing):
+        salutation: str = "hi"
+
+    Thing.farewell = "goodbye"
+
+    with pytest.raises(AttributeShadowingError):
+
+        class OtherThing(SomeThing):
+            farewell: str = "au revoir"
+
+    del Thing.farewell
+
+    class AnotherThing(SomeThing):
+        farewell: str = "au revoir"
+
+    assert AnotherThing.farewell == "au revoir"
+
+
+def test_shadowproof_plain_base_attribute_assignment():
+    """Test that attributes assigned after creation to plain base classes, which do not
+    use the shadowproof metaclass, are detected."""
+
+    class Base(object):
+        pass
+
+    class Thing(Base, metaclass=shadowproof):
+        pass
+
+    Base.value = 1
+
+    with pytest.raises(AttributeShadowingError):
+
+        class OtherThing(Base, metaclass=shadowproof):
+            value: int = 2
+
+    with pytest.raises(AttributeShadowingError):
+
+        class SomeThing(Thing):
+            value: int = 2
+
+
+def test_shadowproof_wide_hierarchy():
+    """Test that class creation cost does not grow with the size of the hierarchy."""
+
+    import time
+
+    def create(depth: int, width: int) -> float:
+        base = shadowproof("Base", (object,), {f"a{i}": i for i in range(width)})
+
+        for level in range(depth):
+            base = shadowproof(f"Level{level}", (base,), {f"l{level}": level})
+
+        started = time.perf_counter()
+
+        for count in range(200):
+            shadowproof("Leaf", (base,), {f"leaf{i}": i for i in range(width)})
+
+        return time.perf_counter() - started
+
+    # Class creation with hundreds of attributes on a deep hierarchy should be roughly
+    # linear in the number of attributes and should not be quadratic in bases × attrs
+    small = create(depth=2, width=50)
+    large = create(depth=50, width=50)
+
+    assert large < small * 10
@@ -0,0 +1,99 @@
+import pytest
+import sys
+
+from classicist import tracing, hybridmethod, runtimer
+from classicist.logging import Tracing
+
+
+@pytest.fixture(name="messages")
+def test_tracing_fixture(monkeypatch) -> list[str]:
+    """Capture the debug log messages emitted by the hybridmethod and runtimer hot paths,
+    and ensure that tracing is disabled again once each test has completed."""
+
+    messages: list[str] = []
+
+    for module in ("hybridmethod", "runtimer"):
+        monkeypatch.setattr(
+            sys.modules[f"classicist.decorators.{module}"].logger,
+            "debug",
+            lambda message, *args: messages.append(message % args),
+        )
+
+    yield messages
+
+    tracing.disable()
+
+
+def test_tracing_switch():
+    """Test the tracing switch, its validation and the notification of subscribers."""
+
+    switch = Tracing()
+
+    assert switch.enabled is False
+
+    states: list[bool] = []
+
+    assert switch.subscribe(states.append) == states.append
+
+    assert switch.enable() is switch
+    assert switch.enabled is True
+
+    switch.enable()  # Enabling tracing when it is already enabled is a no-op
+
+    switch.disable()
+
+    assert states == [False, True, False]
+
+    with pytest.raises(TypeError):
+        switch.enabled = "yes"
+
+    with pytest.raises(TypeError):
+        switch.subscribe("callback")
+
+    with pytest.raises(TypeError):
+        Tracing(enabled=1)
+
+
+def test_tracing_hot_paths(messages: list[str]):
+    """Test that the hot paths only log while tracing is enabled."""
+
+    class Example(object):
+        @hybridmethod
+        def method(self, value: int) -> int:
+            return value
+
+    @runtimer
+    def function(value: int) -> int:
+        return Example.method(value)
+
+    # Decoration-time logging is unaffected by tracing, as it is not on a hot path
+    assert len(messages) == 2
+
+    messages.clear()
+
+    assert tracing.enabled is False
+
+    assert hybridmethod.__get__ is hybridmethod._get
+
+    assert function(1) == 1
+
+    assert messages == []
+
+    tracing.enable()
+
+    # The descriptor method is regenerated with its logging while tracing is enabled
+    assert hybridmethod.__get__ is hybridmethod._get_traced
+
+    assert function(2) == 2
+
+    assert len(messages) == 2
+    assert messages[0].startswith("runtimer(function: <function")
+    assert messages[1].startswith("hybridmethod.__get__(self: <")
+
+    tracing.disable()
+
+    assert hybridmethod.__get__ is hybridmethod._get
+
+    assert function(3) == 3
+
+    assert len(messages) == 2